@@ -0,0 +1,62 @@
+"""
+Alembic 마이그레이션 환경
+
+커머스 테이블(products, reviews 등)은 ORM 모델 없이 text() 쿼리로 조회하므로
+autogenerate 대상 메타데이터 없이 revision 파일에 스키마를 직접 기술한다.
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+
+from app.core.config import settings
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# ini 보간 문법과 충돌하지 않도록 비밀번호 등의 %를 이스케이프
+config.set_main_option("sqlalchemy.url", settings.DATABASE_URL.replace("%", "%%"))
+
+target_metadata = None
+
+
+def run_migrations_offline() -> None:
+    """DB 연결 없이 SQL 스크립트 출력 (alembic upgrade head --sql)"""
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url"),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """DB에 연결하여 마이그레이션 적용"""
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            # SQLite는 ALTER 제약이 있어 테이블 재생성 방식 사용
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
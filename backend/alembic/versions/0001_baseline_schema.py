@@ -0,0 +1,126 @@
+"""baseline commerce schema
+
+products, reviews, members, orders, categories, product_statistics 테이블.
+scripts/*_mig.py가 생성하는 CSV 컬럼 구성을 따른다. 기존 데이터가 적재된 DB에도
+적용할 수 있도록 이미 있는 테이블은 건너뛴다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 00:00:00
+"""
+from typing import Sequence, Union, Set
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MYSQL_TABLE_ARGS = {"mysql_engine": "InnoDB", "mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"}
+
+
+def _existing_tables() -> Set[str]:
+    """이미 있는 테이블 (오프라인 SQL 출력 모드에서는 모두 생성)"""
+    if context.is_offline_mode():
+        return set()
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _timestamps():
+    return [
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.text("CURRENT_TIMESTAMP")),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.text("CURRENT_TIMESTAMP")),
+    ]
+
+
+def upgrade() -> None:
+    existing = _existing_tables()
+
+    if "categories" not in existing:
+        op.create_table(
+            "categories",
+            sa.Column("category_id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("category_name", sa.String(200), nullable=False),
+            sa.Column("category_code", sa.String(50), nullable=True),
+            sa.Column("parent_category_id", sa.Integer(), sa.ForeignKey("categories.category_id"), nullable=True),
+            sa.Column("depth", sa.SmallInteger(), nullable=False, server_default="0"),
+            *_timestamps(),
+            **MYSQL_TABLE_ARGS,
+        )
+
+    if "products" not in existing:
+        op.create_table(
+            "products",
+            sa.Column("product_no", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("product_id", sa.String(50), nullable=True, unique=True),
+            sa.Column("product_name", sa.String(500), nullable=False),
+            sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.category_id"), nullable=True),
+            sa.Column("brand", sa.String(100), nullable=True),
+            sa.Column("price", sa.Numeric(12, 2), nullable=True),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.Column("image_url", sa.String(1000), nullable=True),
+            sa.Column("rating", sa.Numeric(3, 2), nullable=True),
+            sa.Column("review_count", sa.Integer(), nullable=False, server_default="0"),
+            *_timestamps(),
+            **MYSQL_TABLE_ARGS,
+        )
+
+    if "members" not in existing:
+        op.create_table(
+            "members",
+            sa.Column("member_no", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("member_id", sa.String(255), nullable=False, unique=True),
+            sa.Column("name", sa.String(100), nullable=True),
+            sa.Column("email", sa.String(255), nullable=True),
+            *_timestamps(),
+            **MYSQL_TABLE_ARGS,
+        )
+
+    if "reviews" not in existing:
+        op.create_table(
+            "reviews",
+            sa.Column("review_id", sa.BigInteger().with_variant(sa.Integer(), "sqlite"), primary_key=True, autoincrement=True),
+            sa.Column("product_no", sa.Integer(), sa.ForeignKey("products.product_no"), nullable=False),
+            sa.Column("member_no", sa.Integer(), sa.ForeignKey("members.member_no"), nullable=True),
+            sa.Column("rating", sa.SmallInteger(), nullable=True),
+            sa.Column("review_text", sa.Text(), nullable=True),
+            sa.Column("review_date", sa.Date(), nullable=True),
+            sa.Column("helpful_count", sa.Integer(), nullable=False, server_default="0"),
+            *_timestamps(),
+            **MYSQL_TABLE_ARGS,
+        )
+
+    if "orders" not in existing:
+        op.create_table(
+            "orders",
+            sa.Column("order_id", sa.BigInteger().with_variant(sa.Integer(), "sqlite"), primary_key=True, autoincrement=True),
+            sa.Column("member_no", sa.Integer(), sa.ForeignKey("members.member_no"), nullable=False),
+            sa.Column("product_no", sa.Integer(), sa.ForeignKey("products.product_no"), nullable=False),
+            sa.Column("order_date", sa.Date(), nullable=True),
+            sa.Column("total_amount", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("order_status", sa.String(20), nullable=False, server_default="delivered"),
+            *_timestamps(),
+            **MYSQL_TABLE_ARGS,
+        )
+
+    if "product_statistics" not in existing:
+        op.create_table(
+            "product_statistics",
+            sa.Column("product_no", sa.Integer(), sa.ForeignKey("products.product_no"), primary_key=True, autoincrement=False),
+            sa.Column("total_reviews", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("average_rating", sa.Numeric(3, 2), nullable=True),
+            sa.Column("rating_distribution", sa.JSON(), nullable=True),
+            sa.Column("last_review_date", sa.Date(), nullable=True),
+            sa.Column("review_velocity", sa.Numeric(10, 4), nullable=True),
+            *_timestamps(),
+            **MYSQL_TABLE_ARGS,
+        )
+
+
+def downgrade() -> None:
+    for table in ("product_statistics", "orders", "reviews", "members", "products", "categories"):
+        op.drop_table(table)
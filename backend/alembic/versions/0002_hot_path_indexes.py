@@ -0,0 +1,53 @@
+"""hot path covering indexes
+
+요청 경로 쿼리별 인덱스 (scripts/check_query_plans.py가 EXPLAIN으로 확인):
+- 상품 리뷰 목록/커서/리뷰 수: reviews (product_no, created_at, review_id)
+  WHERE product_no = ? ORDER BY created_at DESC, review_id DESC를 정렬 없이 인덱스 순서로 읽는다.
+- /categories: categories (depth, category_name, ...) 조회 컬럼 전체를 포함하여 테이블 접근 없이 정렬된 순서로 읽는다.
+- 회원 일괄 조회(member_no IN), 리뷰 수(product_statistics): 기본 키(클러스터드 인덱스)로 충분하다.
+- 상품/주문: 카테고리, 브랜드, 회원별 주문 이력 조회.
+이미 같은 이름의 인덱스가 있으면 건너뛴다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:00
+"""
+from typing import Sequence, Union, List
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_reviews_product_created", "reviews", ["product_no", "created_at", "review_id"]),
+    ("ix_categories_depth_name", "categories",
+     ["depth", "category_name", "category_code", "parent_category_id", "created_at", "updated_at"]),
+    ("ix_products_category", "products", ["category_id"]),
+    ("ix_products_brand", "products", ["brand"]),
+    ("ix_orders_member_date", "orders", ["member_no", "order_date"]),
+    ("ix_orders_product", "orders", ["product_no"]),
+]
+
+
+def _existing_indexes(table: str) -> List[str]:
+    if context.is_offline_mode():
+        return []
+    return [index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table)]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        if name not in _existing_indexes(table):
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        if name in _existing_indexes(table):
+            op.drop_index(name, table_name=table)
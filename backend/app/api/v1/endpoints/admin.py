@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from typing import Dict, Any
+
+from app.core.auth import get_current_admin_user
+from app.core.redis_client import get_redis_client
+from app.core.embedding_cache import get_embedding_cache
+from app.models.user import User
+from app.services.cache_warmer import get_cache_warmer
+
+router = APIRouter()
+
+
+@router.get("/cache/stats", response_model=Dict[str, Any])
+async def get_cache_stats(
+    current_user: User = Depends(get_current_admin_user),
+    redis_client = Depends(get_redis_client)
+):
+    """키 패밀리별 캐시 적중률, stale 응답, 인코딩/디코딩 시간, 값 크기 (TTL 조정용)"""
+    embedding_cache = get_embedding_cache()
+    return {
+        "redis": redis_client.local_cache_stats(),
+        "embedding": embedding_cache.snapshot() if embedding_cache else None,
+        "warm": get_cache_warmer().report(),
+    }
+
+
+@router.get("/cache/metrics", response_class=PlainTextResponse)
+async def get_cache_metrics(
+    current_user: User = Depends(get_current_admin_user),
+    redis_client = Depends(get_redis_client)
+):
+    """키 패밀리별 캐시 계측 (Prometheus 텍스트 노출 형식)"""
+    return PlainTextResponse(
+        redis_client.cache_metrics(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -3,12 +3,12 @@ LangChain RAG API 엔드포인트
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Any, Optional
 from pydantic import BaseModel
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.core.redis_client import get_redis_client
-from app.core.opensearch_client import get_opensearch_client
+from app.core.opensearch_client import get_async_opensearch_client
 from app.services.langchain_service import LangChainRAGService, LangChainAgentService
 from loguru import logger
 
@@ -31,9 +31,9 @@ class AgentRequest(BaseModel):
 @router.post("/ask", response_model=Dict[str, Any])
 async def ask_product_question(
     request: ProductQuestionRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     redis_client = Depends(get_redis_client),
-    opensearch_client = Depends(get_opensearch_client)
+    opensearch_client = Depends(get_async_opensearch_client)
 ):
     """상품에 대한 질문-답변 (RAG 기반)
     
@@ -60,9 +60,9 @@ async def ask_product_question(
 @router.get("/summary/{product_id}", response_model=Dict[str, Any])
 async def get_product_summary(
     product_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     redis_client = Depends(get_redis_client),
-    opensearch_client = Depends(get_opensearch_client)
+    opensearch_client = Depends(get_async_opensearch_client)
 ):
     """상품 리뷰 기반 AI 요약 생성
     
@@ -87,9 +87,9 @@ async def get_product_summary(
 @router.post("/recommend-by-conversation", response_model=Dict[str, Any])
 async def recommend_by_conversation(
     request: ConversationRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     redis_client = Depends(get_redis_client),
-    opensearch_client = Depends(get_opensearch_client)
+    opensearch_client = Depends(get_async_opensearch_client)
 ):
     """대화 기반 상품 추천
     
@@ -116,9 +116,9 @@ async def recommend_by_conversation(
 @router.post("/smart-search", response_model=Dict[str, Any])
 async def smart_search_agent(
     request: AgentRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     redis_client = Depends(get_redis_client),
-    opensearch_client = Depends(get_opensearch_client)
+    opensearch_client = Depends(get_async_opensearch_client)
 ):
     """지능형 검색 에이전트
     
@@ -189,9 +189,9 @@ async def get_rag_capabilities():
 async def batch_product_analysis(
     product_ids: list[str] = Body(..., description="분석할 상품 ID 목록"),
     analysis_type: str = Query("summary", description="분석 유형: summary, comparison"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     redis_client = Depends(get_redis_client),
-    opensearch_client = Depends(get_opensearch_client)
+    opensearch_client = Depends(get_async_opensearch_client)
 ):
     """여러 상품 일괄 분석"""
     try:
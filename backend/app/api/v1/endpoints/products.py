@@ -1,15 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Body, Header
 from sqlalchemy.orm import Session
-from sqlalchemy import text
 from typing import List, Optional
 from app.core.database import get_db
-from app.core.redis_client import get_redis_client
-from app.core.opensearch_client import get_opensearch_client
+from app.core.redis_client import get_redis_client, cache_tags
+from app.core.opensearch_client import get_async_opensearch_client
+from app.core.health import opensearch_breaker
+from app.core.config import settings
+from app.core.query_cache import (
+    cache_bypass_requested, normalize_text, normalize_keyword, normalize_tags, round_price
+)
 from app.schemas.product import (
     Product, ProductCreate, ProductUpdate, ProductList, 
     ProductSearch, ProductStats, Category, CategoryList
 )
-from app.services.product_service import ProductService
+from app.services.product_service import ProductService, product_list_tags
 from loguru import logger
 
 router = APIRouter()
@@ -26,7 +30,7 @@ async def get_products(
     sort_order: str = Query("desc", description="정렬 순서"),
     db: Session = Depends(get_db),
     redis_client = Depends(get_redis_client),
-    opensearch_client = Depends(get_opensearch_client)
+    opensearch_client = Depends(get_async_opensearch_client)
 ):
     """상품 목록 조회"""
     try:
@@ -35,32 +39,46 @@ async def get_products(
         # 캐시 키 생성
         cache_key = f"products:page:{page}:size:{size}:category:{category}:brand:{brand}:min_price:{min_price}:max_price:{max_price}:sort_by:{sort_by}:sort_order:{sort_order}"
         
-        # 캐시에서 조회
-        cached_result = redis_client.get(cache_key)
-        if cached_result:
-            return cached_result
-        
-        # 상품 목록 조회
-        result = await product_service.get_products(
-            page=page,
-            size=size,
-            category=category,
-            brand=brand,
-            min_price=min_price,
-            max_price=max_price,
-            sort_by=sort_by,
-            sort_order=sort_order
+        # 상품 목록 조회 (5분 캐시, 필터와 결과 상품 태그로 변경 시 무효화)
+        # 조회 실패 시 서비스가 빈 목록을 반환하므로 빈 결과는 캐시하지 않음
+        result = await redis_client.get_or_compute(
+            cache_key,
+            lambda: product_service.get_products(
+                page=page,
+                size=size,
+                category=category,
+                brand=brand,
+                min_price=min_price,
+                max_price=max_price,
+                sort_by=sort_by,
+                sort_order=sort_order
+            ),
+            ttl=300,
+            model=ProductList,
+            cacheable=lambda r: bool(r.items),
+            tags=lambda r: product_list_tags(r, brand=brand, category=category),
         )
         
-        # 캐시에 저장 (5분)
-        redis_client.set(cache_key, result, ex=300)
-        
         return result
         
     except Exception as e:
         logger.error(f"Failed to get products: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+def _normalize_search(search_params: ProductSearch) -> ProductSearch:
+    """검색 조건 정규화 (캐시 키와 실제 검색 쿼리에 같은 값을 사용)"""
+    return search_params.model_copy(update={
+        "query": normalize_text(search_params.query),
+        "category": normalize_keyword(search_params.category),
+        "brand": normalize_keyword(search_params.brand),
+        "min_price": round_price(search_params.min_price),
+        "max_price": round_price(search_params.max_price),
+        "min_rating": round(search_params.min_rating, 1) if search_params.min_rating is not None else None,
+        "tags": normalize_tags(search_params.tags),
+        "sort_by": (search_params.sort_by or "created_at").strip().lower(),
+        "sort_order": (search_params.sort_order or "desc").strip().lower(),
+    })
+
 @router.get("/search", response_model=ProductList)
 async def search_products_get(
     query: Optional[str] = Query(None, description="검색어"),
@@ -75,9 +93,13 @@ async def search_products_get(
     sort_order: str = Query("desc", description="정렬 순서"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="커서 (이전 응답의 next_cursor, 지정 시 page 무시)"),
+    use_cursor: bool = Query(False, description="커서 기반 페이지네이션 시작 (무한 스크롤)"),
+    deadline_ms: Optional[int] = Header(None, alias="X-Request-Deadline-Ms", ge=1, description="검색 deadline (밀리초)"),
+    bypass_cache: bool = Depends(cache_bypass_requested),
     db: Session = Depends(get_db),
     redis_client = Depends(get_redis_client),
-    opensearch_client = Depends(get_opensearch_client)
+    opensearch_client = Depends(get_async_opensearch_client)
 ):
     """상품 검색 (GET 방식)"""
     try:
@@ -97,64 +119,30 @@ async def search_products_get(
             sort_order=sort_order
         )
         
-        # 검색 실행
-        result = await product_service.search_products(search_params, page, size)
+        # 검색 실행 (커서 모드는 PIT + search_after, 페이지 모드는 정규화된 조건으로 결과 캐시)
+        search_params = _normalize_search(search_params)
+        if cursor or use_cursor:
+            result = await product_service.search_products_cursor(search_params, size, cursor, deadline_ms)
+        else:
+            result = await product_service.search_products_cached(
+                search_params, page, size, deadline_ms, bypass=bypass_cache
+            )
         
         return result
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to search products: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get("/categories", response_model=CategoryList)
 async def get_categories(
-    db: Session = Depends(get_db),
     redis_client = Depends(get_redis_client)
 ):
     """카테고리 목록 조회"""
     try:
-        # 캐시 키 생성
-        cache_key = "categories:list"
-        
-        # 캐시에서 조회
-        cached_result = redis_client.get(cache_key)
-        if cached_result:
-            return cached_result
-        
-        # 데이터베이스에서 카테고리 조회
-        query = text("""
-            SELECT 
-                category_id,
-                category_name,
-                category_code,
-                parent_category_id,
-                depth,
-                created_at,
-                updated_at
-            FROM categories 
-            ORDER BY depth, category_name
-        """)
-        
-        result = db.execute(query)
-        categories = []
-        
-        for row in result:
-            categories.append(Category(
-                category_id=row.category_id,
-                category_name=row.category_name,
-                category_code=row.category_code,
-                parent_category_id=row.parent_category_id,
-                depth=row.depth,
-                created_at=row.created_at,
-                updated_at=row.updated_at
-            ))
-        
-        response = CategoryList(items=categories, total=len(categories))
-        
-        # 캐시에 저장 (10분)
-        redis_client.set(cache_key, response, ex=600)
-        
-        return response
+        return await ProductService(None, redis_client).get_categories()
         
     except Exception as e:
         logger.error(f"Failed to get categories: {e}")
@@ -165,29 +153,34 @@ async def get_product(
     product_no: str,
     db: Session = Depends(get_db),
     redis_client = Depends(get_redis_client),
-    opensearch_client = Depends(get_opensearch_client)
+    opensearch_client = Depends(get_async_opensearch_client)
 ):
     """상품 상세 조회"""
     try:
         product_service = ProductService(db, redis_client, opensearch_client)
         
-        # 캐시에서 조회
-        cache_key = f"product:{product_no}"
-        cached_product = redis_client.get(cache_key)
-        if cached_product:
-            return cached_product
-        
-        # 상품 조회
-        product = await product_service.get_product_by_id(product_no)
+        # 캐시 조회, 없으면 한 워커만 OpenSearch에서 조회 (만료 후 5분까지는 이전 값 응답)
+        # 상품 변경 시 태그로 무효화되므로 TTL은 길게 유지
+        product = await redis_client.get_or_compute(
+            f"product:{product_no}",
+            lambda: product_service.get_product_by_id(product_no),
+            ttl=settings.CACHE_TAGGED_TTL,
+            stale_ttl=300,
+            tags=lambda p: cache_tags(product_no=product_no, brand=p.brand, category=p.category),
+        )
         if not product:
+            # 캐시에도 없고 OpenSearch 서킷이 열려 있으면 404 대신 일시 장애로 응답
+            if opensearch_breaker.is_open:
+                raise HTTPException(
+                    status_code=503,
+                    detail="Search service temporarily unavailable",
+                    headers={"Retry-After": str(int(opensearch_breaker.recovery_timeout))},
+                )
             raise HTTPException(status_code=404, detail="Product not found")
         
         # 조회수 증가
         await product_service.increment_view_count(product_no)
         
-        # 캐시에 저장 (10분)
-        redis_client.set(cache_key, product, ex=600)
-        
         return product
         
     except HTTPException:
@@ -201,19 +194,31 @@ async def search_products(
     search_params: ProductSearch,
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="커서 (이전 응답의 next_cursor, 지정 시 page 무시)"),
+    use_cursor: bool = Query(False, description="커서 기반 페이지네이션 시작 (무한 스크롤)"),
+    deadline_ms: Optional[int] = Header(None, alias="X-Request-Deadline-Ms", ge=1, description="검색 deadline (밀리초)"),
+    bypass_cache: bool = Depends(cache_bypass_requested),
     db: Session = Depends(get_db),
     redis_client = Depends(get_redis_client),
-    opensearch_client = Depends(get_opensearch_client)
+    opensearch_client = Depends(get_async_opensearch_client)
 ):
     """상품 검색"""
     try:
         product_service = ProductService(db, redis_client, opensearch_client)
         
-        # 검색 실행
-        result = await product_service.search_products(search_params, page, size)
+        # 검색 실행 (커서 모드는 PIT + search_after, 페이지 모드는 정규화된 조건으로 결과 캐시)
+        search_params = _normalize_search(search_params)
+        if cursor or use_cursor:
+            result = await product_service.search_products_cursor(search_params, size, cursor, deadline_ms)
+        else:
+            result = await product_service.search_products_cached(
+                search_params, page, size, deadline_ms, bypass=bypass_cache
+            )
         
         return result
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to search products: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -224,7 +229,7 @@ async def get_similar_products(
     size: int = Query(10, ge=1, le=50, description="추천 상품 수"),
     db: Session = Depends(get_db),
     redis_client = Depends(get_redis_client),
-    opensearch_client = Depends(get_opensearch_client)
+    opensearch_client = Depends(get_async_opensearch_client)
 ):
     """특정 상품과 유사한 상품 추천 (콘텐츠 기반 필터링)"""
     try:
@@ -245,7 +250,7 @@ async def recommend_by_content(
     size: int = Query(10, ge=1, le=50, description="추천 상품 수"),
     db: Session = Depends(get_db),
     redis_client = Depends(get_redis_client),
-    opensearch_client = Depends(get_opensearch_client)
+    opensearch_client = Depends(get_async_opensearch_client)
 ):
     """텍스트 설명 기반 상품 추천 (콘텐츠 기반 필터링)"""
     try:
@@ -271,7 +276,7 @@ async def recommend_by_advanced_content(
     }),
     db: Session = Depends(get_db),
     redis_client = Depends(get_redis_client),
-    opensearch_client = Depends(get_opensearch_client)
+    opensearch_client = Depends(get_async_opensearch_client)
 ):
     """고급 콘텐츠 기반 상품 추천"""
     try:
@@ -2,13 +2,14 @@
 리뷰 하이브리드 검색 API 엔드포인트
 """
 
-import json
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
-from sqlalchemy.orm import Session
-from typing import Dict, Any
-from app.core.database import get_db
-from app.core.redis_client import get_redis_client
-from app.core.opensearch_client import get_opensearch_client
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Any, Optional
+from app.core.database import get_read_db, get_replica_router
+from app.core.redis_client import get_redis_client, cache_tags
+from app.core.opensearch_client import get_async_opensearch_client
+from app.core.config import settings
+from app.core.query_cache import cache_bypass_requested
 from app.services.review_service import ReviewHybridSearchService
 from app.schemas.product import ProductList
 from app.schemas.review import ReviewList, ReviewSearchParams
@@ -21,41 +22,51 @@ router = APIRouter()
 async def get_product_reviews(
     product_no: str,
     page: int = Query(1, ge=1, description="페이지 번호"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="커서 (이전 응답의 next_cursor, 지정 시 page 무시)"),
+    use_cursor: bool = Query(False, description="커서 기반 페이지네이션 시작 (무한 스크롤)"),
     redis_client = Depends(get_redis_client),
-    opensearch_client = Depends(get_opensearch_client)
+    opensearch_client = Depends(get_async_opensearch_client)
 ):
     """특정 상품의 리뷰 목록 조회 (생성일 내림차순)"""
     try:
-        review_service = ReviewHybridSearchService(db, redis_client, opensearch_client)
-        
-        # 캐시 키 생성
-        cache_key = f"reviews:product:{product_no}:page:{page}"
-        
-        # 캐시에서 조회
-        cached_result = redis_client.get(cache_key)
-        if cached_result:
-            try:
-                cached_data = json.loads(cached_result)
-                return ReviewList(**cached_data)
-            except Exception as e:
-                logger.warning(f"Failed to parse cached result: {e}")
-        
-        # 리뷰 조회 (size는 20으로 고정)
-        result = await review_service.get_product_reviews(
-            product_no=product_no,
-            page=page,
-            size=20
+        # 캐시 키 생성 (커서는 마지막 리뷰 위치를 담고 있어 같은 커서면 같은 결과)
+        if cursor or use_cursor:
+            cache_key = f"reviews:product:{product_no}:cursor:{cursor or 'first'}"
+        else:
+            cache_key = f"reviews:product:{product_no}:page:{page}"
+        
+        # 리뷰 조회 (size는 20으로 고정, 커서 모드는 페이지 깊이와 무관하게 비용이 같음)
+        # 캐시 갱신은 응답 후 백그라운드에서도 실행되므로 요청 세션 대신 자체 읽기 세션을 연다
+        async def load():
+            async with get_replica_router().read_session() as db:
+                review_service = ReviewHybridSearchService(db, redis_client, opensearch_client)
+                if cursor or use_cursor:
+                    return await review_service.get_product_reviews_cursor(
+                        product_no=product_no,
+                        size=20,
+                        cursor=cursor
+                    )
+                return await review_service.get_product_reviews(
+                    product_no=product_no,
+                    page=page,
+                    size=20
+                )
+        
+        # 캐시를 거쳐 조회 (상품 태그로 리뷰 변경 시 무효화)
+        # 조회 실패 시 서비스가 빈 목록을 반환하므로 빈 결과는 캐시하지 않음
+        result = await redis_client.get_or_compute(
+            cache_key,
+            load,
+            ttl=settings.CACHE_TAGGED_TTL,
+            model=ReviewList,
+            cacheable=lambda r: bool(r.items),
+            tags=cache_tags(product_no=product_no),
         )
         
-        # 캐시에 저장 (5분) - JSON으로 직렬화
-        try:
-            redis_client.set(cache_key, json.dumps(result.dict()), ex=300)
-        except Exception as e:
-            logger.warning(f"Failed to cache result: {e}")
-        
         return result
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to get reviews for product {product_no}: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -67,20 +78,22 @@ async def search_reviews_hybrid(
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
     hybrid_weight: float = Query(0.5, ge=0.0, le=1.0, description="임베딩 가중치 (0=키워드만, 1=임베딩만)"),
-    db: Session = Depends(get_db),
+    bypass_cache: bool = Depends(cache_bypass_requested),
+    db: AsyncSession = Depends(get_read_db),
     redis_client = Depends(get_redis_client),
-    opensearch_client = Depends(get_opensearch_client)
+    opensearch_client = Depends(get_async_opensearch_client)
 ):
     """하이브리드 리뷰 검색 (키워드 + Vertex AI 임베딩)"""
     try:
         review_service = ReviewHybridSearchService(db, redis_client, opensearch_client)
         
-        # 하이브리드 검색 실행
-        result = await review_service.search_reviews_hybrid(
+        # 하이브리드 검색 실행 (정규화된 검색어/가중치 기준 결과 캐시)
+        result = await review_service.search_reviews_hybrid_cached(
             query=query,
             page=page,
             size=size,
-            hybrid_weight=hybrid_weight
+            hybrid_weight=hybrid_weight,
+            bypass=bypass_cache
         )
         
         return result
@@ -97,9 +110,9 @@ async def search_products_by_reviews(
     size: int = Query(10, ge=1, le=50, description="페이지 크기"),
     min_rating: float = Query(3.0, ge=1.0, le=5.0, description="최소 평점"),
     hybrid_weight: float = Query(0.6, ge=0.0, le=1.0, description="임베딩 가중치"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     redis_client = Depends(get_redis_client),
-    opensearch_client = Depends(get_opensearch_client)
+    opensearch_client = Depends(get_async_opensearch_client)
 ):
     """리뷰 기반 상품 추천 (하이브리드 검색)"""
     try:
@@ -124,9 +137,9 @@ async def search_products_by_reviews(
 async def analyze_review_sentiment(
     query: str = Body(..., description="감정 분석할 리뷰 내용"),
     sentiment_threshold: float = Query(0.5, ge=0.0, le=1.0, description="감정 임계값"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     redis_client = Depends(get_redis_client),
-    opensearch_client = Depends(get_opensearch_client)
+    opensearch_client = Depends(get_async_opensearch_client)
 ):
     """리뷰 감정 분석 기반 검색"""
     try:
@@ -149,9 +162,9 @@ async def analyze_review_sentiment(
 
 @router.get("/stats", response_model=Dict[str, Any])
 async def get_review_stats(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     redis_client = Depends(get_redis_client),
-    opensearch_client = Depends(get_opensearch_client)
+    opensearch_client = Depends(get_async_opensearch_client)
 ):
     """리뷰 통계 정보"""
     try:
@@ -178,9 +191,9 @@ async def get_review_stats(
 @router.get("/products/{product_no}/reviews/summary", response_model=Dict[str, Any])
 async def get_product_reviews_summary(
     product_no: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     redis_client = Depends(get_redis_client),
-    opensearch_client = Depends(get_opensearch_client)
+    opensearch_client = Depends(get_async_opensearch_client)
 ):
     """특정 상품의 리뷰 요약 정보 조회"""
     try:
@@ -190,21 +203,15 @@ async def get_product_reviews_summary(
         cache_key = f"reviews:summary:product:{product_no}"
         
         # 캐시에서 조회
-        cached_result = redis_client.get(cache_key)
+        cached_result = await redis_client.get(cache_key)
         if cached_result:
-            try:
-                return json.loads(cached_result)
-            except Exception as e:
-                logger.warning(f"Failed to parse cached summary: {e}")
+            return cached_result
         
         # 리뷰 요약 조회
         summary = await review_service.get_product_reviews_summary(product_no)
         
-        # 캐시에 저장 (10분)
-        try:
-            redis_client.set(cache_key, json.dumps(summary), ex=600)
-        except Exception as e:
-            logger.warning(f"Failed to cache summary: {e}")
+        # 캐시에 저장 (상품 태그로 리뷰 변경 시 무효화)
+        await redis_client.set(cache_key, summary, ex=settings.CACHE_TAGGED_TTL, tags=cache_tags(product_no=product_no))
         
         return summary
         
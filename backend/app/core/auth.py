@@ -86,6 +86,16 @@ async def get_current_user(
         raise credentials_exception
     return user
 
+async def get_current_admin_user(current_user: User = Depends(get_current_user)) -> User:
+    """현재 사용자가 관리자(ADMIN_EMAILS)인지 확인"""
+    admin_emails = {email.strip().lower() for email in settings.ADMIN_EMAILS.split(",") if email.strip()}
+    if (current_user.email or "").lower() not in admin_emails:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required",
+        )
+    return current_user
+
 def create_user(db: Session, email: str, password: str, full_name: str = None) -> User:
     """새 사용자 생성"""
     # 이미 존재하는 사용자인지 확인
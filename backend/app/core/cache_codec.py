@@ -0,0 +1,155 @@
+import json
+import zlib
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Optional, Type, TypeVar, Union
+
+import msgpack
+import orjson
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+try:
+    import zstandard
+except ImportError:  # zstd는 선택 의존성: 없으면 zlib으로 압축
+    zstandard = None
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# 헤더 첫 바이트 (UTF-8 텍스트에는 나타나지 않는 값이라 기존 JSON 문자열 값과 구분됨)
+MAGIC = 0xFF
+
+# 헤더 두 번째 바이트: 상위 4비트 직렬화 형식, 하위 4비트 압축 방식
+FORMAT_MSGPACK = 0x10
+FORMAT_ORJSON = 0x20
+COMPRESSION_NONE = 0x00
+COMPRESSION_ZLIB = 0x01
+COMPRESSION_ZSTD = 0x02
+
+
+def _default(value: Any) -> Any:
+    """msgpack/orjson이 직접 처리하지 못하는 값 변환"""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+class CacheCodec:
+    """캐시 값 바이너리 코덱
+
+    pydantic 모델과 dict/list를 msgpack(기본) 또는 orjson으로 직렬화하고,
+    compress_min_bytes 이상이면 zstd(미설치 시 zlib)로 압축한다.
+    2바이트 헤더에 형식과 압축 방식을 기록하므로 설정을 바꿔도 기존 값을 읽을 수 있고,
+    헤더가 없는 값은 이전 JSON 문자열 형식으로 해석한다.
+    모델 타입은 저장하지 않으며 decode(data, model=...)로 지정하면 검증된 모델로 복원한다.
+    """
+
+    def __init__(
+        self,
+        fmt: str = "msgpack",
+        compression: str = "zstd",
+        compress_min_bytes: int = 1024,
+        compression_level: int = 3,
+    ):
+        if fmt not in ("msgpack", "orjson"):
+            raise ValueError(f"Unknown cache codec format: {fmt}")
+        if compression not in ("zstd", "zlib", "none"):
+            raise ValueError(f"Unknown cache compression: {compression}")
+
+        self.format_flag = FORMAT_MSGPACK if fmt == "msgpack" else FORMAT_ORJSON
+        if compression == "zstd" and zstandard is None:
+            compression = "zlib"
+        self.compression = compression
+        self.compress_min_bytes = compress_min_bytes
+        self.compression_level = compression_level
+
+        if compression == "zstd":
+            self._zstd_compressor = zstandard.ZstdCompressor(level=compression_level)
+        self._zstd_decompressor = zstandard.ZstdDecompressor() if zstandard is not None else None
+
+    def encode(self, value: Any) -> bytes:
+        """값을 헤더 + (압축된) 페이로드 바이트로 직렬화"""
+        if isinstance(value, BaseModel):
+            value = value.model_dump(mode="json")
+
+        if self.format_flag == FORMAT_MSGPACK:
+            payload = msgpack.packb(value, default=_default, use_bin_type=True)
+        else:
+            payload = orjson.dumps(value, default=_default)
+
+        compression = COMPRESSION_NONE
+        if self.compression != "none" and len(payload) >= self.compress_min_bytes:
+            if self.compression == "zstd":
+                payload = self._zstd_compressor.compress(payload)
+                compression = COMPRESSION_ZSTD
+            else:
+                payload = zlib.compress(payload, self.compression_level)
+                compression = COMPRESSION_ZLIB
+
+        return bytes((MAGIC, self.format_flag | compression)) + payload
+
+    def decode(self, data: Optional[Union[bytes, str]], model: Optional[Type[ModelT]] = None) -> Any:
+        """바이트를 값으로 복원 (model 지정 시 해당 pydantic 모델로 검증)"""
+        if data is None:
+            return None
+
+        if isinstance(data, bytes) and data[:1] == bytes((MAGIC,)):
+            flags = data[1]
+            payload = data[2:]
+
+            compression = flags & 0x0F
+            if compression == COMPRESSION_ZSTD:
+                if self._zstd_decompressor is None:
+                    raise ValueError("zstd-compressed cache value but zstandard is not installed")
+                payload = self._zstd_decompressor.decompress(payload)
+            elif compression == COMPRESSION_ZLIB:
+                payload = zlib.decompress(payload)
+
+            if flags & 0xF0 == FORMAT_MSGPACK:
+                value = msgpack.unpackb(payload, raw=False)
+            else:
+                value = orjson.loads(payload)
+        else:
+            value = self._decode_legacy(data)
+
+        if model is not None and isinstance(value, dict):
+            return model.model_validate(value)
+        return value
+
+    @staticmethod
+    def _decode_legacy(data: Union[bytes, str]) -> Any:
+        """헤더 없는 이전 형식 값 (JSON 문자열 또는 일반 문자열)"""
+        text = data.decode("utf-8") if isinstance(data, bytes) else data
+        try:
+            value = json.loads(text)
+        except ValueError:
+            return text
+        # 이전 라우트가 json.dumps 결과를 한 번 더 인코딩해 저장한 값
+        if isinstance(value, str):
+            try:
+                return json.loads(value)
+            except ValueError:
+                pass
+        return value
+
+
+# 전역 코덱 인스턴스
+cache_codec = CacheCodec(
+    fmt=settings.CACHE_CODEC,
+    compression=settings.CACHE_COMPRESSION,
+    compress_min_bytes=settings.CACHE_COMPRESS_MIN_BYTES,
+    compression_level=settings.CACHE_COMPRESSION_LEVEL,
+)
+
+
+def get_cache_codec() -> CacheCodec:
+    """캐시 코덱 인스턴스 반환"""
+    return cache_codec
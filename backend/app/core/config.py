@@ -32,6 +32,38 @@ class Settings(BaseSettings):
             # 운영 환경에서는 MySQL 사용
             return f"mysql+pymysql://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{self.MYSQL_SERVER}:{self.MYSQL_PORT}/{self.MYSQL_DB}"
     
+    # 비동기 MySQL 드라이버 (asyncmy 또는 aiomysql)
+    MYSQL_ASYNC_DRIVER: str = os.getenv("MYSQL_ASYNC_DRIVER", "asyncmy")
+    
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        if self.ENVIRONMENT == "development":
+            # 개발 환경에서는 aiosqlite 사용
+            return "sqlite+aiosqlite:///./commerce_recommendation.db"
+        else:
+            return f"mysql+{self.MYSQL_ASYNC_DRIVER}://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{self.MYSQL_SERVER}:{self.MYSQL_PORT}/{self.MYSQL_DB}"
+    
+    # 읽기 전용 복제본 (host 또는 host:port 콤마 구분, 비어 있으면 모든 조회를 primary로)
+    MYSQL_REPLICA_HOSTS: str = os.getenv("MYSQL_REPLICA_HOSTS", "")
+    DB_REPLICA_MAX_LAG_SECONDS: float = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "5"))  # 이보다 뒤처진 복제본은 제외
+    DB_REPLICA_LAG_CHECK_INTERVAL: float = float(os.getenv("DB_REPLICA_LAG_CHECK_INTERVAL", "10"))  # 복제 지연 확인 주기 (초)
+    
+    # SQL 로그/요청별 프로파일러
+    DB_ECHO: bool = os.getenv("DB_ECHO", "false").lower() == "true"  # 모든 SQL 문 로그 출력 (디버깅용)
+    SQL_PROFILER_ENABLED: bool = os.getenv("SQL_PROFILER_ENABLED", "true").lower() == "true"  # 요청별 쿼리 수/DB 시간, Server-Timing
+    SQL_N_PLUS_ONE_THRESHOLD: int = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "10"))  # 한 요청에서 같은 형태 쿼리 반복 경고 기준
+    SQL_SLOW_REQUEST_MS: float = float(os.getenv("SQL_SLOW_REQUEST_MS", "200"))  # 요청당 총 DB 시간 경고 기준
+    
+    @property
+    def ASYNC_REPLICA_DATABASE_URLS(self) -> List[str]:
+        if self.ENVIRONMENT == "development":
+            return []
+        urls = []
+        for host in filter(None, (h.strip() for h in self.MYSQL_REPLICA_HOSTS.split(","))):
+            server, _, port = host.partition(":")
+            urls.append(f"mysql+{self.MYSQL_ASYNC_DRIVER}://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{server}:{port or self.MYSQL_PORT}/{self.MYSQL_DB}")
+        return urls
+    
     # OpenSearch 설정
     OPENSEARCH_HOST: str = os.getenv("OPENSEARCH_HOST", "localhost")
     OPENSEARCH_PORT: int = int(os.getenv("OPENSEARCH_PORT", "9200"))
@@ -39,17 +71,72 @@ class Settings(BaseSettings):
     OPENSEARCH_PASSWORD: str = os.getenv("OPENSEARCH_PASSWORD", "admin")
     OPENSEARCH_USE_SSL: bool = os.getenv("OPENSEARCH_USE_SSL", "false").lower() == "true"
     OPENSEARCH_VERIFY_CERTS: bool = os.getenv("OPENSEARCH_VERIFY_CERTS", "false").lower() == "true"
+    OPENSEARCH_TIMEOUT: int = int(os.getenv("OPENSEARCH_TIMEOUT", "30"))
+    OPENSEARCH_MAX_RETRIES: int = int(os.getenv("OPENSEARCH_MAX_RETRIES", "3"))
+    OPENSEARCH_POOL_MAXSIZE: int = int(os.getenv("OPENSEARCH_POOL_MAXSIZE", "20"))  # 비동기 클라이언트 커넥션 풀 크기
+    OPENSEARCH_TRACK_TOTAL_HITS: int = int(os.getenv("OPENSEARCH_TRACK_TOTAL_HITS", "10000"))  # 전체 건수 정확 계산 상한
+    OPENSEARCH_MSEARCH_ENABLED: bool = os.getenv("OPENSEARCH_MSEARCH_ENABLED", "true").lower() == "true"  # 동시 검색 _msearch 병합
+    OPENSEARCH_MSEARCH_WINDOW_MS: float = float(os.getenv("OPENSEARCH_MSEARCH_WINDOW_MS", "2"))
+    OPENSEARCH_MSEARCH_MAX_BATCH: int = int(os.getenv("OPENSEARCH_MSEARCH_MAX_BATCH", "32"))
+    OPENSEARCH_PIT_KEEP_ALIVE: str = os.getenv("OPENSEARCH_PIT_KEEP_ALIVE", "2m")  # 커서 페이지 간 최대 간격
+    OPENSEARCH_WRITE_REFRESH: str = os.getenv("OPENSEARCH_WRITE_REFRESH", "false")  # false / wait_for / true
+    OPENSEARCH_WRITE_BUFFER_ENABLED: bool = os.getenv("OPENSEARCH_WRITE_BUFFER_ENABLED", "false").lower() == "true"
+    OPENSEARCH_WRITE_BUFFER_MAX_DOCS: int = int(os.getenv("OPENSEARCH_WRITE_BUFFER_MAX_DOCS", "500"))
+    OPENSEARCH_WRITE_BUFFER_FLUSH_INTERVAL: float = float(os.getenv("OPENSEARCH_WRITE_BUFFER_FLUSH_INTERVAL", "1.0"))
+    OPENSEARCH_SEARCH_DEADLINE_MS: int = int(os.getenv("OPENSEARCH_SEARCH_DEADLINE_MS", "2000"))  # 요청 경로 검색 기본 deadline (0 = 없음)
+    OPENSEARCH_HEDGE_ENABLED: bool = os.getenv("OPENSEARCH_HEDGE_ENABLED", "false").lower() == "true"  # 느린 검색에 중복 요청 전송
+    OPENSEARCH_HEDGE_PERCENTILE: float = float(os.getenv("OPENSEARCH_HEDGE_PERCENTILE", "95"))  # 헤징 지연 = 최근 지연 시간의 백분위
+    OPENSEARCH_HEDGE_MIN_DELAY_MS: float = float(os.getenv("OPENSEARCH_HEDGE_MIN_DELAY_MS", "20"))
+    OPENSEARCH_HEDGE_MIN_SAMPLES: int = int(os.getenv("OPENSEARCH_HEDGE_MIN_SAMPLES", "50"))  # 백분위 계산에 필요한 최소 표본 수
+    OPENSEARCH_HEDGE_MAX_RATIO: float = float(os.getenv("OPENSEARCH_HEDGE_MAX_RATIO", "0.1"))  # 전체 검색 대비 헤징 요청 상한
     
     # Redis 설정
     REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
     REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
     REDIS_PASSWORD: Optional[str] = os.getenv("REDIS_PASSWORD")
     REDIS_DB: int = int(os.getenv("REDIS_DB", "0"))
+    REDIS_POOL_MAX_CONNECTIONS: int = int(os.getenv("REDIS_POOL_MAX_CONNECTIONS", "50"))  # 비동기 클라이언트 커넥션 풀 크기
+    REDIS_POOL_TIMEOUT: float = float(os.getenv("REDIS_POOL_TIMEOUT", "2"))  # 풀이 가득 찼을 때 연결 대기 시간 (초)
+    REDIS_HEALTH_CHECK_INTERVAL: int = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))  # 유휴 연결 재사용 전 PING 주기 (초)
+    CACHE_L1_ENABLED: bool = os.getenv("CACHE_L1_ENABLED", "true").lower() == "true"  # 프로세스 내 L1 캐시
+    CACHE_L1_MAX_ENTRIES: int = int(os.getenv("CACHE_L1_MAX_ENTRIES", "10000"))
+    CACHE_L1_TTL: float = float(os.getenv("CACHE_L1_TTL", "30"))  # L1 항목 최대 보관 시간 (초)
+    CACHE_L1_PREFIXES: str = os.getenv("CACHE_L1_PREFIXES", "categories:,product:,qcache:")  # L1에 올릴 키 접두사 (쉼표 구분)
+    CACHE_INVALIDATION_CHANNEL: str = os.getenv("CACHE_INVALIDATION_CHANNEL", "cache:invalidate")
+    QUERY_CACHE_ENABLED: bool = os.getenv("QUERY_CACHE_ENABLED", "true").lower() == "true"  # 검색 결과 캐시
+    QUERY_CACHE_TTL_PRODUCT_SEARCH: int = int(os.getenv("QUERY_CACHE_TTL_PRODUCT_SEARCH", "60"))
+    QUERY_CACHE_TTL_REVIEW_SEARCH: int = int(os.getenv("QUERY_CACHE_TTL_REVIEW_SEARCH", "300"))
+    QUERY_CACHE_PRICE_STEP: int = int(os.getenv("QUERY_CACHE_PRICE_STEP", "1"))  # 가격 필터 반올림 단위 (원)
+    CACHE_CODEC: str = os.getenv("CACHE_CODEC", "msgpack")  # 캐시 값 직렬화 형식: msgpack / orjson
+    CACHE_COMPRESSION: str = os.getenv("CACHE_COMPRESSION", "zstd")  # zstd (미설치 시 zlib) / zlib / none
+    CACHE_COMPRESS_MIN_BYTES: int = int(os.getenv("CACHE_COMPRESS_MIN_BYTES", "1024"))  # 이 크기 이상만 압축
+    CACHE_COMPRESSION_LEVEL: int = int(os.getenv("CACHE_COMPRESSION_LEVEL", "3"))
+    CACHE_LOCK_TIMEOUT_MS: int = int(os.getenv("CACHE_LOCK_TIMEOUT_MS", "5000"))  # get_or_compute 재계산 잠금 유지 시간
+    CACHE_EARLY_REFRESH_BETA: float = float(os.getenv("CACHE_EARLY_REFRESH_BETA", "1.0"))  # 확률적 조기 갱신 강도 (0 = 사용 안 함)
+    CACHE_TAGGED_TTL: int = int(os.getenv("CACHE_TAGGED_TTL", "3600"))  # 태그 무효화 대상 캐시(상품 상세, 리뷰 목록) TTL (초)
+    EMBEDDING_CACHE_ENABLED: bool = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"  # 쿼리 임베딩 캐시
+    EMBEDDING_CACHE_MAX_ENTRIES: int = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "5000"))  # 프로세스 내 LRU 크기
+    EMBEDDING_CACHE_TTL: int = int(os.getenv("EMBEDDING_CACHE_TTL", "604800"))  # 7일
+    EMBEDDING_CACHE_DTYPE: str = os.getenv("EMBEDDING_CACHE_DTYPE", "float32")  # 저장 형식: float32 / float16
+    QUERY_LOG_ENABLED: bool = os.getenv("QUERY_LOG_ENABLED", "true").lower() == "true"  # 검색 요청 빈도 기록 (캐시 워밍용)
+    QUERY_LOG_RETENTION_HOURS: int = int(os.getenv("QUERY_LOG_RETENTION_HOURS", "24"))
+    CACHE_WARM_ENABLED: bool = os.getenv("CACHE_WARM_ENABLED", "true").lower() == "true"  # 시작 시 + 주기적 캐시 워밍
+    CACHE_WARM_INTERVAL: int = int(os.getenv("CACHE_WARM_INTERVAL", "600"))  # 워밍 주기 (초)
+    CACHE_WARM_TOP_PRODUCTS: int = int(os.getenv("CACHE_WARM_TOP_PRODUCTS", "200"))  # 리뷰 수 상위 상품 수
+    CACHE_WARM_TOP_QUERIES: int = int(os.getenv("CACHE_WARM_TOP_QUERIES", "50"))  # 엔드포인트별 상위 검색 수
+    CACHE_WARM_RATE: float = float(os.getenv("CACHE_WARM_RATE", "10"))  # 워밍 중 백엔드 호출 상한 (초당)
+    
+    # 의존성 헬스 체크 / 서킷 브레이커 설정
+    HEALTH_CHECK_INTERVAL: float = float(os.getenv("HEALTH_CHECK_INTERVAL", "5"))  # 백그라운드 헬스 체크 주기 (초)
+    HEALTH_CHECK_TIMEOUT: float = float(os.getenv("HEALTH_CHECK_TIMEOUT", "2"))
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5"))  # 연속 실패 시 open
+    CIRCUIT_BREAKER_RECOVERY_TIMEOUT: float = float(os.getenv("CIRCUIT_BREAKER_RECOVERY_TIMEOUT", "15"))  # open 후 half-open 전환 (초)
     
     # JWT 설정
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-here-change-in-production")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    ADMIN_EMAILS: str = os.getenv("ADMIN_EMAILS", "")  # /admin API 허용 사용자 이메일 (쉼표로 구분, 비어 있으면 모두 거부)
     
     # CORS 설정
     BACKEND_CORS_ORIGINS: List[str] = [
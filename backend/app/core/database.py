@@ -1,8 +1,16 @@
-from sqlalchemy import create_engine
+import asyncio
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, List, Dict, Any
+from loguru import logger
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 from app.core.config import settings
+from app.core.sql_profiler import instrument_engine
 
 # Base 클래스 생성 (다른 모델에서 사용)
 Base = declarative_base()
@@ -14,7 +22,7 @@ if settings.ENVIRONMENT == "development":
         settings.DATABASE_URL,
         connect_args={"check_same_thread": False},  # SQLite용 설정
         poolclass=StaticPool,
-        echo=settings.ENVIRONMENT == "development",
+        echo=settings.DB_ECHO,
     )
 else:
     # MySQL 설정
@@ -24,12 +32,171 @@ else:
         pool_recycle=300,
         pool_size=20,
         max_overflow=0,
-        echo=settings.ENVIRONMENT == "development",
+        echo=settings.DB_ECHO,
     )
 
 # 세션 로컬 클래스 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진 (요청 경로의 조회용, 쿼리 대기 중에도 이벤트 루프를 막지 않음)
+if settings.ENVIRONMENT == "development":
+    # 파일 SQLite는 기본 풀 사용 (세션마다 별도 연결, 동시 세션이 한 연결의 트랜잭션을 공유하지 않도록)
+    async_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        echo=settings.DB_ECHO,
+    )
+else:
+    async_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        pool_pre_ping=True,
+        pool_recycle=300,
+        pool_size=20,
+        max_overflow=0,
+        echo=settings.DB_ECHO,
+    )
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+# 요청별 SQL 프로파일러 (쿼리 수, DB 시간, N+1 감지)
+if settings.SQL_PROFILER_ENABLED:
+    instrument_engine(engine)
+    instrument_engine(async_engine)
+
+
+class ReplicaRouter:
+    """읽기 전용 조회를 복제본으로 분산하는 라우터 (복제 지연 인식)
+
+    쓰기와 트랜잭션은 primary(async_engine)를 사용하고, 읽기 세션은 복제 지연이 max_lag초 이하인
+    복제본 중 하나에서 연다. 지연은 백그라운드에서 interval초마다 SHOW REPLICA STATUS로 확인하며,
+    연결할 수 없거나 복제가 멈춘(지연 NULL) 복제본은 다음 확인까지 제외한다.
+    사용할 수 있는 복제본이 없으면 primary로 조회한다.
+    """
+
+    def __init__(self, replica_urls: List[str], max_lag: float = 5.0, interval: float = 10.0):
+        self.max_lag = max_lag
+        self.interval = interval
+        self.replicas = []
+        for url in replica_urls:
+            engine = create_async_engine(
+                url,
+                pool_pre_ping=True,
+                pool_recycle=300,
+                pool_size=20,
+                max_overflow=0,
+                echo=settings.DB_ECHO,
+            )
+            if settings.SQL_PROFILER_ENABLED:
+                instrument_engine(engine)
+            self.replicas.append({
+                "name": f"{engine.url.host}:{engine.url.port}",
+                "engine": engine,
+                "sessionmaker": async_sessionmaker(engine, autoflush=False, expire_on_commit=False),
+                # 첫 확인 전에는 사용하지 않음
+                "lag": None,
+                "checked_at": 0.0,
+                "error": None,
+            })
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"replica_reads": 0, "primary_reads": 0}
+
+    def start(self):
+        """복제 지연 확인 태스크 시작"""
+        if self.replicas and self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await self.check_lag()
+            await asyncio.sleep(self.interval)
+
+    async def _replica_lag(self, replica: Dict[str, Any]) -> Optional[float]:
+        async with replica["engine"].connect() as conn:
+            try:
+                rows = (await conn.execute(text("SHOW REPLICA STATUS"))).mappings().all()
+            except Exception:
+                # MySQL 8.0.22 이전
+                rows = (await conn.execute(text("SHOW SLAVE STATUS"))).mappings().all()
+        if not rows:
+            # 복제 중이 아닌 서버는 primary와 같은 데이터로 간주
+            return 0.0
+        lag = rows[0].get("Seconds_Behind_Source", rows[0].get("Seconds_Behind_Master"))
+        return float(lag) if lag is not None else None
+
+    async def check_lag(self):
+        """모든 복제본의 복제 지연 갱신"""
+        for replica in self.replicas:
+            try:
+                replica["lag"] = await self._replica_lag(replica)
+                replica["error"] = None if replica["lag"] is not None else "replication stopped"
+            except Exception as e:
+                replica["lag"] = None
+                replica["error"] = str(e)
+                logger.warning(f"Replica {replica['name']} lag check failed: {e}")
+            replica["checked_at"] = time.time()
+
+    def _pick_replica(self) -> Optional[Dict[str, Any]]:
+        eligible = [r for r in self.replicas if r["lag"] is not None and r["lag"] <= self.max_lag]
+        return random.choice(eligible) if eligible else None
+
+    @asynccontextmanager
+    async def read_session(self) -> AsyncIterator[AsyncSession]:
+        """읽기 전용 세션 (복제본, 없으면 primary)"""
+        replica = self._pick_replica()
+        if replica is None:
+            self.stats["primary_reads"] += 1
+            async with AsyncSessionLocal() as db:
+                yield db
+            return
+        
+        self.stats["replica_reads"] += 1
+        async with replica["sessionmaker"]() as db:
+            yield db
+
+    def report(self) -> Dict[str, Any]:
+        """복제본별 지연과 읽기 분산 현황"""
+        return {
+            "max_lag_seconds": self.max_lag,
+            "replicas": [
+                {
+                    "name": r["name"],
+                    "lag_seconds": r["lag"],
+                    "eligible": r["lag"] is not None and r["lag"] <= self.max_lag,
+                    "checked_at": r["checked_at"],
+                    "error": r["error"],
+                }
+                for r in self.replicas
+            ],
+            **self.stats,
+        }
+
+    async def close(self):
+        await self.stop()
+        for replica in self.replicas:
+            await replica["engine"].dispose()
+
+
+# 전역 복제본 라우터 (복제본 미설정 시 모든 읽기가 primary로)
+replica_router = ReplicaRouter(
+    settings.ASYNC_REPLICA_DATABASE_URLS,
+    max_lag=settings.DB_REPLICA_MAX_LAG_SECONDS,
+    interval=settings.DB_REPLICA_LAG_CHECK_INTERVAL,
+)
+
+
+def get_replica_router() -> ReplicaRouter:
+    """복제본 라우터 인스턴스 반환"""
+    return replica_router
+
 # 데이터베이스 세션 의존성
 def get_db():
     """데이터베이스 세션을 생성하고 반환하는 의존성"""
@@ -39,9 +206,29 @@ def get_db():
     finally:
         db.close()
 
+# 비동기 데이터베이스 세션 의존성
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """비동기 데이터베이스 세션을 생성하고 반환하는 의존성"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# 읽기 전용 데이터베이스 세션 의존성 (조회만 하는 엔드포인트용)
+async def get_read_db() -> AsyncIterator[AsyncSession]:
+    """복제 지연이 허용 범위인 복제본의 세션을 반환하는 의존성 (없으면 primary)"""
+    async with replica_router.read_session() as db:
+        yield db
+
+async def close_async_db():
+    """비동기 엔진 커넥션 풀 정리 (복제본 포함)"""
+    await replica_router.close()
+    await async_engine.dispose()
+
 # 데이터베이스 초기화 함수
 def init_db():
-    """데이터베이스 테이블을 생성하는 함수"""
+    """데이터베이스 테이블을 생성하는 함수
+
+    커머스 테이블(products, reviews 등)과 인덱스는 Alembic(alembic upgrade head)으로 관리한다.
+    """
     # 모든 모델을 import해야 테이블이 생성됨
     from app.models import User
     Base.metadata.create_all(bind=engine)
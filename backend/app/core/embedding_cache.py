@@ -0,0 +1,155 @@
+import hashlib
+import struct
+import threading
+import time
+import unicodedata
+from typing import Optional, List, Dict, Any
+
+from app.core.config import settings
+from app.core.local_cache import LocalCache
+from loguru import logger
+
+
+# Redis 키 접두사 (값은 cache_codec을 거치지 않은 packed 바이트)
+EMBEDDING_CACHE_PREFIX = "emb"
+
+# 값 첫 바이트: 벡터 원소 형식 (struct 형식 문자, 리틀 엔디언)
+DTYPE_FORMATS = {"float32": (0x01, "f", 4), "float16": (0x02, "e", 2)}
+_DTYPE_BY_FLAG = {flag: (fmt, width) for flag, fmt, width in DTYPE_FORMATS.values()}
+
+
+def normalize_embedding_text(text: str) -> str:
+    """임베딩 캐시 키용 텍스트 정규화 (NFC, 연속 공백 축약)
+
+    대소문자는 임베딩 결과에 영향을 줄 수 있으므로 유지한다.
+    """
+    return " ".join(unicodedata.normalize("NFC", text or "").split())
+
+
+def pack_vector(vector: List[float], dtype: str = "float32") -> bytes:
+    """벡터를 1바이트 형식 헤더 + 리틀 엔디언 packed 바이트로 변환"""
+    flag, fmt, _ = DTYPE_FORMATS[dtype]
+    return bytes((flag,)) + struct.pack(f"<{len(vector)}{fmt}", *vector)
+
+
+def unpack_vector(data: bytes) -> List[float]:
+    """pack_vector로 저장한 바이트를 float 목록으로 복원"""
+    fmt, width = _DTYPE_BY_FLAG[data[0]]
+    return list(struct.unpack(f"<{(len(data) - 1) // width}{fmt}", data[1:]))
+
+
+class EmbeddingCache:
+    """쿼리 임베딩 2단계 캐시 (프로세스 내 LRU + Redis)
+
+    키는 모델명, task_type, 정규화된 텍스트의 해시로 만든다. 같은 모델/텍스트의 임베딩은
+    변하지 않으므로 L1은 pub/sub 무효화 없이 LRU로만 관리한다. Redis에는 JSON 목록 대신
+    float32(기본) 또는 float16 packed 바이트로 저장한다 (768차원 float32 약 3KB).
+    원격 호출 평균 지연 시간으로 캐시 적중이 절약한 시간을 추정해 보고한다.
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        max_entries: int = 5000,
+        ttl: int = 604800,
+        dtype: str = "float32",
+    ):
+        if dtype not in DTYPE_FORMATS:
+            raise ValueError(f"Unknown embedding cache dtype: {dtype}")
+        self._redis_client = redis_client
+        self.ttl = ttl
+        self.dtype = dtype
+        self.local_cache = LocalCache(max_entries=max_entries, ttl=ttl)
+        self._lock = threading.Lock()
+        self.stats = {
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "misses": 0,
+            "remote_calls": 0,
+            "remote_ms_total": 0.0,
+        }
+
+    @property
+    def redis_client(self):
+        if self._redis_client is None:
+            from app.core.redis_client import get_redis_client
+            self._redis_client = get_redis_client()
+        return self._redis_client
+
+    @staticmethod
+    def cache_key(model_name: str, task_type: str, text: str) -> str:
+        digest = hashlib.sha1(normalize_embedding_text(text).encode("utf-8")).hexdigest()
+        return f"{EMBEDDING_CACHE_PREFIX}:{model_name}:{task_type}:{digest}"
+
+    def _incr(self, name: str, value: float = 1):
+        with self._lock:
+            self.stats[name] += value
+
+    async def get(self, model_name: str, task_type: str, text: str) -> Optional[List[float]]:
+        """캐시된 임베딩 조회 (L1 → Redis, Redis 적중 시 L1에 적재)"""
+        key = self.cache_key(model_name, task_type, text)
+        hit, vector = self.local_cache.get(key)
+        if hit:
+            self._incr("l1_hits")
+            return list(vector)
+
+        data = await self.redis_client.get_bytes(key)
+        if data:
+            try:
+                vector = unpack_vector(data)
+            except (KeyError, struct.error) as e:
+                logger.warning(f"Invalid cached embedding {key}: {e}")
+            else:
+                self._incr("l2_hits")
+                self.local_cache.set(key, tuple(vector))
+                return vector
+
+        self._incr("misses")
+        return None
+
+    async def set(self, model_name: str, task_type: str, text: str, vector: List[float], elapsed_ms: Optional[float] = None):
+        """임베딩 저장 (elapsed_ms는 원격 호출 소요 시간, 절약 시간 추정에 사용)"""
+        if elapsed_ms is not None:
+            self._incr("remote_calls")
+            self._incr("remote_ms_total", elapsed_ms)
+        if not vector:
+            return
+
+        key = self.cache_key(model_name, task_type, text)
+        self.local_cache.set(key, tuple(vector))
+        await self.redis_client.set_bytes(key, pack_vector(vector, self.dtype), ex=self.ttl)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """적중률과 추정 절약 시간"""
+        with self._lock:
+            stats = dict(self.stats)
+
+        lookups = stats["l1_hits"] + stats["l2_hits"] + stats["misses"]
+        hits = stats["l1_hits"] + stats["l2_hits"]
+        avg_remote_ms = stats["remote_ms_total"] / stats["remote_calls"] if stats["remote_calls"] else 0.0
+        return {
+            "l1_hits": stats["l1_hits"],
+            "l2_hits": stats["l2_hits"],
+            "misses": stats["misses"],
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "l1_entries": len(self.local_cache),
+            "dtype": self.dtype,
+            "avg_remote_ms": round(avg_remote_ms, 2),
+            "saved_ms_estimate": round(hits * avg_remote_ms, 2),
+        }
+
+
+# 전역 임베딩 캐시 인스턴스 (비활성화 시 None)
+embedding_cache: Optional[EmbeddingCache] = (
+    EmbeddingCache(
+        max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES,
+        ttl=settings.EMBEDDING_CACHE_TTL,
+        dtype=settings.EMBEDDING_CACHE_DTYPE,
+    )
+    if settings.EMBEDDING_CACHE_ENABLED else None
+)
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """임베딩 캐시 인스턴스 반환 (비활성화 시 None)"""
+    return embedding_cache
@@ -0,0 +1,221 @@
+import asyncio
+import threading
+import time
+from typing import Optional, Dict, Any, Callable, Awaitable
+from app.core.config import settings
+from loguru import logger
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 의존성 호출을 건너뛸 때 발생"""
+
+    def __init__(self, name: str):
+        super().__init__(f"Circuit breaker '{name}' is open")
+        self.name = name
+
+
+class CircuitBreaker:
+    """의존성별 서킷 브레이커 (closed → open → half-open)
+
+    연속 실패가 failure_threshold에 도달하면 open 상태가 되어 호출을 즉시 거절한다.
+    recovery_timeout이 지나면 half-open 상태에서 제한된 수의 시험 호출을 허용하고,
+    성공하면 closed로, 실패하면 다시 open으로 전환한다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 15.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """호출이 거절되는 상태인지 여부 (상태 전이 없이 확인)"""
+        return self.state == self.OPEN
+
+    def _maybe_half_open(self):
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._half_open_calls = 0
+
+    def allow_request(self) -> bool:
+        """호출 허용 여부 (half-open에서는 시험 호출 수를 차감)"""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+                self._half_open_calls += 1
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"Circuit breaker '{self.name}' closed")
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._open(f"{self._failures} consecutive failures")
+
+    def trip(self):
+        """헬스 체크 실패 시 즉시 open 전환 (이미 open이면 복구 대기 시간을 다시 시작)"""
+        with self._lock:
+            self._open("health check failure")
+
+    def _open(self, reason: str):
+        if self._state != self.OPEN:
+            logger.warning(f"Circuit breaker '{self.name}' opened: {reason}")
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태 요약"""
+        state = self.state
+        return {
+            "state": state,
+            "consecutive_failures": self._failures,
+            "rejected_calls": self._rejected,
+            "retry_in_seconds": (
+                round(max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at)), 1)
+                if state == self.OPEN else 0.0
+            ),
+        }
+
+
+class DependencyHealthMonitor:
+    """의존성 상태를 백그라운드에서 주기적으로 확인하여 캐시하는 모니터
+
+    요청 경로에서는 live 호출 대신 cached_status()로 마지막 확인 결과를 사용한다.
+    """
+
+    def __init__(self, interval: float = 5.0, check_timeout: float = 2.0):
+        self.interval = interval
+        self.check_timeout = check_timeout
+        self._checks: Dict[str, Callable[[], Awaitable[bool]]] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._status: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, name: str, check: Callable[[], Awaitable[bool]], breaker: Optional[CircuitBreaker] = None):
+        """의존성 헬스 체크 등록"""
+        self._checks[name] = check
+        if breaker is not None:
+            self._breakers[name] = breaker
+
+    async def check(self, name: str) -> bool:
+        """헬스 체크 1회 실행 후 결과 캐시"""
+        start = time.perf_counter()
+        error = None
+        try:
+            healthy = bool(await asyncio.wait_for(self._checks[name](), timeout=self.check_timeout))
+        except Exception as e:
+            healthy = False
+            error = str(e) or type(e).__name__
+
+        self._status[name] = {
+            "healthy": healthy,
+            "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+            "checked_at": time.time(),
+            "error": error,
+        }
+
+        breaker = self._breakers.get(name)
+        if breaker is not None and not healthy:
+            breaker.trip()
+        return healthy
+
+    async def check_all(self):
+        await asyncio.gather(*(self.check(name) for name in self._checks))
+
+    def cached_status(self, name: str) -> Optional[bool]:
+        """마지막 헬스 체크 결과 (모니터가 확인한 적 없으면 None)"""
+        status = self._status.get(name)
+        return status["healthy"] if status else None
+
+    def report(self) -> Dict[str, Any]:
+        """의존성별 캐시된 상태와 서킷 상태"""
+        report = {}
+        for name in self._checks:
+            report[name] = dict(self._status.get(name, {"healthy": None, "latency_ms": None, "checked_at": None, "error": None}))
+            breaker = self._breakers.get(name)
+            if breaker is not None:
+                report[name]["circuit"] = breaker.snapshot()
+        return report
+
+    def is_degraded(self) -> bool:
+        """확인된 의존성 중 하나라도 비정상이거나 서킷이 열려 있는지 여부"""
+        if any(status["healthy"] is False for status in self._status.values()):
+            return True
+        return any(breaker.is_open for breaker in self._breakers.values())
+
+    def start(self):
+        """주기적 헬스 체크 시작"""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        while True:
+            try:
+                await self.check_all()
+            except Exception as e:
+                logger.error(f"Health monitor iteration failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# 전역 서킷 브레이커 및 헬스 모니터 인스턴스
+opensearch_breaker = CircuitBreaker(
+    "opensearch",
+    failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    recovery_timeout=settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+)
+redis_breaker = CircuitBreaker(
+    "redis",
+    failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    recovery_timeout=settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+)
+health_monitor = DependencyHealthMonitor(
+    interval=settings.HEALTH_CHECK_INTERVAL,
+    check_timeout=settings.HEALTH_CHECK_TIMEOUT,
+)
+
+
+def get_health_monitor() -> DependencyHealthMonitor:
+    """헬스 모니터 인스턴스 반환"""
+    return health_monitor
@@ -0,0 +1,163 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Any, Dict, Iterable, List, Tuple
+
+
+def key_family(key: str) -> str:
+    """키 패밀리 (첫 ':' 앞부분, 예: product:123 → product)"""
+    return key.split(":", 1)[0]
+
+
+class CacheStats:
+    """키 패밀리별 캐시 계측
+
+    - 이벤트 수: L1/L2 적중, miss, stale 응답, 백그라운드 갱신 등 (incr)
+    - 관측값: 인코딩/디코딩 시간, 값 크기의 개수/합계/최대 (observe)
+    """
+
+    # (관측값 이름, 설명) - metrics()의 summary 항목
+    OBSERVATIONS = (
+        ("encode_seconds", "Cache value encode time"),
+        ("decode_seconds", "Cache value decode time"),
+        ("value_bytes", "Encoded cache value size"),
+    )
+
+    def __init__(self):
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._observations: Dict[str, Dict[str, List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def incr(self, key: str, outcome: str):
+        family = key_family(key)
+        with self._lock:
+            counts = self._counts.get(family)
+            if counts is None:
+                counts = self._counts[family] = {"l1_hits": 0, "l2_hits": 0, "misses": 0}
+            counts[outcome] = counts.get(outcome, 0) + 1
+
+    def observe(self, key: str, name: str, value: float):
+        """관측값 1건 기록 ([개수, 합계, 최대])"""
+        family = key_family(key)
+        with self._lock:
+            observations = self._observations.setdefault(family, {})
+            summary = observations.get(name)
+            if summary is None:
+                observations[name] = [1, value, value]
+            else:
+                summary[0] += 1
+                summary[1] += value
+                summary[2] = max(summary[2], value)
+
+    def _copy(self) -> Tuple[Dict[str, Dict[str, int]], Dict[str, Dict[str, List[float]]]]:
+        with self._lock:
+            counts = {family: dict(values) for family, values in self._counts.items()}
+            observations = {
+                family: {name: list(summary) for name, summary in values.items()}
+                for family, values in self._observations.items()
+            }
+        return counts, observations
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """패밀리별 적중 수, 적중률, 평균/최대 인코딩·디코딩 시간과 값 크기"""
+        counts, observations = self._copy()
+
+        for family in observations:
+            counts.setdefault(family, {"l1_hits": 0, "l2_hits": 0, "misses": 0})
+
+        for family, values in counts.items():
+            total = values["l1_hits"] + values["l2_hits"] + values["misses"]
+            values["l1_hit_ratio"] = round(values["l1_hits"] / total, 4) if total else 0.0
+            values["hit_ratio"] = round((values["l1_hits"] + values["l2_hits"]) / total, 4) if total else 0.0
+            values["stale_ratio"] = round(values.get("stale_serves", 0) / total, 4) if total else 0.0
+
+            for name, (count, total_value, max_value) in observations.get(family, {}).items():
+                if name.endswith("_seconds"):
+                    metric = name[:-len("_seconds")]
+                    values[f"{metric}_ms_avg"] = round(total_value / count * 1000, 3)
+                    values[f"{metric}_ms_max"] = round(max_value * 1000, 3)
+                else:
+                    values[f"{name}_avg"] = round(total_value / count, 1)
+                    values[f"{name}_max"] = int(max_value)
+        return counts
+
+    def metrics(self, gauges: Optional[Dict[str, float]] = None, namespace: str = "cache") -> str:
+        """Prometheus 텍스트 노출 형식"""
+        counts, observations = self._copy()
+        lines = [
+            f"# HELP {namespace}_events_total Cache events by key family (l1_hits, l2_hits, misses, stale_serves, ...)",
+            f"# TYPE {namespace}_events_total counter",
+        ]
+        for family in sorted(counts):
+            for event, value in sorted(counts[family].items()):
+                lines.append(f'{namespace}_events_total{{family="{family}",event="{event}"}} {value}')
+
+        for name, description in self.OBSERVATIONS:
+            lines.append(f"# HELP {namespace}_{name} {description}")
+            lines.append(f"# TYPE {namespace}_{name} summary")
+            for family in sorted(observations):
+                summary = observations[family].get(name)
+                if summary is None:
+                    continue
+                lines.append(f'{namespace}_{name}_count{{family="{family}"}} {summary[0]}')
+                lines.append(f'{namespace}_{name}_sum{{family="{family}"}} {summary[1]:.6f}')
+
+        for name, value in (gauges or {}).items():
+            lines.append(f"# TYPE {namespace}_{name} gauge")
+            lines.append(f"{namespace}_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class LocalCache:
+    """프로세스 내 TTL + LRU 캐시 (Redis 앞단 L1)
+
+    max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 제거하고, 항목별 만료 시각이
+    지나면 조회 시 제거한다. pub/sub 무효화(AsyncRedisClient.enable_local_cache)는 요청 처리와 같은
+    이벤트 루프의 asyncio 태스크로 실행되므로 하나의 이벤트 루프에서만 사용하는 것을 전제로 한다.
+    잠금은 개별 연산 단위로만 잡으며, 여러 스레드에서 공유해도 되는 보장(get 후 set 같은 연속 연산의
+    원자성 등)은 제공하지 않는다. 반환값은 복사하지 않으므로 호출자가 수정하면 안 된다.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """(적중 여부, 값) 반환"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return False, None
+
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """값 저장 (ttl은 L1 기본 TTL을 넘지 않음)"""
+        ttl = min(ttl, self.ttl) if ttl else self.ttl
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete_many(self, keys: Iterable[str]):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,9 +1,160 @@
-from opensearchpy import OpenSearch
-from typing import Optional, Dict, Any, List
+from opensearchpy import OpenSearch, AsyncOpenSearch, TransportError, ConnectionError as OpenSearchConnectionError, ConnectionTimeout
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Set, Tuple, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import copy
 import json
+import time
+import uuid
+import weakref
 from app.core.config import settings
+from app.core.health import opensearch_breaker, health_monitor, CircuitOpenError
 from loguru import logger
 
+# bulk 요청에서 재시도 대상이 되는 상태 코드 (큐 포화 / 일시적 불가)
+BULK_RETRY_STATUSES = (429, 503)
+
+# 쓰기 후 refresh 정책: "false"(기본 refresh_interval에 맡김) / "wait_for"(다음 refresh까지 대기) / "true"(즉시 refresh)
+RefreshPolicy = Union[bool, str]
+REFRESH_POLICIES = ("false", "wait_for", "true")
+
+# deadline 중 OpenSearch 서버 측 timeout에 할당하는 비율 (나머지는 네트워크/응답 직렬화 여유)
+SERVER_TIMEOUT_RATIO = 0.8
+
+
+# 용도별 _source 프로젝션 프로필
+# - 768차원 review_embedding과 suggest 등 응답에 쓰지 않는 필드는 전송하지 않는다.
+SOURCE_PROFILES: Dict[str, Any] = {
+    # 상품 목록/검색 카드: 설명 본문 제외
+    "product_card": {
+        "includes": [
+            "product_no", "product_name", "brand", "price", "image_url",
+            "category.category_name", "statistics.average_rating", "statistics.total_reviews",
+            "stock", "status", "view_count", "created_at", "updated_at",
+        ]
+    },
+    # 상품 상세: 자동완성용 suggest만 제외
+    "product_detail": {"excludes": ["suggest"]},
+    # 문서 참조만 필요한 조회 (예: more_like_this 기준 상품)
+    "product_ref": {"includes": ["product_no"]},
+    # 리뷰 목록/검색: 임베딩 벡터 제외
+    "review_list": {"excludes": ["review_embedding", "embedding_model", "embedding_updated_at"]},
+}
+
+
+def _with_source_profile(query: Dict[str, Any], source_profile: Optional[str]) -> Dict[str, Any]:
+    """쿼리 본문에 _source 프로젝션 프로필 적용"""
+    if source_profile is None:
+        return query
+    if source_profile not in SOURCE_PROFILES:
+        raise ValueError(f"Unknown _source profile: {source_profile}")
+    return {**query, "_source": SOURCE_PROFILES[source_profile]}
+
+
+def resolve_refresh_policy(refresh: Optional[RefreshPolicy]) -> str:
+    """refresh 정책을 OpenSearch 파라미터 문자열로 변환 (None이면 설정 기본값)"""
+    if refresh is None:
+        refresh = settings.OPENSEARCH_WRITE_REFRESH
+    if isinstance(refresh, bool):
+        refresh = "true" if refresh else "false"
+    if refresh not in REFRESH_POLICIES:
+        raise ValueError(f"Invalid refresh policy: {refresh} (expected one of {REFRESH_POLICIES})")
+    return refresh
+
+
+def _connection_kwargs() -> Dict[str, Any]:
+    """동기/비동기 클라이언트 공통 연결 설정"""
+    return {
+        "hosts": [{
+            'host': settings.OPENSEARCH_HOST,
+            'port': settings.OPENSEARCH_PORT
+        }],
+        "http_auth": (settings.OPENSEARCH_USERNAME, settings.OPENSEARCH_PASSWORD),
+        "use_ssl": settings.OPENSEARCH_USE_SSL,
+        "verify_certs": settings.OPENSEARCH_VERIFY_CERTS,
+        "ssl_show_warn": False,
+        "timeout": settings.OPENSEARCH_TIMEOUT,
+        "max_retries": settings.OPENSEARCH_MAX_RETRIES,
+        "retry_on_timeout": True,
+    }
+
+
+def _with_size(query: Dict[str, Any], size: int) -> Dict[str, Any]:
+    """쿼리 본문에 size가 없을 때만 기본 size 지정 (URL 파라미터가 본문 size를 덮어쓰지 않도록)"""
+    if "size" in query:
+        return query
+    return {**query, "size": size}
+
+
+def _hits_to_documents(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """검색 응답의 hits를 _id/_score가 포함된 문서 목록으로 변환"""
+    results = []
+    for hit in response.get('hits', {}).get('hits', []):
+        doc = hit.get('_source', {})
+        doc['_id'] = hit.get('_id')
+        doc['_score'] = hit.get('_score')
+        results.append(doc)
+    return results
+
+
+def _to_search_envelope(response: Dict[str, Any]) -> Dict[str, Any]:
+    """검색 응답을 hits/total/aggregations/took 봉투로 변환"""
+    total = response.get('hits', {}).get('total', 0)
+    if isinstance(total, dict):
+        total_value = total.get('value', 0)
+        total_relation = total.get('relation', 'eq')
+    else:
+        total_value = total or 0
+        total_relation = 'eq'
+    
+    raw_hits = response.get('hits', {}).get('hits', [])
+    return {
+        "hits": _hits_to_documents(response),
+        "last_sort": raw_hits[-1].get('sort') if raw_hits else None,  # search_after 커서용
+        "total": total_value,
+        "total_relation": total_relation,  # "gte"이면 track_total_hits 상한에 걸린 하한값
+        "aggregations": response.get('aggregations', {}),
+        "took": response.get('took', 0),
+        "timed_out": response.get('timed_out', False),
+    }
+
+
+def _timed_out_envelope() -> Dict[str, Any]:
+    """deadline 안에 응답을 받지 못했을 때의 빈 검색 봉투"""
+    envelope = _empty_search_envelope()
+    envelope["timed_out"] = True
+    return envelope
+
+
+def _with_deadline(body: Dict[str, Any], deadline_ms: Optional[float]) -> Dict[str, Any]:
+    """deadline을 OpenSearch 서버 측 timeout으로 전달 (시간 초과 시 샤드별 부분 결과와 timed_out 반환)"""
+    if not deadline_ms:
+        return body
+    return {**body, "timeout": f"{max(1, int(deadline_ms * SERVER_TIMEOUT_RATIO))}ms"}
+
+
+def _is_dependency_failure(error: Exception) -> bool:
+    """서킷 브레이커 실패로 집계할 오류인지 여부 (연결/타임아웃/5xx만 해당, 4xx는 정상 응답)"""
+    if isinstance(error, (OpenSearchConnectionError, asyncio.TimeoutError)):
+        return True
+    if isinstance(error, TransportError):
+        return isinstance(error.status_code, int) and error.status_code >= 500
+    return False
+
+
+def _empty_search_envelope() -> Dict[str, Any]:
+    return {
+        "hits": [],
+        "last_sort": None,
+        "total": 0,
+        "total_relation": "eq",
+        "aggregations": {},
+        "took": 0,
+        "timed_out": False,
+    }
+
+
 class OpenSearchClient:
     """OpenSearch 클라이언트 래퍼 클래스"""
     
@@ -14,19 +165,7 @@ class OpenSearchClient:
     def connect(self):
         """OpenSearch 서버에 연결"""
         try:
-            self.client = OpenSearch(
-                hosts=[{
-                    'host': settings.OPENSEARCH_HOST,
-                    'port': settings.OPENSEARCH_PORT
-                }],
-                http_auth=(settings.OPENSEARCH_USERNAME, settings.OPENSEARCH_PASSWORD),
-                use_ssl=settings.OPENSEARCH_USE_SSL,
-                verify_certs=settings.OPENSEARCH_VERIFY_CERTS,
-                ssl_show_warn=False,
-                timeout=30,
-                max_retries=3,
-                retry_on_timeout=True,
-            )
+            self.client = OpenSearch(**_connection_kwargs())
             
             # 연결 테스트
             info = self.client.info()
@@ -36,7 +175,10 @@ class OpenSearchClient:
             self.client = None
     
     def is_connected(self) -> bool:
-        """OpenSearch 연결 상태 확인"""
+        """OpenSearch 연결 상태 확인 (헬스 모니터가 동작 중이면 캐시된 상태 사용)"""
+        cached = health_monitor.cached_status("opensearch")
+        if cached is not None:
+            return cached
         try:
             if self.client:
                 self.client.info()
@@ -82,8 +224,14 @@ class OpenSearchClient:
             logger.error(f"Failed to delete index {index_name}: {e}")
             return False
     
-    def index_document(self, index_name: str, document: Dict[str, Any], doc_id: Optional[str] = None) -> Optional[str]:
-        """문서 인덱싱"""
+    def index_document(
+        self,
+        index_name: str,
+        document: Dict[str, Any],
+        doc_id: Optional[str] = None,
+        refresh: Optional[RefreshPolicy] = None,
+    ) -> Optional[str]:
+        """문서 인덱싱 (refresh 미지정 시 OPENSEARCH_WRITE_REFRESH 정책)"""
         try:
             if not self.client:
                 return None
@@ -92,7 +240,7 @@ class OpenSearchClient:
                 index=index_name,
                 body=document,
                 id=doc_id,
-                refresh=True
+                refresh=resolve_refresh_policy(refresh)
             )
             return response.get('_id')
         except Exception as e:
@@ -111,32 +259,61 @@ class OpenSearchClient:
             logger.error(f"Failed to get document {doc_id} from {index_name}: {e}")
             return None
     
-    def search(self, index_name: str, query: Dict[str, Any], size: int = 10) -> List[Dict[str, Any]]:
-        """문서 검색"""
+    def search(
+        self,
+        index_name: str,
+        query: Dict[str, Any],
+        size: int = 10,
+        source_profile: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """문서 검색 (source_profile 지정 시 SOURCE_PROFILES의 _source 프로젝션 적용)"""
         try:
             if not self.client:
                 return []
             
             response = self.client.search(
                 index=index_name,
-                body=query,
-                size=size
+                body=_with_source_profile(_with_size(query, size), source_profile)
             )
             
-            results = []
-            for hit in response.get('hits', {}).get('hits', []):
-                doc = hit.get('_source', {})
-                doc['_id'] = hit.get('_id')
-                doc['_score'] = hit.get('_score')
-                results.append(doc)
-            
-            return results
+            return _hits_to_documents(response)
         except Exception as e:
             logger.error(f"Failed to search in {index_name}: {e}")
             return []
     
-    def update_document(self, index_name: str, doc_id: str, document: Dict[str, Any]) -> bool:
-        """문서 업데이트"""
+    def search_with_meta(
+        self,
+        index_name: str,
+        query: Dict[str, Any],
+        size: int = 10,
+        track_total_hits: Optional[Union[bool, int]] = None,
+        source_profile: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """문서 검색 (hits, total, aggregations, took을 한 번의 요청으로 반환)"""
+        try:
+            if not self.client:
+                return _empty_search_envelope()
+            
+            # 호출자의 쿼리(캐시/재사용될 수 있음)를 변경하지 않도록 복사본에 기본값 지정
+            body = dict(_with_source_profile(_with_size(query, size), source_profile))
+            body.setdefault(
+                "track_total_hits",
+                settings.OPENSEARCH_TRACK_TOTAL_HITS if track_total_hits is None else track_total_hits
+            )
+            response = self.client.search(index=index_name, body=body)
+            return _to_search_envelope(response)
+        except Exception as e:
+            logger.error(f"Failed to search in {index_name}: {e}")
+            return _empty_search_envelope()
+    
+    def update_document(
+        self,
+        index_name: str,
+        doc_id: str,
+        document: Dict[str, Any],
+        refresh: Optional[RefreshPolicy] = None,
+    ) -> bool:
+        """문서 업데이트 (refresh 미지정 시 OPENSEARCH_WRITE_REFRESH 정책)"""
         try:
             if not self.client:
                 return False
@@ -145,15 +322,20 @@ class OpenSearchClient:
                 index=index_name,
                 id=doc_id,
                 body={"doc": document},
-                refresh=True
+                refresh=resolve_refresh_policy(refresh)
             )
             return response.get('result') == 'updated'
         except Exception as e:
             logger.error(f"Failed to update document {doc_id} in {index_name}: {e}")
             return False
     
-    def delete_document(self, index_name: str, doc_id: str) -> bool:
-        """문서 삭제"""
+    def delete_document(
+        self,
+        index_name: str,
+        doc_id: str,
+        refresh: Optional[RefreshPolicy] = None,
+    ) -> bool:
+        """문서 삭제 (refresh 미지정 시 OPENSEARCH_WRITE_REFRESH 정책)"""
         try:
             if not self.client:
                 return False
@@ -161,49 +343,874 @@ class OpenSearchClient:
             response = self.client.delete(
                 index=index_name,
                 id=doc_id,
-                refresh=True
+                refresh=resolve_refresh_policy(refresh)
             )
             return response.get('result') == 'deleted'
         except Exception as e:
             logger.error(f"Failed to delete document {doc_id} from {index_name}: {e}")
             return False
     
-    def bulk_index(self, index_name: str, documents: List[Dict[str, Any]]) -> bool:
-        """대량 문서 인덱싱"""
+    def bulk_index(
+        self,
+        index_name: str,
+        documents: Iterable[Dict[str, Any]],
+        refresh: Optional[RefreshPolicy] = None,
+    ) -> bool:
+        """대량 문서 인덱싱 (모든 문서가 성공해야 True)"""
         try:
             if not self.client:
                 return False
             
-            actions = []
-            for doc in documents:
-                # 문서에서 _id 추출
-                doc_copy = doc.copy()
-                doc_id = doc_copy.pop('_id', None)
-                
-                # action 헤더
-                action_header = {"index": {"_index": index_name}}
-                if doc_id:
-                    action_header["index"]["_id"] = doc_id
-                
-                actions.append(action_header)
-                actions.append(doc_copy)
-            
-            response = self.client.bulk(body=actions, refresh=True)
-            
-            # 에러 로깅 추가
-            if response.get('errors', False):
-                for item in response.get('items', []):
-                    if 'index' in item and 'error' in item['index']:
-                        logger.error(f"Bulk index error: {item['index']['error']}")
-            
-            return not response.get('errors', False)
+            success = True
+            for result in self.streaming_bulk(
+                index_name, documents, thread_count=1, refresh=resolve_refresh_policy(refresh)
+            ):
+                if not result["ok"]:
+                    success = False
+            return success
         except Exception as e:
             logger.error(f"Failed to bulk index documents in {index_name}: {e}")
             return False
+    
+    def streaming_bulk(
+        self,
+        index_name: str,
+        documents: Iterable[Dict[str, Any]],
+        op_type: str = "index",
+        chunk_size: int = 500,
+        max_chunk_bytes: int = 10 * 1024 * 1024,
+        thread_count: int = 4,
+        max_retries: int = 3,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        refresh: RefreshPolicy = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """스트리밍 대량 인덱싱
+
+        documents를 순회하며 문서 수(chunk_size)와 바이트 크기(max_chunk_bytes)
+        기준으로 청크를 자르고, thread_count개의 워커로 병렬 전송한다.
+        처리 중인 청크 수가 제한되므로 입력 크기와 무관하게 메모리 사용량이 일정하다.
+        429/503으로 거절된 항목만 지수 백오프 후 재전송한다.
+
+        op_type이 "update"이면 각 문서를 부분 업데이트(doc)로 전송하며 _id가 필요하다.
+
+        Yields:
+            문서별 결과 {"_id", "ok", "status", "error"} (입력 순서 유지)
+        """
+        if not self.client:
+            for doc in documents:
+                yield {"_id": doc.get("_id"), "ok": False, "status": None, "error": "OpenSearch client not available"}
+            return
+        
+        chunks = self._chunk_bulk_actions(index_name, documents, op_type, chunk_size, max_chunk_bytes)
+        
+        if thread_count <= 1:
+            for chunk in chunks:
+                yield from self._send_bulk_chunk(chunk, max_retries, initial_backoff, max_backoff, refresh)
+            return
+        
+        # 순서 보장을 위해 제출 순서대로 결과를 꺼내고, 동시에 처리 중인 청크 수를 제한
+        in_flight = deque()
+        with ThreadPoolExecutor(max_workers=thread_count, thread_name_prefix="opensearch-bulk") as pool:
+            for chunk in chunks:
+                in_flight.append(pool.submit(
+                    self._send_bulk_chunk, chunk, max_retries, initial_backoff, max_backoff, refresh
+                ))
+                if len(in_flight) >= thread_count * 2:
+                    yield from in_flight.popleft().result()
+            while in_flight:
+                yield from in_flight.popleft().result()
+    
+    def _chunk_bulk_actions(
+        self,
+        index_name: str,
+        documents: Iterable[Dict[str, Any]],
+        op_type: str,
+        chunk_size: int,
+        max_chunk_bytes: int,
+    ) -> Iterator[List[Tuple[Optional[str], bytes]]]:
+        """문서를 직렬화된 bulk 라인으로 변환하여 크기 제한 청크 단위로 반환"""
+        chunk: List[Tuple[Optional[str], bytes]] = []
+        chunk_bytes = 0
+        
+        for doc in documents:
+            doc_id = doc.get('_id')
+            source = {k: v for k, v in doc.items() if k != '_id'}
+            
+            # action 헤더
+            action_header = {op_type: {"_index": index_name}}
+            if doc_id is not None:
+                action_header[op_type]["_id"] = str(doc_id)
+            if op_type == "update":
+                source = {"doc": source}
+            
+            lines = (
+                json.dumps(action_header, ensure_ascii=False, default=str) + "\n" +
+                json.dumps(source, ensure_ascii=False, default=str) + "\n"
+            ).encode("utf-8")
+            
+            if chunk and (len(chunk) >= chunk_size or chunk_bytes + len(lines) > max_chunk_bytes):
+                yield chunk
+                chunk = []
+                chunk_bytes = 0
+            
+            chunk.append((doc_id, lines))
+            chunk_bytes += len(lines)
+        
+        if chunk:
+            yield chunk
+    
+    def _send_bulk_chunk(
+        self,
+        chunk: List[Tuple[Optional[str], bytes]],
+        max_retries: int,
+        initial_backoff: float,
+        max_backoff: float,
+        refresh: RefreshPolicy,
+    ) -> List[Dict[str, Any]]:
+        """청크 하나를 전송하고 429/503 항목만 백오프 후 재시도"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(chunk)
+        pending = list(range(len(chunk)))
+        
+        for attempt in range(max_retries + 1):
+            if attempt > 0:
+                time.sleep(min(max_backoff, initial_backoff * (2 ** (attempt - 1))))
+            
+            body = b"".join(chunk[i][1] for i in pending)
+            try:
+                response = self.client.bulk(body=body, refresh=refresh)
+            except TransportError as e:
+                if e.status_code in BULK_RETRY_STATUSES and attempt < max_retries:
+                    logger.warning(f"Bulk request rejected ({e.status_code}), retrying {len(pending)} items")
+                    continue
+                for i in pending:
+                    results[i] = {"_id": chunk[i][0], "ok": False, "status": e.status_code, "error": str(e)}
+                break
+            except Exception as e:
+                for i in pending:
+                    results[i] = {"_id": chunk[i][0], "ok": False, "status": None, "error": str(e)}
+                break
+            
+            retry = []
+            for i, item in zip(pending, response.get('items', [])):
+                op_result = next(iter(item.values()))
+                status = op_result.get('status')
+                error = op_result.get('error')
+                if error and status in BULK_RETRY_STATUSES and attempt < max_retries:
+                    retry.append(i)
+                    continue
+                if error:
+                    logger.error(f"Bulk index error: {error}")
+                results[i] = {
+                    "_id": op_result.get('_id', chunk[i][0]),
+                    "ok": not error,
+                    "status": status,
+                    "error": error,
+                }
+            
+            if not retry:
+                break
+            logger.warning(f"Bulk items rejected with 429/503, retrying {len(retry)} items")
+            pending = retry
+        
+        return [
+            result or {"_id": chunk[i][0], "ok": False, "status": None, "error": "missing bulk response item"}
+            for i, result in enumerate(results)
+        ]
+
+
+def _retrieve_exception(future: asyncio.Future):
+    """호출자가 취소된 경우에도 'exception was never retrieved' 경고가 남지 않도록 처리"""
+    if not future.cancelled():
+        future.exception()
+
+
+class MSearchBatcher:
+    """동시에 발생한 검색을 모아 _msearch 한 번으로 보내는 이벤트 루프별 데이터로더
+
+    첫 요청이 들어온 뒤 window_ms 동안(또는 max_batch_size개가 모일 때까지) 쌓인
+    쿼리를 하나의 _msearch로 전송하고 응답을 각 호출자에게 돌려준다.
+    같은 인덱스/본문의 쿼리가 이미 대기 중이거나 전송 중이면 그 결과를 공유한다.
+    """
+    
+    # 배치 크기 분포 집계 구간 (상한 포함)
+    HISTOGRAM_BUCKETS = (1, 2, 4, 8, 16, 32, 64)
+    
+    def __init__(self, client: AsyncOpenSearch, window_ms: float, max_batch_size: int):
+        self._client = client
+        self._window = window_ms / 1000
+        self._max_batch_size = max_batch_size
+        self._pending: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._in_flight: Dict[str, List[Any]] = {}  # key -> [future, 대기 호출자 수]
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # 전송 중인 _msearch 태스크 (이벤트 루프는 약한 참조만 유지하므로 완료 전 GC 방지)
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats = {
+            "batches": 0,
+            "queries": 0,
+            "deduplicated": 0,
+            "max_batch_size": 0,
+            "errors": 0,
+        }
+        self._histogram = {bucket: 0 for bucket in self.HISTOGRAM_BUCKETS}
+        self._histogram_overflow = 0
+    
+    async def search(self, index_name: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """검색 요청을 배치에 추가하고 해당 응답을 반환"""
+        key = f"{index_name}\n{json.dumps(body, sort_keys=True, default=str)}"
+        
+        entry = self._in_flight.get(key)
+        if entry is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            future.add_done_callback(_retrieve_exception)
+            entry = self._in_flight[key] = [future, 1]
+            self._pending[key] = (index_name, body)
+            
+            if len(self._pending) >= self._max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self._window, self._flush)
+        else:
+            # 동일 쿼리가 대기/전송 중이면 결과 공유
+            self._stats["deduplicated"] += 1
+            entry[1] += 1
+        
+        result = await asyncio.shield(entry[0])
+        # 여러 호출자가 공유하는 응답은 호출자별로 변경해도 안전하도록 복사
+        return copy.deepcopy(result) if entry[1] > 1 else result
+    
+    def _flush(self):
+        """대기 중인 쿼리를 하나의 _msearch 요청으로 전송"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        if not self._pending:
+            return
+        
+        batch = self._pending
+        self._pending = {}
+        self._record_batch(len(batch))
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _send(self, batch: Dict[str, Tuple[str, Dict[str, Any]]]):
+        keys = list(batch.keys())
+        lines = []
+        for key in keys:
+            index_name, body = batch[key]
+            lines.append({"index": index_name})
+            lines.append(body)
+        
+        try:
+            response = await self._client.msearch(body=lines)
+            responses = response.get("responses", [])
+            for i, key in enumerate(keys):
+                item = responses[i] if i < len(responses) else {"error": "missing msearch response"}
+                future = self._in_flight.pop(key)[0]
+                if future.done():
+                    continue
+                if "error" in item:
+                    self._stats["errors"] += 1
+                    future.set_exception(TransportError(item.get("status", "N/A"), "msearch_item_error", item["error"]))
+                else:
+                    future.set_result(item)
+        except Exception as e:
+            self._stats["errors"] += 1
+            for key in keys:
+                entry = self._in_flight.pop(key, None)
+                if entry is not None and not entry[0].done():
+                    entry[0].set_exception(e)
+    
+    def _record_batch(self, batch_size: int):
+        self._stats["batches"] += 1
+        self._stats["queries"] += batch_size
+        self._stats["max_batch_size"] = max(self._stats["max_batch_size"], batch_size)
+        for bucket in self.HISTOGRAM_BUCKETS:
+            if batch_size <= bucket:
+                self._histogram[bucket] += 1
+                break
+        else:
+            self._histogram_overflow += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """배치 크기 분포 및 중복 제거 통계"""
+        batches = self._stats["batches"]
+        histogram = {f"le_{bucket}": count for bucket, count in self._histogram.items()}
+        histogram[f"gt_{self.HISTOGRAM_BUCKETS[-1]}"] = self._histogram_overflow
+        return {
+            **self._stats,
+            "avg_batch_size": round(self._stats["queries"] / batches, 2) if batches else 0.0,
+            "batch_size_histogram": histogram,
+        }
+
+
+class SearchLatencyTracker:
+    """인덱스별 최근 검색 지연 시간을 보관하고 헤징 지연(백분위)과 헤징 통계를 제공"""
+    
+    def __init__(self, window: int = 500):
+        self._window = window
+        self._samples: Dict[str, deque] = {}
+        self._stats = {"searches": 0, "hedged": 0, "hedge_wins": 0, "timeouts": 0}
+    
+    def record(self, index_name: str, latency_ms: float):
+        samples = self._samples.get(index_name)
+        if samples is None:
+            samples = self._samples[index_name] = deque(maxlen=self._window)
+        samples.append(latency_ms)
+    
+    def percentile(self, index_name: str, percentile: float) -> Optional[float]:
+        """최근 지연 시간의 백분위 (표본이 부족하면 None)"""
+        samples = self._samples.get(index_name)
+        if not samples or len(samples) < settings.OPENSEARCH_HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
+    
+    def hedge_delay(self, index_name: str) -> Optional[float]:
+        """헤징 요청을 보내기까지 기다릴 시간(초), 헤징하지 않으면 None
+
+        헤징 요청이 전체 검색의 OPENSEARCH_HEDGE_MAX_RATIO를 넘지 않도록 제한하여
+        클러스터가 느릴 때 부하를 두 배로 만드는 것을 막는다.
+        """
+        if self._stats["hedged"] >= self._stats["searches"] * settings.OPENSEARCH_HEDGE_MAX_RATIO:
+            return None
+        delay_ms = self.percentile(index_name, settings.OPENSEARCH_HEDGE_PERCENTILE)
+        if delay_ms is None:
+            return None
+        return max(delay_ms, settings.OPENSEARCH_HEDGE_MIN_DELAY_MS) / 1000
+    
+    def incr(self, name: str):
+        self._stats[name] += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "hedge_enabled": settings.OPENSEARCH_HEDGE_ENABLED,
+            "p50_ms": {index: self._format(self.percentile(index, 50)) for index in self._samples},
+            "p95_ms": {index: self._format(self.percentile(index, 95)) for index in self._samples},
+        }
+    
+    @staticmethod
+    def _format(value: Optional[float]) -> Optional[float]:
+        return round(value, 2) if value is not None else None
+
+
+class AsyncOpenSearchClient:
+    """요청 경로용 비동기 OpenSearch 클라이언트 래퍼 클래스
+
+    API 라우트에서는 이벤트 루프를 막지 않도록 이 클라이언트를 사용하고,
+    배치 스크립트는 동기 OpenSearchClient를 그대로 사용한다.
+    """
+    
+    def __init__(self):
+        self.client = None
+        self._batchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, MSearchBatcher]" = weakref.WeakKeyDictionary()
+        self._latency = SearchLatencyTracker()
+        self.connect()
+    
+    def connect(self):
+        """AsyncOpenSearch 클라이언트 생성 (실제 연결은 첫 요청 시 수립)"""
+        try:
+            self.client = AsyncOpenSearch(
+                **_connection_kwargs(),
+                maxsize=settings.OPENSEARCH_POOL_MAXSIZE,
+            )
+            logger.info(
+                f"Async OpenSearch client created "
+                f"(pool maxsize: {settings.OPENSEARCH_POOL_MAXSIZE})"
+            )
+        except Exception as e:
+            logger.error(f"Failed to create async OpenSearch client: {e}")
+            self.client = None
+    
+    async def is_connected(self) -> bool:
+        """OpenSearch 연결 상태 확인 (헬스 모니터가 확인한 적 없을 때만 live 호출)"""
+        cached = health_monitor.cached_status("opensearch")
+        if cached is not None:
+            return cached
+        return await self.ping()
+    
+    async def ping(self) -> bool:
+        """OpenSearch live 헬스 체크 (백그라운드 헬스 모니터에서 사용)"""
+        if not self.client:
+            return False
+        return await self.client.ping(request_timeout=settings.HEALTH_CHECK_TIMEOUT)
+    
+    async def _call(self, method, *args, **kwargs):
+        """서킷 브레이커를 거쳐 OpenSearch 호출
+
+        서킷이 열려 있으면 요청을 보내지 않고 CircuitOpenError로 즉시 실패한다.
+        """
+        if not opensearch_breaker.allow_request():
+            raise CircuitOpenError(opensearch_breaker.name)
+        try:
+            response = await method(*args, **kwargs)
+        except Exception as e:
+            if _is_dependency_failure(e):
+                opensearch_breaker.record_failure()
+            else:
+                opensearch_breaker.record_success()
+            raise
+        opensearch_breaker.record_success()
+        return response
+    
+    async def get_document(self, index_name: str, doc_id: str) -> Optional[Dict[str, Any]]:
+        """문서 조회"""
+        try:
+            if not self.client:
+                return None
+            
+            response = await self._call(self.client.get, index=index_name, id=doc_id)
+            return response.get('_source')
+        except CircuitOpenError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to get document {doc_id} from {index_name}: {e}")
+            return None
+    
+    async def mget_documents(
+        self,
+        index_name: str,
+        doc_ids: List[str],
+        source_profile: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """여러 문서를 _id로 한 번에 조회 (_mget, 없는 문서는 결과에서 제외)"""
+        try:
+            if not self.client or not doc_ids:
+                return {}
+            
+            params = {}
+            if source_profile is not None:
+                if source_profile not in SOURCE_PROFILES:
+                    raise ValueError(f"Unknown _source profile: {source_profile}")
+                profile = SOURCE_PROFILES[source_profile]
+                if "includes" in profile:
+                    params["_source_includes"] = ",".join(profile["includes"])
+                if "excludes" in profile:
+                    params["_source_excludes"] = ",".join(profile["excludes"])
+            
+            response = await self._call(
+                self.client.mget, body={"ids": list(doc_ids)}, index=index_name, params=params
+            )
+            documents = {}
+            for doc in response.get('docs', []):
+                if doc.get('found'):
+                    source = doc.get('_source', {})
+                    source['_id'] = doc.get('_id')
+                    documents[doc.get('_id')] = source
+            return documents
+        except CircuitOpenError:
+            return {}
+        except Exception as e:
+            logger.error(f"Failed to mget {len(doc_ids)} documents from {index_name}: {e}")
+            return {}
+    
+    async def search(
+        self,
+        index_name: str,
+        query: Dict[str, Any],
+        size: int = 10,
+        source_profile: Optional[str] = None,
+        deadline_ms: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """문서 검색 (source_profile 지정 시 SOURCE_PROFILES의 _source 프로젝션 적용)"""
+        try:
+            if not self.client:
+                return []
+            
+            response = await self._search_raw(
+                index_name, _with_source_profile(_with_size(query, size), source_profile), deadline_ms
+            )
+            return _hits_to_documents(response)
+        except CircuitOpenError:
+            return []
+        except (asyncio.TimeoutError, ConnectionTimeout):
+            logger.warning(f"Search in {index_name} exceeded deadline of {deadline_ms}ms")
+            return []
+        except Exception as e:
+            logger.error(f"Failed to search in {index_name}: {e}")
+            return []
+    
+    async def search_with_meta(
+        self,
+        index_name: str,
+        query: Dict[str, Any],
+        size: int = 10,
+        track_total_hits: Optional[Union[bool, int]] = None,
+        source_profile: Optional[str] = None,
+        deadline_ms: Optional[float] = None,
+        hedge: bool = False,
+    ) -> Dict[str, Any]:
+        """문서 검색 (hits, total, aggregations, took을 한 번의 요청으로 반환)
+
+        track_total_hits를 지정하지 않으면 OPENSEARCH_TRACK_TOTAL_HITS 상한까지만
+        정확한 전체 건수를 계산한다. 별도의 _count 호출은 필요 없다.
+        
+        deadline_ms를 지정하면 서버 측 timeout과 클라이언트 대기 시간에 모두 적용되며,
+        시간 안에 끝나지 않으면 예외 대신 timed_out=True인 (부분) 결과를 반환한다.
+        hedge=True이고 OPENSEARCH_HEDGE_ENABLED이면 느린 요청에 중복 요청을 보낸다.
+        """
+        try:
+            if not self.client:
+                return _empty_search_envelope()
+            
+            # 호출자의 쿼리(캐시/재사용될 수 있음)를 변경하지 않도록 복사본에 기본값 지정
+            body = dict(_with_source_profile(_with_size(query, size), source_profile))
+            body.setdefault(
+                "track_total_hits",
+                settings.OPENSEARCH_TRACK_TOTAL_HITS if track_total_hits is None else track_total_hits
+            )
+            response = await self._search_raw(index_name, body, deadline_ms, hedge)
+            return _to_search_envelope(response)
+        except CircuitOpenError:
+            return _empty_search_envelope()
+        except (asyncio.TimeoutError, ConnectionTimeout):
+            logger.warning(f"Search in {index_name} exceeded deadline of {deadline_ms}ms")
+            return _timed_out_envelope()
+        except Exception as e:
+            logger.error(f"Failed to search in {index_name}: {e}")
+            return _empty_search_envelope()
+    
+    async def create_pit(self, index_name: str, keep_alive: str) -> Optional[str]:
+        """point-in-time 생성 후 pit_id 반환"""
+        try:
+            if not self.client:
+                return None
+            
+            response = await self._call(self.client.create_pit, index=index_name, params={"keep_alive": keep_alive})
+            return response.get('pit_id')
+        except Exception as e:
+            logger.error(f"Failed to create PIT on {index_name}: {e}")
+            return None
+    
+    async def delete_pit(self, pit_id: str) -> bool:
+        """point-in-time 삭제"""
+        try:
+            if not self.client:
+                return False
+            
+            await self._call(self.client.delete_pit, body={"pit_id": [pit_id]})
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to delete PIT: {e}")
+            return False
+    
+    async def search_pit(
+        self,
+        pit_id: str,
+        keep_alive: str,
+        query: Dict[str, Any],
+        search_after: Optional[List[Any]] = None,
+        source_profile: Optional[str] = None,
+        deadline_ms: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """point-in-time 기반 search_after 검색
+
+        PIT 검색은 인덱스를 지정하지 않으므로 _msearch 배처를 거치지 않는다.
+        응답 봉투의 pit_id는 갱신된 값일 수 있으므로 다음 페이지에 그대로 사용한다.
+        실패 시 예외를 그대로 전달하여 호출자가 PIT 없이 재시도할 수 있게 한다.
+        """
+        body = dict(_with_deadline(_with_source_profile(query, source_profile), deadline_ms))
+        body["pit"] = {"id": pit_id, "keep_alive": keep_alive}
+        if search_after:
+            body["search_after"] = search_after
+        
+        request = self._call(self.client.search, body=body)
+        response = await (asyncio.wait_for(request, deadline_ms / 1000) if deadline_ms else request)
+        envelope = _to_search_envelope(response)
+        envelope["pit_id"] = response.get('pit_id', pit_id)
+        return envelope
+    
+    def msearch_batcher(self) -> MSearchBatcher:
+        """현재 이벤트 루프의 _msearch 배처 반환 (없으면 생성)"""
+        loop = asyncio.get_running_loop()
+        batcher = self._batchers.get(loop)
+        if batcher is None:
+            batcher = MSearchBatcher(
+                self.client,
+                window_ms=settings.OPENSEARCH_MSEARCH_WINDOW_MS,
+                max_batch_size=settings.OPENSEARCH_MSEARCH_MAX_BATCH,
+            )
+            self._batchers[loop] = batcher
+        return batcher
+    
+    def msearch_stats(self) -> Dict[str, Any]:
+        """이벤트 루프별 _msearch 배처 통계"""
+        return {
+            "enabled": settings.OPENSEARCH_MSEARCH_ENABLED,
+            "window_ms": settings.OPENSEARCH_MSEARCH_WINDOW_MS,
+            "batchers": [batcher.stats() for batcher in list(self._batchers.values())],
+        }
+    
+    def latency_stats(self) -> Dict[str, Any]:
+        """인덱스별 검색 지연 시간 백분위와 헤징/deadline 초과 통계"""
+        return self._latency.stats()
+    
+    async def _search_raw(
+        self,
+        index_name: str,
+        body: Dict[str, Any],
+        deadline_ms: Optional[float] = None,
+        hedge: bool = False,
+    ) -> Dict[str, Any]:
+        """검색 실행 (deadline 적용, 설정에 따라 헤징)
+
+        deadline을 넘기면 asyncio.TimeoutError가 발생하며, 진행 중인 요청은 취소된다.
+        """
+        body = _with_deadline(body, deadline_ms)
+        timeout = deadline_ms / 1000 if deadline_ms else None
+        
+        if hedge and settings.OPENSEARCH_HEDGE_ENABLED:
+            request = self._hedged_search(index_name, body, timeout)
+        else:
+            request = self._search_once(index_name, body)
+        
+        self._latency.incr("searches")
+        start = time.perf_counter()
+        try:
+            response = await (asyncio.wait_for(request, timeout) if timeout else request)
+        except asyncio.TimeoutError:
+            self._latency.incr("timeouts")
+            raise
+        self._latency.record(index_name, (time.perf_counter() - start) * 1000)
+        return response
+    
+    async def _search_once(self, index_name: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """검색 1회 실행 (설정에 따라 _msearch 배처 경유)"""
+        if settings.OPENSEARCH_MSEARCH_ENABLED:
+            return await self._call(self.msearch_batcher().search, index_name, body)
+        return await self._call(self.client.search, index=index_name, body=body)
+    
+    async def _hedged_search(self, index_name: str, body: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
+        """최근 p95 지연 시간 안에 응답이 없으면 다른 샤드 복제본으로 중복 요청을 보내고 먼저 온 응답 사용
+
+        중복 요청은 커넥션 풀의 다음 노드로 직접 전송되며, 임의의 preference 값으로
+        기본 요청과 다른 샤드 복제본이 선택되도록 한다. 늦게 끝난 요청은 취소한다.
+        """
+        tasks = [asyncio.ensure_future(self._search_once(index_name, body))]
+        tasks[0].add_done_callback(_retrieve_exception)
+        try:
+            delay = self._latency.hedge_delay(index_name)
+            if delay is None:
+                return await tasks[0]
+            
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return tasks[0].result()
+            
+            self._latency.incr("hedged")
+            hedge_kwargs = {"request_timeout": timeout} if timeout else {}
+            hedge_task = asyncio.ensure_future(self._call(
+                self.client.search, index=index_name, body=body,
+                preference=f"hedge-{uuid.uuid4().hex[:8]}", **hedge_kwargs
+            ))
+            hedge_task.add_done_callback(_retrieve_exception)
+            tasks.append(hedge_task)
+            
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge_task:
+                            self._latency.incr("hedge_wins")
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    async def close(self):
+        """커넥션 풀 정리"""
+        if self.client:
+            await self.client.close()
+
+
+class OpenSearchWriteBuffer:
+    """단건 쓰기를 모아 bulk 요청으로 전송하는 프로세스 내 쓰기 버퍼
+
+    같은 인덱스/_id에 대한 쓰기는 하나로 합쳐진다. update는 이전 문서에 병합되고,
+    index/delete는 이전 쓰기를 덮어쓴다. max_docs개가 쌓이거나 flush_interval초가
+    지나면 전송하며, 종료 시 close()로 남은 쓰기를 비운다.
+    """
+    
+    def __init__(
+        self,
+        client: "AsyncOpenSearchClient",
+        max_docs: int = 500,
+        flush_interval: float = 1.0,
+        refresh: Optional[RefreshPolicy] = None,
+    ):
+        self._client = client
+        self._max_docs = max_docs
+        self._flush_interval = flush_interval
+        self._refresh = resolve_refresh_policy(refresh)
+        self._ops: Dict[Tuple[str, str], Tuple[str, Optional[Dict[str, Any]]]] = {}
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {
+            "buffered": 0,
+            "coalesced": 0,
+            "flushed": 0,
+            "failed": 0,
+            "bulk_requests": 0,
+        }
+    
+    def start(self):
+        """주기적 flush 태스크 시작"""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def index(self, index_name: str, doc_id: str, document: Dict[str, Any]):
+        """문서 전체 인덱싱 예약"""
+        await self._add(index_name, doc_id, ("index", document))
+    
+    async def update(self, index_name: str, doc_id: str, document: Dict[str, Any]):
+        """부분 업데이트 예약 (같은 _id의 이전 쓰기에 병합)"""
+        await self._add(index_name, doc_id, ("update", document))
+    
+    async def delete(self, index_name: str, doc_id: str):
+        """문서 삭제 예약"""
+        await self._add(index_name, doc_id, ("delete", None))
+    
+    async def _add(self, index_name: str, doc_id: str, op: Tuple[str, Optional[Dict[str, Any]]]):
+        key = (index_name, str(doc_id))
+        self.stats["buffered"] += 1
+        if key in self._ops:
+            self.stats["coalesced"] += 1
+            op = _merge_write_ops(self._ops[key], op)
+        self._ops[key] = op
+        
+        if len(self._ops) >= self._max_docs:
+            await self.flush()
+    
+    async def flush(self) -> int:
+        """버퍼에 쌓인 쓰기를 bulk 요청으로 전송하고 성공 건수 반환"""
+        async with self._lock:
+            if not self._ops or not self._client.client:
+                return 0
+            
+            batch = self._ops
+            self._ops = {}
+            keys = list(batch.keys())
+            
+            lines = []
+            for index_name, doc_id in keys:
+                op_type, document = batch[(index_name, doc_id)]
+                lines.append({op_type: {"_index": index_name, "_id": doc_id}})
+                if op_type == "update":
+                    lines.append({"doc": document})
+                elif op_type == "index":
+                    lines.append(document)
+            
+            self.stats["bulk_requests"] += 1
+            try:
+                response = await self._client.client.bulk(body=lines, refresh=self._refresh)
+            except Exception as e:
+                logger.error(f"Write buffer flush failed, requeueing {len(keys)} writes: {e}")
+                self._requeue(batch, keys)
+                return 0
+            
+            succeeded = 0
+            retry = []
+            for key, item in zip(keys, response.get('items', [])):
+                op_result = next(iter(item.values()))
+                error = op_result.get('error')
+                if not error:
+                    succeeded += 1
+                elif op_result.get('status') in BULK_RETRY_STATUSES:
+                    retry.append(key)
+                else:
+                    self.stats["failed"] += 1
+                    logger.error(f"Buffered write failed for {key}: {error}")
+            
+            if retry:
+                logger.warning(f"Write buffer requeueing {len(retry)} rejected writes")
+                self._requeue(batch, retry)
+            
+            self.stats["flushed"] += succeeded
+            return succeeded
+    
+    def _requeue(self, batch: Dict[Tuple[str, str], Tuple[str, Optional[Dict[str, Any]]]], keys: List[Tuple[str, str]]):
+        """전송 실패한 쓰기를 되돌림 (그 사이 들어온 쓰기가 뒤에 적용되도록 병합)"""
+        for key in keys:
+            if key in self._ops:
+                self._ops[key] = _merge_write_ops(batch[key], self._ops[key])
+            else:
+                self._ops[key] = batch[key]
+    
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Periodic write buffer flush failed: {e}")
+    
+    async def close(self):
+        """주기적 flush 중단 후 남은 쓰기 전송 (종료 훅)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+def _merge_write_ops(
+    previous: Tuple[str, Optional[Dict[str, Any]]],
+    current: Tuple[str, Optional[Dict[str, Any]]],
+) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """같은 _id에 대한 연속된 쓰기를 하나로 병합"""
+    prev_type, prev_doc = previous
+    op_type, document = current
+    if op_type == "update" and prev_type in ("index", "update"):
+        return prev_type, {**prev_doc, **document}
+    return current
+
 
 # 전역 OpenSearch 클라이언트 인스턴스
 opensearch_client = OpenSearchClient()
+async_opensearch_client = AsyncOpenSearchClient()
 
 def get_opensearch_client() -> OpenSearchClient:
-    """OpenSearch 클라이언트 인스턴스 반환"""
-    return opensearch_client 
\ No newline at end of file
+    """OpenSearch 클라이언트 인스턴스 반환 (스크립트/동기 코드용)"""
+    return opensearch_client
+
+def get_async_opensearch_client() -> AsyncOpenSearchClient:
+    """비동기 OpenSearch 클라이언트 인스턴스 반환 (API 라우트용)"""
+    return async_opensearch_client
+
+# 쓰기 버퍼 (OPENSEARCH_WRITE_BUFFER_ENABLED일 때 startup에서 생성)
+_write_buffer: Optional[OpenSearchWriteBuffer] = None
+
+def start_write_buffer() -> Optional[OpenSearchWriteBuffer]:
+    """쓰기 버퍼 생성 및 주기적 flush 시작 (이벤트 루프 안에서 호출)"""
+    global _write_buffer
+    if settings.OPENSEARCH_WRITE_BUFFER_ENABLED and _write_buffer is None:
+        _write_buffer = OpenSearchWriteBuffer(
+            async_opensearch_client,
+            max_docs=settings.OPENSEARCH_WRITE_BUFFER_MAX_DOCS,
+            flush_interval=settings.OPENSEARCH_WRITE_BUFFER_FLUSH_INTERVAL,
+        )
+        _write_buffer.start()
+    return _write_buffer
+
+def get_write_buffer() -> Optional[OpenSearchWriteBuffer]:
+    """쓰기 버퍼 인스턴스 반환 (비활성화 시 None)"""
+    return _write_buffer
+
+async def close_write_buffer():
+    """남은 쓰기를 flush하고 버퍼 종료 (shutdown 훅)"""
+    global _write_buffer
+    if _write_buffer is not None:
+        await _write_buffer.close()
+        _write_buffer = None 
\ No newline at end of file
@@ -0,0 +1,165 @@
+import asyncio
+import hashlib
+import time
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional, Any, Dict, List, Callable, Awaitable, Type, Union, Tuple, Set
+
+import orjson
+from fastapi import Header
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.health import redis_breaker
+from loguru import logger
+
+
+# 검색 결과 캐시 키 접두사 (L1 대상: CACHE_L1_PREFIXES)
+QUERY_CACHE_PREFIX = "qcache"
+
+# 검색 요청 로그 키 접두사 (qlog:{endpoint}:{시간 버킷} sorted set)
+QUERY_LOG_PREFIX = "qlog"
+
+
+def normalize_text(value: Optional[str]) -> Optional[str]:
+    """검색어 정규화: 앞뒤 공백 제거, 연속 공백 축약, 소문자화"""
+    if value is None:
+        return None
+    return " ".join(value.split()).lower() or None
+
+
+def normalize_keyword(value: Optional[str]) -> Optional[str]:
+    """필터 값 정규화: 앞뒤 공백만 제거 (keyword 필드는 대소문자를 구분하므로 유지)"""
+    if value is None:
+        return None
+    return value.strip() or None
+
+
+def normalize_tags(tags: Optional[List[str]]) -> Optional[List[str]]:
+    """태그 정규화: 공백 제거, 중복 제거 후 정렬"""
+    if not tags:
+        return None
+    return sorted({tag.strip() for tag in tags if tag and tag.strip()}) or None
+
+
+def round_price(price: Optional[Decimal]) -> Optional[Decimal]:
+    """가격 필터를 QUERY_CACHE_PRICE_STEP 단위로 반올림"""
+    if price is None:
+        return None
+    step = Decimal(settings.QUERY_CACHE_PRICE_STEP)
+    return (Decimal(price) / step).quantize(Decimal(1), rounding=ROUND_HALF_UP) * step
+
+
+def canonical_params(params: Dict[str, Any]) -> bytes:
+    """None을 제외하고 키를 정렬한 파라미터 직렬화"""
+    canonical = {name: value for name, value in params.items() if value is not None}
+    return orjson.dumps(canonical, option=orjson.OPT_SORT_KEYS, default=str)
+
+
+def query_cache_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """정규화된 파라미터의 정렬된 직렬화 해시로 캐시 키 생성"""
+    digest = hashlib.sha1(canonical_params(params)).hexdigest()[:20]
+    return f"{QUERY_CACHE_PREFIX}:{endpoint}:{digest}"
+
+
+class QueryLog:
+    """엔드포인트별 검색 요청 빈도 로그 (캐시 워머가 자주 쓰는 검색을 고르는 데 사용)
+
+    정규화된 파라미터 직렬화 값을 시간 단위 sorted set에 ZINCRBY로 집계하고
+    retention_hours가 지난 버킷은 만료된다. 요청 경로를 막지 않도록 백그라운드로 기록한다.
+    """
+
+    def __init__(self, retention_hours: int = 24):
+        self.retention_hours = retention_hours
+        self._tasks: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def _bucket_key(endpoint: str, hour: int) -> str:
+        return f"{QUERY_LOG_PREFIX}:{endpoint}:{hour}"
+
+    def record(self, redis_client, endpoint: str, params: Dict[str, Any]):
+        """검색 요청 1건 기록 예약"""
+        if redis_client is None or redis_client.client is None or redis_breaker.is_open:
+            return
+        task = asyncio.get_running_loop().create_task(self._record(redis_client, endpoint, canonical_params(params)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _record(self, redis_client, endpoint: str, member: bytes):
+        bucket = self._bucket_key(endpoint, int(time.time() // 3600))
+        try:
+            async with redis_client.client.pipeline(transaction=False) as pipe:
+                pipe.zincrby(bucket, 1, member)
+                pipe.expire(bucket, (self.retention_hours + 1) * 3600)
+                await pipe.execute()
+        except Exception as e:
+            logger.debug(f"Failed to record query log for {endpoint}: {e}")
+
+    async def top(self, redis_client, endpoint: str, limit: int) -> List[Tuple[Dict[str, Any], float]]:
+        """보관 기간 내 요청 수 상위 (파라미터, 요청 수) 목록"""
+        current = int(time.time() // 3600)
+        buckets = [self._bucket_key(endpoint, hour) for hour in range(current - self.retention_hours + 1, current + 1)]
+        try:
+            entries = await redis_client.client.zunion(buckets, withscores=True)
+        except Exception as e:
+            logger.warning(f"Failed to read query log for {endpoint}: {e}")
+            return []
+
+        entries = sorted(entries, key=lambda entry: entry[1], reverse=True)[:limit]
+        return [(orjson.loads(member), score) for member, score in entries]
+
+
+def cache_bypass_requested(
+    cache_control: Optional[str] = Header(None),
+    x_cache_bypass: Optional[str] = Header(None),
+) -> bool:
+    """캐시 우회 요청 여부 (Cache-Control: no-cache 또는 X-Cache-Bypass: 1)
+
+    우회 시 캐시를 읽지 않고 새로 계산한 결과로 캐시를 갱신한다.
+    """
+    if cache_control and "no-cache" in cache_control.lower():
+        return True
+    return (x_cache_bypass or "").strip().lower() in ("1", "true", "yes")
+
+
+async def cached_query(
+    redis_client,
+    endpoint: str,
+    params: Dict[str, Any],
+    loader: Callable[[], Awaitable[Any]],
+    ttl: int,
+    model: Optional[Type[BaseModel]] = None,
+    bypass: bool = False,
+    cacheable: Optional[Callable[[Any], bool]] = None,
+    tags: Optional[Union[List[str], Callable[[Any], List[str]]]] = None,
+) -> Any:
+    """정규화된 검색 파라미터 기준 결과 캐시
+
+    ttl이 지난 뒤에도 같은 시간 동안은 이전 결과를 응답하며 백그라운드에서 갱신한다.
+    tags를 지정하면 해당 태그 무효화 시 함께 삭제된다.
+    """
+    # 캐시 우회 요청(캐시 워머 재계산 포함)은 검색 빈도에 집계하지 않음
+    if settings.QUERY_LOG_ENABLED and not bypass:
+        query_log.record(redis_client, endpoint, params)
+
+    if not settings.QUERY_CACHE_ENABLED or ttl <= 0:
+        return await loader()
+
+    return await redis_client.get_or_compute(
+        query_cache_key(endpoint, params),
+        loader,
+        ttl=ttl,
+        stale_ttl=ttl,
+        model=model,
+        cacheable=cacheable,
+        force_refresh=bypass,
+        tags=tags,
+    )
+
+
+# 전역 검색 요청 로그 인스턴스
+query_log = QueryLog(retention_hours=settings.QUERY_LOG_RETENTION_HOURS)
+
+
+def get_query_log() -> QueryLog:
+    """검색 요청 로그 인스턴스 반환"""
+    return query_log
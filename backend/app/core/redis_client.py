@@ -1,30 +1,137 @@
 import redis
-from typing import Optional, Any
+import redis.asyncio as aioredis
+from typing import Optional, Any, List, Union, Callable, Awaitable, Dict, Set, Tuple, Type
+import asyncio
 import json
+import math
+import random
+import time
+import uuid
 from app.core.config import settings
+from app.core.health import redis_breaker, health_monitor
+from app.core.local_cache import LocalCache, CacheStats
+from app.core.cache_codec import cache_codec
+from pydantic import BaseModel
 from loguru import logger
 
+
+def _connection_kwargs() -> dict:
+    """동기/비동기 클라이언트 공통 연결 설정"""
+    return {
+        "host": settings.REDIS_HOST,
+        "port": settings.REDIS_PORT,
+        "password": settings.REDIS_PASSWORD,
+        "db": settings.REDIS_DB,
+        "decode_responses": False,  # 값은 cache_codec 바이너리 형식
+        "socket_connect_timeout": 5,
+        "socket_timeout": 5,
+        "retry_on_timeout": True,
+        "health_check_interval": settings.REDIS_HEALTH_CHECK_INTERVAL,
+    }
+
+
+def _l1_prefixes() -> tuple:
+    """L1 캐시 대상 키 접두사"""
+    return tuple(prefix for prefix in settings.CACHE_L1_PREFIXES.split(",") if prefix)
+
+
+# 잠금 소유자만 해제하도록 토큰을 비교한 뒤 삭제
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# 태그별 의존 키 집합 (Redis set) 접두사
+TAG_KEY_PREFIX = "tag:"
+
+
+def cache_tags(
+    product_no: Optional[Any] = None,
+    brand: Optional[str] = None,
+    category: Optional[str] = None,
+    category_id: Optional[Any] = None,
+) -> List[str]:
+    """캐시 의존성 태그 목록 (값이 없는 항목은 제외)"""
+    tags = []
+    if product_no is not None:
+        tags.append(f"product:{product_no}")
+    if brand:
+        tags.append(f"brand:{brand}")
+    if category:
+        tags.append(f"category:{category}")
+    if category_id is not None:
+        tags.append(f"category_id:{category_id}")
+    return tags
+
+
+def _register_tags(pipe, key: str, tags: List[str], ex: Optional[int]):
+    """파이프라인에 태그 집합 등록 명령 추가
+    
+    태그 집합은 등록된 키 중 가장 늦게 만료되는 키보다 먼저 만료되지 않도록
+    새 집합이면 TTL을 설정하고(NX), 기존 집합이면 더 길 때만 연장한다(GT).
+    """
+    for tag in tags:
+        tag_key = f"{TAG_KEY_PREFIX}{tag}"
+        pipe.sadd(tag_key, key)
+        if ex:
+            pipe.expire(tag_key, ex, nx=True)
+            pipe.expire(tag_key, ex, gt=True)
+
+
+def _tag_members(members: List[Set[bytes]]) -> List[str]:
+    keys = set()
+    for values in members:
+        keys.update(value.decode("utf-8") if isinstance(value, bytes) else value for value in values)
+    return sorted(keys)
+
+
+def _record_error(error: Exception):
+    """연결/타임아웃 오류만 서킷 브레이커 실패로 집계"""
+    if isinstance(error, (redis.ConnectionError, redis.TimeoutError)):
+        redis_breaker.record_failure()
+    else:
+        redis_breaker.record_success()
+
+
+def _as_model(value: Any, model: Optional[Type[BaseModel]]) -> Any:
+    """model 지정 시 dict 값을 pydantic 모델로 복원"""
+    if model is not None and isinstance(value, dict):
+        return model.model_validate(value)
+    return value
+
+
+def _envelope(value: Any, ttl: int, elapsed: float) -> Dict[str, Any]:
+    """get_or_compute 저장 형식 {"v": 값, "t": 신선 만료 시각, "d": 계산 소요 시간}"""
+    return {"v": value, "t": time.time() + ttl, "d": elapsed}
+
+
+def _is_envelope(entry: Any) -> bool:
+    return isinstance(entry, dict) and "v" in entry and "t" in entry
+
+
+def _invalidation_message(origin: str, keys: Union[List[str], str]) -> str:
+    return json.dumps({"origin": origin, "keys": keys})
+
+
 class RedisClient:
-    """Redis 클라이언트 래퍼 클래스"""
+    """Redis 클라이언트 래퍼 클래스 (동기, 배치 스크립트용)
+    
+    API 라우트에서는 이벤트 루프를 막지 않도록 AsyncRedisClient를 사용한다.
+    L1 대상 키를 쓰거나 지우면 무효화 메시지를 발행하여 API 워커의 L1에서도 제거되게 한다.
+    """
     
     def __init__(self):
         self.client = None
+        self._l1_prefixes = _l1_prefixes()
+        self._instance_id = uuid.uuid4().hex
         self.connect()
     
     def connect(self):
         """Redis 서버에 연결"""
         try:
-            self.client = redis.Redis(
-                host=settings.REDIS_HOST,
-                port=settings.REDIS_PORT,
-                password=settings.REDIS_PASSWORD,
-                db=settings.REDIS_DB,
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5,
-                retry_on_timeout=True,
-                health_check_interval=30,
-            )
+            self.client = redis.Redis(**_connection_kwargs())
             # 연결 테스트
             self.client.ping()
             logger.info(f"Redis connected successfully to {settings.REDIS_HOST}:{settings.REDIS_PORT}")
@@ -42,69 +149,163 @@ class RedisClient:
             pass
         return False
     
-    def set(self, key: str, value: Any, ex: Optional[int] = None) -> bool:
-        """값을 Redis에 저장"""
+    def _available(self) -> bool:
+        """클라이언트가 있고 서킷이 호출을 허용하는지 여부"""
+        return self.client is not None and redis_breaker.allow_request()
+    
+    def _publish_invalidation(self, keys: Union[List[str], str]):
+        """L1 대상 키 무효화 메시지 발행"""
+        if keys != "*":
+            keys = [key for key in keys if key.startswith(self._l1_prefixes)] if self._l1_prefixes else []
+            if not keys:
+                return
         try:
-            if not self.client:
+            self.client.publish(settings.CACHE_INVALIDATION_CHANNEL, _invalidation_message(self._instance_id, keys))
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidation: {e}")
+    
+    def set(self, key: str, value: Any, ex: Optional[int] = None, tags: Optional[List[str]] = None) -> bool:
+        """값을 Redis에 저장 (tags 지정 시 태그별 의존 키 집합에 함께 등록)"""
+        try:
+            if not self._available():
                 return False
             
-            if isinstance(value, (dict, list)):
-                value = json.dumps(value)
-            
-            return self.client.set(key, value, ex=ex)
+            if tags:
+                pipe = self.client.pipeline(transaction=False)
+                pipe.set(key, cache_codec.encode(value), ex=ex)
+                _register_tags(pipe, key, tags, ex)
+                result = pipe.execute()[0]
+            else:
+                result = self.client.set(key, cache_codec.encode(value), ex=ex)
+            redis_breaker.record_success()
+            self._publish_invalidation([key])
+            return result
         except Exception as e:
+            _record_error(e)
             logger.error(f"Failed to set key {key}: {e}")
             return False
     
-    def get(self, key: str) -> Optional[Any]:
-        """Redis에서 값을 가져오기"""
+    def get(self, key: str, model: Optional[Type[BaseModel]] = None) -> Optional[Any]:
+        """Redis에서 값을 가져오기 (model 지정 시 해당 pydantic 모델로 복원)"""
         try:
-            if not self.client:
+            if not self._available():
                 return None
             
             value = self.client.get(key)
-            if value is None:
-                return None
-            
-            # JSON 파싱 시도
-            try:
-                return json.loads(value)
-            except:
-                return value
+            redis_breaker.record_success()
+            return cache_codec.decode(value, model)
         except Exception as e:
+            _record_error(e)
             logger.error(f"Failed to get key {key}: {e}")
             return None
     
+    def get_many(self, keys: List[str], model: Optional[Type[BaseModel]] = None) -> Dict[str, Any]:
+        """여러 키를 MGET 한 번으로 조회 (없는 키는 결과에서 제외)"""
+        if not keys:
+            return {}
+        try:
+            if not self._available():
+                return {}
+            
+            values = self.client.mget(keys)
+            redis_breaker.record_success()
+            return {
+                key: cache_codec.decode(value, model)
+                for key, value in zip(keys, values) if value is not None
+            }
+        except Exception as e:
+            _record_error(e)
+            logger.error(f"Failed to get {len(keys)} keys: {e}")
+            return {}
+    
+    def set_many(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """여러 값을 파이프라인 한 번으로 저장 (ttl 지정 시 SETEX)"""
+        if not mapping:
+            return True
+        try:
+            if not self._available():
+                return False
+            
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.set(key, cache_codec.encode(value), ex=ttl)
+            pipe.execute()
+            redis_breaker.record_success()
+            self._publish_invalidation(list(mapping))
+            return True
+        except Exception as e:
+            _record_error(e)
+            logger.error(f"Failed to set {len(mapping)} keys: {e}")
+            return False
+    
     def delete(self, key: str) -> bool:
         """Redis에서 키 삭제"""
         try:
-            if not self.client:
+            if not self._available():
                 return False
             
-            return bool(self.client.delete(key))
+            result = bool(self.client.delete(key))
+            redis_breaker.record_success()
+            self._publish_invalidation([key])
+            return result
         except Exception as e:
+            _record_error(e)
             logger.error(f"Failed to delete key {key}: {e}")
             return False
     
+    def invalidate_tags(self, tags: List[str]) -> int:
+        """태그에 등록된 모든 키를 삭제하고 삭제 대상 키 수 반환 (AsyncRedisClient.invalidate_tags 참고)"""
+        if not tags:
+            return 0
+        try:
+            if not self._available():
+                return 0
+            
+            tag_keys = [f"{TAG_KEY_PREFIX}{tag}" for tag in tags]
+            pipe = self.client.pipeline(transaction=True)
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            pipe.delete(*tag_keys)
+            keys = _tag_members(pipe.execute()[:-1])
+            
+            if keys:
+                pipe = self.client.pipeline(transaction=False)
+                for start in range(0, len(keys), 500):
+                    pipe.delete(*keys[start:start + 500])
+                pipe.execute()
+            redis_breaker.record_success()
+            self._publish_invalidation(keys)
+            return len(keys)
+        except Exception as e:
+            _record_error(e)
+            logger.error(f"Failed to invalidate tags {tags}: {e}")
+            return 0
+    
     def exists(self, key: str) -> bool:
         """키의 존재 여부 확인"""
         try:
-            if not self.client:
+            if not self._available():
                 return False
             
-            return bool(self.client.exists(key))
+            result = bool(self.client.exists(key))
+            redis_breaker.record_success()
+            return result
         except Exception as e:
+            _record_error(e)
             logger.error(f"Failed to check key {key}: {e}")
             return False
     
     def expire(self, key: str, seconds: int) -> bool:
         """키의 만료 시간 설정"""
         try:
-            if not self.client:
+            if not self._available():
                 return False
             
-            return self.client.expire(key, seconds)
+            result = self.client.expire(key, seconds)
+            redis_breaker.record_success()
+            return result
         except Exception as e:
+            _record_error(e)
             logger.error(f"Failed to set expire for key {key}: {e}")
             return False
     
@@ -115,14 +316,674 @@ class RedisClient:
                 return False
             
             self.client.flushdb()
+            self._publish_invalidation("*")
             return True
         except Exception as e:
             logger.error(f"Failed to flush db: {e}")
             return False
 
-# 전역 Redis 클라이언트 인스턴스
-redis_client = RedisClient()
 
-def get_redis_client() -> RedisClient:
-    """Redis 클라이언트 인스턴스 반환"""
-    return redis_client 
\ No newline at end of file
+class AsyncRedisClient:
+    """요청 경로용 비동기 Redis 클라이언트 래퍼 클래스
+    
+    명시적인 커넥션 풀(BlockingConnectionPool)을 사용하여 최대 연결 수를 제한하고,
+    풀이 가득 차면 REDIS_POOL_TIMEOUT까지 기다린다. 실제 연결은 첫 요청 시 수립한다.
+    핫 키는 프로세스 내 L1 캐시에 두고 pub/sub 무효화 메시지로 워커 간 일관성을 맞춘다.
+    """
+    
+    def __init__(self):
+        self.pool = None
+        self.client = None
+        self.local_cache: Optional[LocalCache] = None
+        self.cache_stats = CacheStats()
+        self._l1_prefixes = _l1_prefixes()
+        self._instance_id = uuid.uuid4().hex
+        self._pubsub = None
+        self._pubsub_task: Optional[asyncio.Task] = None
+        self._computing: Dict[str, asyncio.Future] = {}  # 프로세스 내 single-flight
+        self._refreshing: Set[str] = set()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self.connect()
+    
+    def connect(self):
+        """커넥션 풀과 redis.asyncio 클라이언트 생성"""
+        try:
+            self.pool = aioredis.BlockingConnectionPool(
+                max_connections=settings.REDIS_POOL_MAX_CONNECTIONS,
+                timeout=settings.REDIS_POOL_TIMEOUT,
+                **_connection_kwargs(),
+            )
+            self.client = aioredis.Redis(connection_pool=self.pool)
+            logger.info(
+                f"Async Redis client created for {settings.REDIS_HOST}:{settings.REDIS_PORT} "
+                f"(pool max connections: {settings.REDIS_POOL_MAX_CONNECTIONS})"
+            )
+        except Exception as e:
+            logger.error(f"Failed to create async Redis client: {e}")
+            self.pool = None
+            self.client = None
+    
+    async def is_connected(self) -> bool:
+        """Redis 연결 상태 확인 (헬스 모니터가 확인한 적 없을 때만 live 호출)"""
+        cached = health_monitor.cached_status("redis")
+        if cached is not None:
+            return cached
+        return await self.ping()
+    
+    async def ping(self) -> bool:
+        """Redis live 헬스 체크 (백그라운드 헬스 모니터에서 사용)"""
+        try:
+            if self.client:
+                await self.client.ping()
+                return True
+        except:
+            pass
+        return False
+    
+    def _available(self) -> bool:
+        """클라이언트가 있고 서킷이 호출을 허용하는지 여부 (open이면 즉시 캐시 miss로 처리)"""
+        return self.client is not None and redis_breaker.allow_request()
+    
+    def _l1_eligible(self, key: str) -> bool:
+        return key.startswith(self._l1_prefixes) if self._l1_prefixes else False
+    
+    async def enable_local_cache(self) -> bool:
+        """프로세스 내 L1 캐시 활성화 및 pub/sub 무효화 구독 시작 (API 서버 시작 시 호출)
+        
+        다른 워커의 쓰기를 무효화 메시지로 받아야 하므로 구독에 실패하면 L1을 켜지 않는다.
+        """
+        if not settings.CACHE_L1_ENABLED or not self._l1_prefixes:
+            return False
+        if self.local_cache is not None:
+            return True
+        if not self.client:
+            logger.warning("Redis client not available, local cache disabled")
+            return False
+        
+        try:
+            self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            await self._pubsub.subscribe(**{settings.CACHE_INVALIDATION_CHANNEL: self._on_invalidation})
+            self._pubsub_task = asyncio.get_running_loop().create_task(
+                self._pubsub.run(exception_handler=self._on_pubsub_error, poll_timeout=1.0)
+            )
+        except Exception as e:
+            logger.error(f"Failed to subscribe to cache invalidation channel: {e}")
+            self._pubsub = None
+            return False
+        
+        self.local_cache = LocalCache(max_entries=settings.CACHE_L1_MAX_ENTRIES, ttl=settings.CACHE_L1_TTL)
+        logger.info(
+            f"Local cache enabled for {', '.join(self._l1_prefixes)} "
+            f"(max {settings.CACHE_L1_MAX_ENTRIES} entries, ttl {settings.CACHE_L1_TTL}s)"
+        )
+        return True
+    
+    async def disable_local_cache(self):
+        """L1 캐시 비활성화 및 무효화 구독 종료"""
+        self.local_cache = None
+        if self._pubsub_task is not None:
+            self._pubsub_task.cancel()
+            try:
+                await self._pubsub_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._pubsub_task = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.aclose()
+            except Exception:
+                pass
+            self._pubsub = None
+    
+    def _on_invalidation(self, message):
+        """다른 프로세스가 보낸 무효화 메시지 처리"""
+        local_cache = self.local_cache
+        if local_cache is None:
+            return
+        try:
+            payload = json.loads(message["data"])
+        except (TypeError, ValueError):
+            return
+        if payload.get("origin") == self._instance_id:
+            return
+        
+        keys = payload.get("keys")
+        if keys == "*":
+            local_cache.clear()
+        elif keys:
+            local_cache.delete_many(keys)
+    
+    async def _on_pubsub_error(self, error: BaseException, pubsub):
+        """구독 연결이 끊긴 동안의 무효화는 받을 수 없으므로 L1 전체를 비움"""
+        logger.warning(f"Cache invalidation subscription error: {error}")
+        if self.local_cache is not None:
+            self.local_cache.clear()
+        await asyncio.sleep(1.0)
+    
+    async def _invalidate_local(self, keys: Union[List[str], str]):
+        """L1에서 제거하고 다른 프로세스에 무효화 메시지 발행"""
+        if keys != "*":
+            keys = [key for key in keys if self._l1_eligible(key)]
+            if not keys:
+                return
+        
+        if self.local_cache is not None:
+            if keys == "*":
+                self.local_cache.clear()
+            else:
+                self.local_cache.delete_many(keys)
+        try:
+            await self.client.publish(settings.CACHE_INVALIDATION_CHANNEL, _invalidation_message(self._instance_id, keys))
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidation: {e}")
+    
+    def _encode(self, key: str, value: Any) -> bytes:
+        """값 인코딩 (키 패밀리별 인코딩 시간과 크기 기록)"""
+        start = time.perf_counter()
+        data = cache_codec.encode(value)
+        self.cache_stats.observe(key, "encode_seconds", time.perf_counter() - start)
+        self.cache_stats.observe(key, "value_bytes", len(data))
+        return data
+    
+    def _decode(self, key: str, data: Optional[bytes]) -> Any:
+        """값 디코딩 (키 패밀리별 디코딩 시간 기록)"""
+        if data is None:
+            return None
+        start = time.perf_counter()
+        value = cache_codec.decode(data)
+        self.cache_stats.observe(key, "decode_seconds", time.perf_counter() - start)
+        return value
+    
+    async def set(self, key: str, value: Any, ex: Optional[int] = None, tags: Optional[List[str]] = None) -> bool:
+        """값을 Redis에 저장 (tags 지정 시 태그별 의존 키 집합에 함께 등록)"""
+        try:
+            if not self._available():
+                return False
+            
+            if tags:
+                async with self.client.pipeline(transaction=False) as pipe:
+                    pipe.set(key, self._encode(key, value), ex=ex)
+                    _register_tags(pipe, key, tags, ex)
+                    result = (await pipe.execute())[0]
+            else:
+                result = await self.client.set(key, self._encode(key, value), ex=ex)
+            redis_breaker.record_success()
+            # L1은 다음 조회 시 Redis에서 다시 채움
+            await self._invalidate_local([key])
+            return result
+        except Exception as e:
+            _record_error(e)
+            logger.error(f"Failed to set key {key}: {e}")
+            return False
+    
+    async def get(self, key: str, model: Optional[Type[BaseModel]] = None) -> Optional[Any]:
+        """값 조회 (L1 대상 키는 프로세스 내 캐시를 먼저 확인, model 지정 시 pydantic 모델로 복원)"""
+        local_cache = self.local_cache if self._l1_eligible(key) else None
+        if local_cache is not None:
+            hit, value = local_cache.get(key)
+            if hit:
+                self.cache_stats.incr(key, "l1_hits")
+                return _as_model(value, model)
+        
+        value = await self._get_from_redis(key)
+        if value is None:
+            self.cache_stats.incr(key, "misses")
+            return None
+        
+        self.cache_stats.incr(key, "l2_hits")
+        if local_cache is not None:
+            local_cache.set(key, value)
+        return _as_model(value, model)
+    
+    async def _get_from_redis(self, key: str) -> Optional[Any]:
+        """Redis에서 값을 가져오기"""
+        try:
+            if not self._available():
+                return None
+            
+            value = await self.client.get(key)
+            redis_breaker.record_success()
+            return self._decode(key, value)
+        except Exception as e:
+            _record_error(e)
+            logger.error(f"Failed to get key {key}: {e}")
+            return None
+    
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """cache_codec을 거치지 않은 바이트 값 조회 (L1 미사용)"""
+        try:
+            if not self._available():
+                return None
+            
+            value = await self.client.get(key)
+            redis_breaker.record_success()
+            self.cache_stats.incr(key, "l2_hits" if value is not None else "misses")
+            return value
+        except Exception as e:
+            _record_error(e)
+            logger.error(f"Failed to get key {key}: {e}")
+            return None
+    
+    async def set_bytes(self, key: str, value: bytes, ex: Optional[int] = None) -> bool:
+        """바이트 값을 그대로 저장 (L1 무효화 없음, 변하지 않는 값 전용)"""
+        try:
+            if not self._available():
+                return False
+            
+            result = await self.client.set(key, value, ex=ex)
+            redis_breaker.record_success()
+            self.cache_stats.observe(key, "value_bytes", len(value))
+            return result
+        except Exception as e:
+            _record_error(e)
+            logger.error(f"Failed to set key {key}: {e}")
+            return False
+    
+    async def get_many(self, keys: List[str], model: Optional[Type[BaseModel]] = None) -> Dict[str, Any]:
+        """여러 키를 조회 (L1에 없는 키만 MGET 한 번으로 가져옴, 없는 키는 결과에서 제외)"""
+        results = {}
+        remaining = []
+        for key in dict.fromkeys(keys):
+            local_cache = self.local_cache if self._l1_eligible(key) else None
+            if local_cache is not None:
+                hit, value = local_cache.get(key)
+                if hit:
+                    self.cache_stats.incr(key, "l1_hits")
+                    results[key] = _as_model(value, model)
+                    continue
+            remaining.append(key)
+        
+        if not remaining:
+            return results
+        
+        values = await self._mget_from_redis(remaining)
+        for key in remaining:
+            value = values.get(key)
+            if value is None:
+                self.cache_stats.incr(key, "misses")
+                continue
+            self.cache_stats.incr(key, "l2_hits")
+            if self.local_cache is not None and self._l1_eligible(key):
+                self.local_cache.set(key, value)
+            results[key] = _as_model(value, model)
+        return results
+    
+    async def _mget_from_redis(self, keys: List[str]) -> Dict[str, Any]:
+        try:
+            if not self._available():
+                return {}
+            
+            values = await self.client.mget(keys)
+            redis_breaker.record_success()
+            return {key: self._decode(key, value) for key, value in zip(keys, values) if value is not None}
+        except Exception as e:
+            _record_error(e)
+            logger.error(f"Failed to get {len(keys)} keys: {e}")
+            return {}
+    
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Dict[str, List[str]]] = None,
+    ) -> bool:
+        """여러 값을 파이프라인 한 번으로 저장 (ttl 지정 시 SETEX, tags는 키별 태그 목록)"""
+        if not mapping:
+            return True
+        try:
+            if not self._available():
+                return False
+            
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    pipe.set(key, self._encode(key, value), ex=ttl)
+                    if tags and tags.get(key):
+                        _register_tags(pipe, key, tags[key], ttl)
+                await pipe.execute()
+            redis_breaker.record_success()
+            await self._invalidate_local(list(mapping))
+            return True
+        except Exception as e:
+            _record_error(e)
+            logger.error(f"Failed to set {len(mapping)} keys: {e}")
+            return False
+    
+    async def delete(self, key: str) -> bool:
+        """Redis에서 키 삭제"""
+        try:
+            if not self._available():
+                return False
+            
+            result = bool(await self.client.delete(key))
+            redis_breaker.record_success()
+            await self._invalidate_local([key])
+            return result
+        except Exception as e:
+            _record_error(e)
+            logger.error(f"Failed to delete key {key}: {e}")
+            return False
+    
+    async def invalidate_tags(self, tags: List[str]) -> int:
+        """태그에 등록된 모든 키를 삭제하고 삭제 대상 키 수 반환
+        
+        태그 집합 조회와 삭제를 MULTI로 묶어 그 사이에 등록된 키가 빠지지 않게 하고,
+        의존 키는 파이프라인 한 번으로 삭제한 뒤 L1 무효화 메시지를 발행한다.
+        """
+        if not tags:
+            return 0
+        try:
+            if not self._available():
+                return 0
+            
+            tag_keys = [f"{TAG_KEY_PREFIX}{tag}" for tag in tags]
+            async with self.client.pipeline(transaction=True) as pipe:
+                for tag_key in tag_keys:
+                    pipe.smembers(tag_key)
+                pipe.delete(*tag_keys)
+                keys = _tag_members((await pipe.execute())[:-1])
+            
+            if keys:
+                async with self.client.pipeline(transaction=False) as pipe:
+                    for start in range(0, len(keys), 500):
+                        pipe.delete(*keys[start:start + 500])
+                    await pipe.execute()
+            redis_breaker.record_success()
+            await self._invalidate_local(keys)
+            logger.info(f"Invalidated {len(keys)} cache keys for tags {tags}")
+            return len(keys)
+        except Exception as e:
+            _record_error(e)
+            logger.error(f"Failed to invalidate tags {tags}: {e}")
+            return 0
+    
+    async def exists(self, key: str) -> bool:
+        """키의 존재 여부 확인"""
+        try:
+            if not self._available():
+                return False
+            
+            result = bool(await self.client.exists(key))
+            redis_breaker.record_success()
+            return result
+        except Exception as e:
+            _record_error(e)
+            logger.error(f"Failed to check key {key}: {e}")
+            return False
+    
+    async def expire(self, key: str, seconds: int) -> bool:
+        """키의 만료 시간 설정"""
+        try:
+            if not self._available():
+                return False
+            
+            result = await self.client.expire(key, seconds)
+            redis_breaker.record_success()
+            return result
+        except Exception as e:
+            _record_error(e)
+            logger.error(f"Failed to set expire for key {key}: {e}")
+            return False
+    
+    async def flushdb(self) -> bool:
+        """현재 DB의 모든 키 삭제"""
+        try:
+            if not self.client:
+                return False
+            
+            await self.client.flushdb()
+            await self._invalidate_local("*")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to flush db: {e}")
+            return False
+    
+    async def get_or_compute(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: int = 0,
+        beta: Optional[float] = None,
+        model: Optional[Type[BaseModel]] = None,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+        force_refresh: bool = False,
+        tags: Optional[Union[List[str], Callable[[Any], List[str]]]] = None,
+    ) -> Any:
+        """캐시 조회, 없으면 loader로 계산하여 저장 (캐시 스탬피드 방지)
+
+        - 값은 {"v": 값, "t": 신선 만료 시각, "d": 계산 소요 시간}으로 ttl + stale_ttl 동안 보관한다.
+        - 신선 구간이 지나도 stale_ttl 안이면 이전 값을 바로 반환하고 백그라운드에서 갱신한다.
+        - 신선 구간 안에서도 만료가 가까울수록 높은 확률로 미리 갱신한다 (beta = 0이면 사용 안 함).
+        - 캐시가 비어 있으면 프로세스 내 single-flight와 Redis 잠금(SET NX PX)으로 한 곳에서만 계산하고,
+          나머지는 잠금이 풀릴 때까지 저장된 값을 기다린다.
+        loader가 None을 반환하거나 cacheable(값)이 False이면 저장하지 않는다 (예: 부분 결과).
+        model 지정 시 캐시된 값을 해당 모델로 복원한다.
+        force_refresh=True이면 캐시를 읽지 않고 다시 계산하여 저장한다 (캐시 우회 요청).
+        tags(목록 또는 값 → 목록 함수)를 지정하면 invalidate_tags()로 무효화할 수 있도록 등록한다.
+        """
+        if force_refresh:
+            return await self._compute_and_store(key, loader, ttl, stale_ttl, cacheable, tags)
+        
+        beta = settings.CACHE_EARLY_REFRESH_BETA if beta is None else beta
+        entry = await self.get(key)
+        
+        if _is_envelope(entry):
+            now = time.time()
+            fresh_until = entry["t"]
+            if now < fresh_until:
+                # XFetch: 계산이 오래 걸리는 키일수록, 만료가 가까울수록 조기 갱신 확률 증가
+                if beta > 0 and now - entry.get("d", 0) * beta * math.log(random.random() or 1e-12) >= fresh_until:
+                    self.cache_stats.incr(key, "early_refreshes")
+                    self._schedule_refresh(key, loader, ttl, stale_ttl, cacheable, tags)
+                return _as_model(entry["v"], model)
+            
+            # stale-while-revalidate
+            self.cache_stats.incr(key, "stale_serves")
+            self._schedule_refresh(key, loader, ttl, stale_ttl, cacheable, tags)
+            return _as_model(entry["v"], model)
+        
+        return _as_model(await self._compute_single_flight(key, loader, ttl, stale_ttl, cacheable, tags), model)
+    
+    async def get_or_compute_many(
+        self,
+        keys: List[str],
+        loader: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+        ttl: int,
+        stale_ttl: int = 0,
+        model: Optional[Type[BaseModel]] = None,
+        tags: Optional[Callable[[Any], List[str]]] = None,
+    ) -> Dict[str, Any]:
+        """get_or_compute의 다건 버전 (같은 키에 저장된 값을 공유)
+
+        MGET 한 번으로 캐시된 값을 가져오고, 없거나 신선 구간이 지난 키만 모아
+        loader(키 목록) → {키: 값} 한 번으로 계산한 뒤 파이프라인으로 저장한다.
+        신선 구간이 지난 키는 loader 실패 시 이전 값을 응답한다.
+        다건 조회는 요청마다 키 조합이 달라 single-flight/잠금은 적용하지 않는다.
+        """
+        entries = await self.get_many(keys)
+        results = {}
+        stale = {}
+        now = time.time()
+        for key, entry in entries.items():
+            if not _is_envelope(entry):
+                continue
+            if now < entry["t"]:
+                results[key] = _as_model(entry["v"], model)
+            else:
+                stale[key] = entry["v"]
+        
+        missing = [key for key in dict.fromkeys(keys) if key not in results]
+        if not missing:
+            return results
+        
+        start = time.time()
+        try:
+            loaded = await loader(missing)
+        except Exception as e:
+            logger.warning(f"Batch load failed for {len(missing)} keys: {e}")
+            loaded = {}
+        elapsed = time.time() - start
+        
+        values = {key: value for key, value in loaded.items() if value is not None}
+        if values:
+            await self.set_many(
+                {key: _envelope(value, ttl, elapsed) for key, value in values.items()},
+                ttl=ttl + stale_ttl,
+                tags={key: tags(value) for key, value in values.items()} if tags else None,
+            )
+        
+        for key in missing:
+            if key in values:
+                results[key] = _as_model(values[key], model)
+            elif key in stale:
+                self.cache_stats.incr(key, "stale_serves")
+                results[key] = _as_model(stale[key], model)
+        return results
+    
+    async def _compute_single_flight(self, key: str, loader, ttl: int, stale_ttl: int, cacheable=None, tags=None) -> Any:
+        """같은 프로세스의 동시 요청은 하나의 계산 결과를 공유"""
+        future = self._computing.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._computing[key] = future
+        try:
+            value = await self._compute_with_lock(key, loader, ttl, stale_ttl, cacheable, tags)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없을 때 경고 방지
+            raise
+        finally:
+            self._computing.pop(key, None)
+    
+    async def _compute_with_lock(self, key: str, loader, ttl: int, stale_ttl: int, cacheable=None, tags=None) -> Any:
+        """Redis 잠금을 얻은 워커만 계산, 나머지는 저장될 값을 기다림"""
+        locked, token = await self._acquire_lock(key)
+        if not locked:
+            value = await self._wait_for_value(key)
+            if value is not None:
+                return value
+            # 잠금 보유자가 제한 시간 안에 저장하지 못하면 직접 계산
+        
+        try:
+            return await self._compute_and_store(key, loader, ttl, stale_ttl, cacheable, tags)
+        finally:
+            if token is not None:
+                await self._release_lock(key, token)
+    
+    async def _compute_and_store(self, key: str, loader, ttl: int, stale_ttl: int, cacheable=None, tags=None) -> Any:
+        start = time.time()
+        value = await loader()
+        if value is None or (cacheable is not None and not cacheable(value)):
+            return value
+        
+        if callable(tags):
+            tags = tags(value)
+        await self.set(key, _envelope(value, ttl, time.time() - start), ex=ttl + stale_ttl, tags=tags)
+        return value
+    
+    async def _wait_for_value(self, key: str) -> Optional[Any]:
+        """다른 워커가 계산한 값이 저장될 때까지 폴링 (저장 없이 잠금이 풀리면 바로 None)"""
+        deadline = time.monotonic() + settings.CACHE_LOCK_TIMEOUT_MS / 1000
+        delay = 0.02
+        self.cache_stats.incr(key, "lock_waits")
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.2)
+            entry = await self._get_from_redis(key)
+            if isinstance(entry, dict) and "v" in entry:
+                return entry["v"]
+            if not await self.exists(f"lock:{key}"):
+                return None
+        return None
+    
+    async def _acquire_lock(self, key: str) -> Tuple[bool, Optional[str]]:
+        """SET NX PX 잠금 획득 시도
+
+        (False, None): 다른 워커가 잠금 보유 중 / (True, token): 획득 /
+        (True, None): Redis를 쓸 수 없어 잠금 없이 진행
+        """
+        if not self._available():
+            return True, None
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self.client.set(f"lock:{key}", token, nx=True, px=settings.CACHE_LOCK_TIMEOUT_MS)
+            redis_breaker.record_success()
+            return (True, token) if acquired else (False, None)
+        except Exception as e:
+            _record_error(e)
+            logger.warning(f"Failed to acquire lock for {key}: {e}")
+            return True, None
+    
+    async def _release_lock(self, key: str, token: str):
+        try:
+            await self.client.eval(RELEASE_LOCK_SCRIPT, 1, f"lock:{key}", token)
+        except Exception as e:
+            logger.warning(f"Failed to release lock for {key}: {e}")
+    
+    def _schedule_refresh(self, key: str, loader, ttl: int, stale_ttl: int, cacheable=None, tags=None):
+        """백그라운드 갱신 예약 (프로세스 내 중복 갱신 방지)"""
+        if key in self._computing or key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        task = asyncio.get_running_loop().create_task(self._refresh(key, loader, ttl, stale_ttl, cacheable, tags))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+    
+    async def _refresh(self, key: str, loader, ttl: int, stale_ttl: int, cacheable=None, tags=None):
+        """잠금을 얻은 경우에만 재계산 (다른 워커가 갱신 중이면 건너뜀)"""
+        token = None
+        try:
+            locked, token = await self._acquire_lock(key)
+            if not locked:
+                return
+            await self._compute_and_store(key, loader, ttl, stale_ttl, cacheable, tags)
+            self.cache_stats.incr(key, "refreshes")
+        except Exception as e:
+            logger.warning(f"Background refresh failed for {key}: {e}")
+        finally:
+            self._refreshing.discard(key)
+            if token is not None:
+                await self._release_lock(key, token)
+    
+    def local_cache_stats(self) -> dict:
+        """키 패밀리별 적중률, stale 응답, 인코딩/디코딩 시간, 값 크기와 L1 상태"""
+        return {
+            "l1_enabled": self.local_cache is not None,
+            "l1_entries": len(self.local_cache) if self.local_cache is not None else 0,
+            "l1_evictions": self.local_cache.evictions if self.local_cache is not None else 0,
+            "families": self.cache_stats.snapshot(),
+        }
+    
+    def cache_metrics(self) -> str:
+        """키 패밀리별 캐시 계측을 Prometheus 텍스트 형식으로 반환"""
+        return self.cache_stats.metrics(gauges={
+            "l1_entries": len(self.local_cache) if self.local_cache is not None else 0,
+            "l1_evictions": self.local_cache.evictions if self.local_cache is not None else 0,
+        })
+    
+    async def close(self):
+        """무효화 구독과 커넥션 풀 정리"""
+        await self.disable_local_cache()
+        if self.client:
+            await self.client.aclose()
+        if self.pool:
+            await self.pool.disconnect()
+
+# 전역 Redis 클라이언트 인스턴스 (동기 클라이언트는 스크립트에서 처음 사용할 때 연결)
+redis_client: Optional[RedisClient] = None
+async_redis_client = AsyncRedisClient()
+
+def get_redis_client() -> AsyncRedisClient:
+    """요청 경로용 비동기 Redis 클라이언트 인스턴스 반환"""
+    return async_redis_client
+
+def get_sync_redis_client() -> RedisClient:
+    """배치 스크립트용 동기 Redis 클라이언트 인스턴스 반환"""
+    global redis_client
+    if redis_client is None:
+        redis_client = RedisClient()
+    return redis_client
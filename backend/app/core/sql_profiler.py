@@ -0,0 +1,149 @@
+import re
+import time
+from contextvars import ContextVar
+from typing import Optional, List, Dict, Any, Tuple
+
+from sqlalchemy import event
+from loguru import logger
+
+
+# IN (?, ?, ?) 처럼 개수만 다른 바인드 목록과 리터럴 숫자는 같은 쿼리 형태로 본다
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%s|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|:\w+))+\s*\)")
+_NUMBER = re.compile(r"\b\d+\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """N+1 판단용 쿼리 형태 (공백 정리, 바인드 목록/숫자 리터럴 축약)"""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _PLACEHOLDER_LIST.sub("(?)", shape)
+    return _NUMBER.sub("?", shape)
+
+
+class RequestProfile:
+    """요청 하나에서 실행된 SQL 통계 (쿼리 수, 총 DB 시간, 가장 느린 쿼리, 형태별 반복 횟수)"""
+
+    def __init__(self, slowest_size: int = 5):
+        self.query_count = 0
+        self.total_ms = 0.0
+        self.shapes: Dict[str, List[float]] = {}
+        self.slowest: List[Tuple[float, str]] = []
+        self._slowest_size = slowest_size
+
+    def record(self, statement: str, elapsed_ms: float):
+        self.query_count += 1
+        self.total_ms += elapsed_ms
+        entry = self.shapes.setdefault(statement_shape(statement), [0, 0.0])
+        entry[0] += 1
+        entry[1] += elapsed_ms
+
+        if len(self.slowest) < self._slowest_size or elapsed_ms > self.slowest[-1][0]:
+            self.slowest.append((elapsed_ms, statement))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[self._slowest_size:]
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int, float]]:
+        """threshold회를 넘게 반복된 쿼리 형태 (N+1 의심), 반복 횟수 내림차순"""
+        return sorted(
+            ((shape, int(count), total) for shape, (count, total) in self.shapes.items() if count > threshold),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.total_ms:.1f};desc="{self.query_count} queries"'
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "query_count": self.query_count,
+            "total_ms": round(self.total_ms, 2),
+            "slowest": [
+                {"ms": round(ms, 2), "statement": _WHITESPACE.sub(" ", statement).strip()[:500]}
+                for ms, statement in self.slowest
+            ],
+        }
+
+
+# 현재 요청의 SQL 통계 (요청 밖에서 실행된 쿼리는 기록하지 않음)
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("sql_request_profile", default=None)
+
+
+def current_profile() -> Optional[RequestProfile]:
+    """현재 요청의 SQL 통계 (요청 밖이면 None)"""
+    return _current_profile.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile.get() is not None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    starts = conn.info.get("query_start")
+    if profile is None or not starts:
+        return
+    profile.record(statement, (time.perf_counter() - starts.pop()) * 1000)
+
+
+def instrument_engine(engine):
+    """엔진(동기 또는 비동기)에 쿼리 계측 이벤트 등록"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class SQLProfilerMiddleware:
+    """요청별 SQL 프로파일러 (ASGI 미들웨어)
+
+    요청마다 쿼리 수와 총 DB 시간을 모아 Server-Timing 헤더에 db 항목으로 추가한다.
+    같은 형태의 쿼리가 n_plus_one_threshold회를 넘게 반복되면 N+1 의심 경고를,
+    총 DB 시간이 slow_ms를 넘으면 가장 느린 쿼리 목록과 함께 경고를 남긴다.
+    """
+
+    def __init__(self, app, n_plus_one_threshold: int = 10, slow_ms: float = 200.0, slowest_size: int = 5):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.slow_ms = slow_ms
+        self.slowest_size = slowest_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(self.slowest_size)
+        token = _current_profile.set(profile)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start" and profile.query_count:
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", profile.server_timing().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_profile.reset(token)
+            self._report(scope, profile)
+
+    def _report(self, scope, profile: RequestProfile):
+        if not profile.query_count:
+            return
+        request = f"{scope.get('method', '')} {scope.get('path', '')}"
+
+        for shape, count, total_ms in profile.repeated(self.n_plus_one_threshold):
+            logger.warning(
+                f"N+1 query suspected in {request}: {count} executions ({total_ms:.1f}ms) of {shape[:300]}"
+            )
+
+        if profile.total_ms > self.slow_ms:
+            snapshot = profile.snapshot()
+            logger.warning(
+                f"Slow DB time in {request}: {snapshot['query_count']} queries, {snapshot['total_ms']}ms, "
+                f"slowest: {snapshot['slowest']}"
+            )
+        else:
+            logger.debug(f"{request}: {profile.query_count} queries, {profile.total_ms:.1f}ms")
@@ -4,10 +4,12 @@ Google Cloud Vertex AI 임베딩 클라이언트
 
 import os
 import asyncio
+import time
 from typing import List, Dict, Any, Optional
 from loguru import logger
 from google.cloud import aiplatform
 from google.oauth2 import service_account
+from app.core.embedding_cache import get_embedding_cache
 import json
 
 
@@ -111,6 +113,13 @@ class VertexAIEmbeddingClient:
             
             cleaned_text = self._preprocess_text(query_text)
             
+            # 이전에 임베딩한 쿼리는 원격 호출 없이 캐시에서 반환
+            cache = get_embedding_cache()
+            if cache is not None:
+                cached = await cache.get(self.model_name, "RETRIEVAL_QUERY", cleaned_text)
+                if cached is not None:
+                    return cached
+            
             instance = {
                 "content": cleaned_text,
                 "task_type": "RETRIEVAL_QUERY"  # 검색 쿼리 임베딩
@@ -121,12 +130,17 @@ class VertexAIEmbeddingClient:
                 "instances": [instance]
             }
             
+            start = time.perf_counter()
             response = await self._call_prediction_api(request)
+            elapsed_ms = (time.perf_counter() - start) * 1000
             
             if response and "predictions" in response and len(response["predictions"]) > 0:
                 prediction = response["predictions"][0]
                 if "embeddings" in prediction and "values" in prediction["embeddings"]:
-                    return prediction["embeddings"]["values"]
+                    values = prediction["embeddings"]["values"]
+                    if cache is not None:
+                        await cache.set(self.model_name, "RETRIEVAL_QUERY", cleaned_text, values, elapsed_ms)
+                    return values
             
             return None
             
@@ -5,7 +5,13 @@ import os
 from dotenv import load_dotenv
 
 from app.core.config import settings
-from app.core.database import init_db
+from app.core.database import init_db, close_async_db, get_replica_router
+from app.core.opensearch_client import get_async_opensearch_client, start_write_buffer, close_write_buffer
+from app.core.redis_client import get_redis_client
+from app.core.embedding_cache import get_embedding_cache
+from app.services.cache_warmer import get_cache_warmer
+from app.core.health import get_health_monitor, opensearch_breaker, redis_breaker
+from app.core.sql_profiler import SQLProfilerMiddleware
 from app.api.v1.api import api_router
 
 load_dotenv()
@@ -26,6 +32,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 SQL 프로파일러 (Server-Timing db 항목, N+1 쿼리 경고)
+if settings.SQL_PROFILER_ENABLED:
+    app.add_middleware(
+        SQLProfilerMiddleware,
+        n_plus_one_threshold=settings.SQL_N_PLUS_ONE_THRESHOLD,
+        slow_ms=settings.SQL_SLOW_REQUEST_MS,
+    )
+
 # API 라우터 등록
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -36,8 +50,19 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy", "service": "commerce-recommendation-api"}
+    """Health check endpoint (백그라운드 모니터가 캐시한 상태만 반환, 의존성 live 호출 없음)"""
+    monitor = get_health_monitor()
+    return {
+        "status": "degraded" if monitor.is_degraded() else "healthy",
+        "service": "commerce-recommendation-api",
+        "dependencies": monitor.report(),
+        "opensearch_msearch": get_async_opensearch_client().msearch_stats(),
+        "opensearch_latency": get_async_opensearch_client().latency_stats(),
+        "cache": get_redis_client().local_cache_stats(),
+        "embedding_cache": get_embedding_cache().snapshot() if get_embedding_cache() else None,
+        "cache_warm": get_cache_warmer().report(),
+        "db_replicas": get_replica_router().report(),
+    }
 
 @app.on_event("startup")
 async def startup_event():
@@ -47,14 +72,39 @@ async def startup_event():
     # 데이터베이스 테이블 생성
     init_db()
     print("Database tables created successfully!")
+    
+    # OpenSearch 쓰기 버퍼 (설정 시)
+    start_write_buffer()
+    
+    # 핫 키용 프로세스 내 L1 캐시 (pub/sub로 워커 간 무효화)
+    await get_redis_client().enable_local_cache()
+    
+    # 의존성 헬스 모니터 (요청 경로에서는 캐시된 상태와 서킷 브레이커만 사용)
+    monitor = get_health_monitor()
+    monitor.register("opensearch", get_async_opensearch_client().ping, opensearch_breaker)
+    monitor.register("redis", get_redis_client().ping, redis_breaker)
+    monitor.start()
+    
+    # 읽기 복제본 지연 확인 (복제본 설정 시, 첫 확인 전까지는 primary로 조회)
+    get_replica_router().start()
+    
+    # 캐시 워밍 (카테고리, 리뷰 수 상위 상품, 자주 쓰는 검색; 백그라운드로 시작 후 주기 실행)
+    if settings.CACHE_WARM_ENABLED:
+        get_cache_warmer().start()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Shutdown event handler"""
     print("Shutting down Commerce Recommendation API...")
     
-    # 여기에 정리 작업을 추가할 수 있습니다
-    # await cleanup_resources()
+    await get_health_monitor().stop()
+    await get_cache_warmer().stop()
+    
+    # 버퍼에 남은 OpenSearch 쓰기 flush 후 커넥션 풀 정리
+    await close_write_buffer()
+    await get_async_opensearch_client().close()
+    await get_redis_client().close()
+    await close_async_db()
 
 if __name__ == "__main__":
     import uvicorn
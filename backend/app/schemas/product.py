@@ -55,6 +55,8 @@ class ProductList(BaseModel):
     page: int
     size: int
     total_pages: int
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (커서 모드, 마지막 페이지면 없음)")
+    timed_out: bool = Field(False, description="검색 deadline 초과로 일부 결과만 포함되었는지 여부")
 
 class ProductSearch(BaseModel):
     """Product 검색 요청 스키마"""
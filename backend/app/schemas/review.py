@@ -44,6 +44,7 @@ class ReviewList(BaseModel):
     page: int
     size: int
     total_pages: int
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (커서 모드, 마지막 페이지면 없음)")
 
 
 class ReviewSearchParams(BaseModel):
@@ -0,0 +1,252 @@
+"""
+캐시 워머 (배포 직후 콜드 캐시 방지)
+"""
+
+import asyncio
+import time
+import uuid
+from typing import Optional, List, Dict, Any, Callable, Awaitable
+from loguru import logger
+from app.core.config import settings
+from app.core.database import get_replica_router
+from app.core.query_cache import get_query_log, query_cache_key
+from app.core.redis_client import get_redis_client
+from app.core.opensearch_client import get_async_opensearch_client
+from app.schemas.product import ProductSearch
+from app.services.product_service import ProductService, CATEGORIES_CACHE_KEY
+from app.services.review_service import ReviewHybridSearchService
+
+
+# 여러 워커 중 한 곳만 워밍하도록 주기마다 잡는 잠금
+WARM_LOCK_KEY = "lock:cache_warm"
+
+# 상위 상품은 _mget 한 번에 이 수만큼 조회
+PRODUCT_BATCH_SIZE = 100
+
+
+class RateBudget:
+    """초당 호출 수 상한 (호출 사이 간격을 1/rate초 이상으로 유지)"""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+
+    async def acquire(self):
+        now = time.monotonic()
+        if self._next > now:
+            await asyncio.sleep(self._next - now)
+            now = self._next
+        self._next = now + self.interval
+
+
+class CacheWarmer:
+    """카테고리 목록, 리뷰 수 상위 상품, 자주 쓰는 검색 결과를 미리 캐시에 적재
+
+    시작 시 한 번, 이후 interval초마다 실행한다. 여러 워커가 동시에 뜨더라도 Redis 잠금을 얻은
+    한 곳만 워밍하고, 백엔드(OpenSearch/DB) 호출은 rate(초당)를 넘지 않는다.
+    이미 캐시에 있는 키는 건너뛰며, 항목별 대상 수 대비 캐시에 있는 비율을 커버리지로 보고한다.
+    """
+
+    def __init__(
+        self,
+        interval: float = 600,
+        top_products: int = 200,
+        top_queries: int = 50,
+        rate: float = 10.0,
+    ):
+        self.interval = interval
+        self.top_products = top_products
+        self.top_queries = top_queries
+        self.rate = rate
+        self._instance_id = uuid.uuid4().hex
+        self._task: Optional[asyncio.Task] = None
+        self.last_report: Dict[str, Any] = {}
+        self.runs = 0
+
+    def start(self):
+        """시작 시 워밍과 주기적 워밍 태스크 시작 (서버 시작을 막지 않음)"""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Cache warm run failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def _acquire_lock(self, redis_client) -> bool:
+        """이번 주기의 워밍 담당 여부 (Redis를 쓸 수 없으면 각자 워밍)"""
+        try:
+            return bool(await redis_client.client.set(
+                WARM_LOCK_KEY, self._instance_id, nx=True, ex=max(1, int(self.interval * 0.9))
+            ))
+        except Exception as e:
+            logger.warning(f"Failed to acquire cache warm lock: {e}")
+            return True
+
+    async def run_once(self, force: bool = False) -> Dict[str, Any]:
+        """워밍 1회 실행 후 커버리지 보고 (force=True면 잠금 없이 실행)"""
+        redis_client = get_redis_client()
+        if redis_client.client is None:
+            return {}
+        if not force and not await self._acquire_lock(redis_client):
+            logger.info("Cache warm skipped: another worker holds the warm lock")
+            return {}
+
+        start = time.time()
+        budget = RateBudget(self.rate)
+        opensearch_client = get_async_opensearch_client()
+
+        report = {
+            "categories": await self._warm_categories(redis_client, budget),
+            "top_products": await self._warm_top_products(redis_client, opensearch_client, budget),
+            "products_search": await self._warm_queries(
+                redis_client, "products_search", budget,
+                lambda params: self._replay_product_search(redis_client, opensearch_client, params),
+            ),
+            "reviews_search_hybrid": await self._warm_queries(
+                redis_client, "reviews_search_hybrid", budget,
+                lambda params: self._replay_review_search(redis_client, opensearch_client, params),
+            ),
+        }
+
+        self.runs += 1
+        self.last_report = {
+            "started_at": start,
+            "duration_seconds": round(time.time() - start, 2),
+            "sections": report,
+        }
+        logger.info(
+            "Cache warm finished in {:.2f}s: {}".format(
+                self.last_report["duration_seconds"],
+                ", ".join(f"{name} {section['coverage']:.0%}" for name, section in report.items()),
+            )
+        )
+        return self.last_report
+
+    @staticmethod
+    def _section(requested: int, cached_before: int, warmed: int, failed: int = 0) -> Dict[str, Any]:
+        covered = cached_before + warmed
+        return {
+            "requested": requested,
+            "cached_before": cached_before,
+            "warmed": warmed,
+            "failed": failed,
+            "coverage": round(covered / requested, 4) if requested else 1.0,
+        }
+
+    async def _warm_categories(self, redis_client, budget: RateBudget) -> Dict[str, Any]:
+        if await redis_client.exists(CATEGORIES_CACHE_KEY):
+            return self._section(1, 1, 0)
+
+        await budget.acquire()
+        categories = await ProductService(None, redis_client).get_categories(force_refresh=True)
+        warmed = 1 if categories is not None and await redis_client.exists(CATEGORIES_CACHE_KEY) else 0
+        return self._section(1, 0, warmed, 1 - warmed)
+
+    async def _warm_top_products(self, redis_client, opensearch_client, budget: RateBudget) -> Dict[str, Any]:
+        """리뷰 수(statistics.total_reviews) 상위 상품 상세 캐시"""
+        if self.top_products <= 0:
+            return self._section(0, 0, 0)
+
+        await budget.acquire()
+        query = {
+            "query": {"match_all": {}},
+            "sort": [{"statistics.total_reviews": {"order": "desc"}}],
+            "size": self.top_products,
+        }
+        documents = await opensearch_client.search("products", query, source_profile="product_ref")
+        product_nos = [str(doc["product_no"]) for doc in documents if doc.get("product_no") is not None]
+        if not product_nos:
+            return self._section(0, 0, 0)
+
+        keys = [f"product:{product_no}" for product_no in product_nos]
+        cached_before = len(await redis_client.get_many(keys))
+
+        product_service = ProductService(None, redis_client, opensearch_client)
+        for start in range(0, len(product_nos), PRODUCT_BATCH_SIZE):
+            await budget.acquire()
+            await product_service.get_products_batch(product_nos[start:start + PRODUCT_BATCH_SIZE])
+
+        cached_after = len(await redis_client.get_many(keys))
+        return self._section(len(product_nos), cached_before, cached_after - cached_before,
+                             len(product_nos) - cached_after)
+
+    async def _warm_queries(
+        self,
+        redis_client,
+        endpoint: str,
+        budget: RateBudget,
+        replay: Callable[[Dict[str, Any]], Awaitable[Any]],
+    ) -> Dict[str, Any]:
+        """검색 로그 상위 검색을 다시 실행하여 결과 캐시 적재"""
+        if self.top_queries <= 0:
+            return self._section(0, 0, 0)
+
+        entries = await get_query_log().top(redis_client, endpoint, self.top_queries)
+        cached_before = warmed = failed = 0
+        for params, _ in entries:
+            if await redis_client.exists(query_cache_key(endpoint, params)):
+                cached_before += 1
+                continue
+
+            await budget.acquire()
+            try:
+                await replay(params)
+            except Exception as e:
+                logger.warning(f"Failed to warm {endpoint} query {params}: {e}")
+            if await redis_client.exists(query_cache_key(endpoint, params)):
+                warmed += 1
+            else:
+                failed += 1
+        return self._section(len(entries), cached_before, warmed, failed)
+
+    @staticmethod
+    async def _replay_product_search(redis_client, opensearch_client, params: Dict[str, Any]):
+        params = dict(params)
+        page = params.pop("page", 1)
+        size = params.pop("size", 20)
+        product_service = ProductService(None, redis_client, opensearch_client)
+        # 로그의 파라미터는 이미 정규화된 값이므로 그대로 같은 캐시 키가 된다
+        await product_service.search_products_cached(ProductSearch(**params), page, size, bypass=True)
+
+    @staticmethod
+    async def _replay_review_search(redis_client, opensearch_client, params: Dict[str, Any]):
+        async with get_replica_router().read_session() as db:
+            review_service = ReviewHybridSearchService(db, redis_client, opensearch_client)
+            await review_service.search_reviews_hybrid_cached(
+                query=params.get("query", ""),
+                page=params.get("page", 1),
+                size=params.get("size", 20),
+                hybrid_weight=params.get("hybrid_weight", 0.5),
+                bypass=True
+            )
+
+    def report(self) -> Dict[str, Any]:
+        """마지막 워밍 결과"""
+        return {"runs": self.runs, **self.last_report}
+
+
+# 전역 캐시 워머 인스턴스
+cache_warmer = CacheWarmer(
+    interval=settings.CACHE_WARM_INTERVAL,
+    top_products=settings.CACHE_WARM_TOP_PRODUCTS,
+    top_queries=settings.CACHE_WARM_TOP_QUERIES,
+    rate=settings.CACHE_WARM_RATE,
+)
+
+
+def get_cache_warmer() -> CacheWarmer:
+    """캐시 워머 인스턴스 반환"""
+    return cache_warmer
@@ -1,24 +1,25 @@
-from typing import Optional, Dict, Any
-from sqlalchemy.orm import Session
+from typing import Optional, Dict, Any, List
+from sqlalchemy import text, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas.member import Member
 from loguru import logger
 
 
 class MemberService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_member_by_no(self, member_no: int) -> Optional[Member]:
+    async def get_member_by_no(self, member_no: int) -> Optional[Member]:
         """member_no로 회원 정보 조회"""
         try:
             # MySQL에서 직접 조회 (SQLAlchemy 모델이 없으므로)
-            query = """
+            query = text("""
             SELECT member_no, member_id, name, email, created_at, updated_at
-            FROM members 
-            WHERE member_no = %s
-            """
+            FROM members
+            WHERE member_no = :member_no
+            """)
             
-            cursor = self.db.execute(query, (member_no,))
+            cursor = await self.db.execute(query, {"member_no": member_no})
             result = cursor.fetchone()
             
             if result:
@@ -36,21 +37,20 @@ class MemberService:
             logger.error(f"Error getting member {member_no}: {e}")
             return None
 
-    def get_members_batch(self, member_nos: list[int]) -> Dict[int, Member]:
+    async def get_members_batch(self, member_nos: List[int]) -> Dict[int, Member]:
         """여러 회원 정보를 한 번에 조회"""
         try:
             if not member_nos:
                 return {}
             
-            # IN 절을 위한 플레이스홀더 생성
-            placeholders = ','.join(['%s'] * len(member_nos))
-            query = f"""
+            # IN 절은 expanding 바인드 파라미터로 전달
+            query = text("""
             SELECT member_no, member_id, name, email, created_at, updated_at
-            FROM members 
-            WHERE member_no IN ({placeholders})
-            """
+            FROM members
+            WHERE member_no IN :member_nos
+            """).bindparams(bindparam("member_nos", expanding=True))
             
-            cursor = self.db.execute(query, member_nos)
+            cursor = await self.db.execute(query, {"member_nos": list(dict.fromkeys(member_nos))})
             results = cursor.fetchall()
             
             members = {}
@@ -67,4 +67,4 @@ class MemberService:
             
         except Exception as e:
             logger.error(f"Error getting members batch: {e}")
-            return {} 
\ No newline at end of file
+            return {}
@@ -1,8 +1,70 @@
 from typing import Optional, List, Dict, Any
 from sqlalchemy.orm import Session
-from app.schemas.product import ProductCreate, ProductUpdate, ProductSearch, Product, ProductList, ProductStats
+from sqlalchemy import text
+from app.core.config import settings
+from app.core.database import get_replica_router
+from app.core.health import opensearch_breaker
+from app.core.redis_client import cache_tags
+from app.core.query_cache import cached_query
+from app.schemas.product import (
+    ProductCreate, ProductUpdate, ProductSearch, Product, ProductList, ProductStats, Category, CategoryList
+)
 from loguru import logger
 from decimal import Decimal
+import asyncio
+import base64
+import hashlib
+import json
+
+
+# 카테고리 목록 캐시 키
+CATEGORIES_CACHE_KEY = "categories:list"
+
+
+def product_list_tags(
+    result: ProductList,
+    brand: Optional[str] = None,
+    category: Optional[str] = None,
+    category_id: Optional[int] = None,
+) -> List[str]:
+    """상품 목록 캐시 의존성 태그 (필터 + 결과에 포함된 상품)"""
+    tags = cache_tags(brand=brand, category=category, category_id=category_id)
+    for item in result.items:
+        tags.extend(cache_tags(product_no=item.product_no))
+    return tags
+
+
+async def load_categories() -> CategoryList:
+    """데이터베이스에서 카테고리 조회 (백그라운드 갱신에서도 호출되므로 요청 세션을 쓰지 않음)"""
+    query = text("""
+        SELECT 
+            category_id,
+            category_name,
+            category_code,
+            parent_category_id,
+            depth,
+            created_at,
+            updated_at
+        FROM categories 
+        ORDER BY depth, category_name
+    """)
+    
+    async with get_replica_router().read_session() as db:
+        result = await db.execute(query)
+        categories = []
+        
+        for row in result:
+            categories.append(Category(
+                category_id=row.category_id,
+                category_name=row.category_name,
+                category_code=row.category_code,
+                parent_category_id=row.parent_category_id,
+                depth=row.depth,
+                created_at=row.created_at,
+                updated_at=row.updated_at
+            ))
+    
+    return CategoryList(items=categories, total=len(categories))
 
 
 class ProductService:
@@ -52,7 +114,7 @@ class ProductService:
             logger.info(f"Searching for product with product_no: {product_no}")
             
             # OpenSearch에서 검색 실행
-            search_results = self.opensearch_client.search("products", query)
+            search_results = await self.opensearch_client.search("products", query, source_profile="product_detail")
             
             if not search_results:
                 logger.warning(f"Product not found: {product_no}")
@@ -72,6 +134,70 @@ class ProductService:
             logger.error(f"Error getting product {product_no}: {e}")
             return None
 
+    async def get_products_batch(self, product_nos: List[str]) -> Dict[str, Product]:
+        """여러 상품을 한 번에 조회
+
+        상세 조회(GET /products/{product_no})와 같은 product:{no} 캐시를 MGET으로 먼저 확인하고,
+        캐시에 없는 상품만 OpenSearch _mget 한 번으로 가져와 파이프라인으로 캐시에 저장한다.
+        """
+        try:
+            product_nos = [str(product_no) for product_no in dict.fromkeys(product_nos)]
+            if not product_nos:
+                return {}
+
+            if not self.redis_client:
+                return await self._load_products_batch(product_nos)
+
+            cached = await self.redis_client.get_or_compute_many(
+                [f"product:{product_no}" for product_no in product_nos],
+                self._load_products_by_keys,
+                ttl=settings.CACHE_TAGGED_TTL,
+                stale_ttl=300,
+                model=Product,
+                tags=lambda p: cache_tags(product_no=p.product_no, brand=p.brand, category=p.category),
+            )
+            return {key.split(":", 1)[1]: product for key, product in cached.items()}
+
+        except Exception as e:
+            logger.error(f"Error getting products batch: {e}")
+            return {}
+
+    async def _load_products_by_keys(self, keys: List[str]) -> Dict[str, Product]:
+        products = await self._load_products_batch([key.split(":", 1)[1] for key in keys])
+        return {f"product:{product_no}": product for product_no, product in products.items()}
+
+    async def _load_products_batch(self, product_nos: List[str]) -> Dict[str, Product]:
+        """OpenSearch _mget으로 상품 조회
+
+        _id가 product_no인 인덱스(opensearch_migration.py로 다시 적재한 인덱스)는 _mget 한 번으로 끝나고,
+        _id가 자동 생성된 이전 인덱스에서 _mget으로 찾지 못한 상품은 product_no terms 검색으로 조회한다.
+        """
+        if not self.opensearch_client:
+            logger.warning("OpenSearch client not available")
+            return {}
+
+        documents = await self.opensearch_client.mget_documents(
+            "products", product_nos, source_profile="product_detail"
+        )
+        missing = [product_no for product_no in product_nos if product_no not in documents]
+        if missing:
+            hits = await self.opensearch_client.search(
+                "products",
+                {"query": {"terms": {"product_no": missing}}},
+                size=len(missing),
+                source_profile="product_detail",
+            )
+            for document in hits:
+                if document.get("product_no") is not None:
+                    documents[str(document["product_no"])] = document
+        
+        products = {}
+        for product_no, document in documents.items():
+            product = self._convert_to_product_schema(document)
+            if product:
+                products[product_no] = product
+        return products
+
     async def create_product(self, product: ProductCreate) -> Product:
         """상품 생성"""
         # 기본 구현: 더미 데이터 반환
@@ -94,15 +220,42 @@ class ProductService:
     async def update_product(self, product_no: str, product: ProductUpdate) -> Optional[Product]:
         """상품 수정"""
         logger.info(f"Updating product: {product_no}")
+        await self.invalidate_product_cache(product_no, brand=product.brand, category=product.category)
         return None
 
     async def delete_product(self, product_no: str) -> bool:
         """상품 삭제"""
         logger.info(f"Deleting product: {product_no}")
+        await self.invalidate_product_cache(product_no)
         return True
 
-    async def search_products(self, search_params: ProductSearch, page: int, size: int) -> ProductList:
-        """OpenSearch를 사용한 상품 검색"""
+    async def invalidate_product_cache(
+        self, product_no: str, brand: Optional[str] = None, category: Optional[str] = None
+    ) -> int:
+        """상품 상세/목록/검색/리뷰 캐시 중 해당 상품에 의존하는 키 삭제
+
+        brand/category는 변경 후 값으로, 새로 해당 필터에 포함되는 목록도 무효화한다.
+        리뷰 변경 시에도 product_no만으로 호출하면 리뷰 목록과 요약 캐시가 삭제된다.
+        """
+        if not self.redis_client:
+            return 0
+        return await self.redis_client.invalidate_tags(
+            cache_tags(product_no=product_no, brand=brand, category=category)
+        )
+
+    async def search_products(
+        self,
+        search_params: ProductSearch,
+        page: int,
+        size: int,
+        deadline_ms: Optional[float] = None
+    ) -> ProductList:
+        """OpenSearch를 사용한 상품 검색
+
+        deadline_ms(미지정 시 OPENSEARCH_SEARCH_DEADLINE_MS) 안에 끝나지 않으면
+        그때까지 모인 부분 결과를 timed_out=True로 반환한다.
+        """
+        deadline_ms = self._resolve_deadline(deadline_ms)
         try:
             if not self.opensearch_client:
                 logger.warning("OpenSearch client not available, returning empty results")
@@ -113,12 +266,15 @@ class ProductService:
             
             logger.info(f"OpenSearch query: {search_query}")
             
-            # OpenSearch에서 검색 실행
-            search_results = self.opensearch_client.search("products", search_query)
+            # OpenSearch에서 검색 실행 (hits와 전체 건수를 한 번에 조회)
+            search_response = await self.opensearch_client.search_with_meta(
+                "products", search_query, size=size, source_profile="product_card",
+                deadline_ms=deadline_ms, hedge=True
+            )
             
             # 결과를 Product 스키마로 변환
             products = []
-            for result in search_results:
+            for result in search_response["hits"]:
                 try:
                     product = self._convert_to_product_schema(result)
                     if product:
@@ -127,18 +283,22 @@ class ProductService:
                     logger.warning(f"Failed to convert search result to product schema: {e}")
                     continue
             
-            # 전체 결과 수 조회
-            total = self._get_total_count(search_params)
+            total = search_response["total"]
             pages = (total + size - 1) // size if total > 0 else 0
             
-            logger.info(f"Search completed: {len(products)} products found, total: {total}")
+            logger.info(
+                f"Search completed: {len(products)} products found, "
+                f"total: {total} ({search_response['total_relation']}), took: {search_response['took']}ms"
+                f"{', timed out' if search_response['timed_out'] else ''}"
+            )
             
             return ProductList(
                 items=products,
                 total=total,
                 page=page,
                 size=size,
-                total_pages=pages
+                total_pages=pages,
+                timed_out=search_response["timed_out"]
             )
             
         except Exception as e:
@@ -237,6 +397,12 @@ class ProductService:
             query["query"]["bool"]["filter"] = filters
         
         # 정렬 처리
+        query["sort"] = self._build_sort(search_params)
+        
+        return query
+
+    def _build_sort(self, search_params: ProductSearch) -> List[Dict[str, Any]]:
+        """정렬 조건 생성"""
         sort_field = search_params.sort_by or "created_at"
         sort_order = search_params.sort_order or "desc"
         
@@ -251,12 +417,169 @@ class ProductService:
         
         opensearch_sort_field = sort_mapping.get(sort_field, "created_at")
         
-        query["sort"] = [
+        return [
             {opensearch_sort_field: {"order": sort_order}},
             {"_score": {"order": "desc"}}  # 검색 점수도 고려
         ]
+
+    async def search_products_cached(
+        self,
+        search_params: ProductSearch,
+        page: int = 1,
+        size: int = 20,
+        deadline_ms: Optional[float] = None,
+        bypass: bool = False,
+    ) -> ProductList:
+        """정규화된 검색 조건 기준 결과 캐시를 거친 상품 검색 (bypass=True면 다시 검색하여 캐시 갱신)"""
+        return await cached_query(
+            self.redis_client,
+            "products_search",
+            {**search_params.model_dump(mode="json"), "page": page, "size": size},
+            lambda: self.search_products(search_params, page, size, deadline_ms),
+            ttl=settings.QUERY_CACHE_TTL_PRODUCT_SEARCH,
+            model=ProductList,
+            bypass=bypass,
+            # deadline 초과 부분 결과나 OpenSearch 장애 중의 빈 결과는 캐시하지 않음
+            cacheable=lambda r: not r.timed_out and not opensearch_breaker.is_open,
+            tags=lambda r: product_list_tags(r, search_params.brand, search_params.category, search_params.category_id),
+        )
+
+    async def search_products_cursor(
+        self,
+        search_params: ProductSearch,
+        size: int,
+        cursor: Optional[str] = None,
+        deadline_ms: Optional[float] = None
+    ) -> ProductList:
+        """PIT + search_after 기반 커서 페이지네이션 상품 검색 (무한 스크롤용)
+
+        첫 요청(cursor 없음)에서 point-in-time을 열고 전체 건수를 계산하며,
+        이후 페이지는 커서에 담긴 정렬 값부터 이어서 조회하므로 페이지 깊이와 무관하게 비용이 같다.
+        잘못되었거나 다른 검색 조건의 커서이면 ValueError를 발생시킨다.
+        deadline을 넘기면 같은 커서로 다시 요청할 수 있도록 빈 결과와 timed_out=True를 반환한다.
+        """
+        deadline_ms = self._resolve_deadline(deadline_ms)
+        fingerprint = self._search_fingerprint(search_params)
+        state = self._decode_cursor(cursor) if cursor else None
+        if state and state.get("fp") != fingerprint:
+            raise ValueError("Cursor does not match the search parameters")
         
-        return query
+        page = state["page"] + 1 if state else 1
+        
+        try:
+            if not self.opensearch_client:
+                logger.warning("OpenSearch client not available, returning empty results")
+                return ProductList(items=[], total=0, page=page, size=size, total_pages=0)
+            
+            search_query = self._build_search_query(search_params, 1, size)
+            search_query.pop("from", None)
+            # 정렬 값이 같은 문서 사이의 순서를 고정하는 tiebreaker
+            search_query["sort"].append({"product_no": {"order": "asc"}})
+            # 전체 건수는 첫 페이지에서만 계산하고 이후에는 커서에 담아 전달
+            search_query["track_total_hits"] = settings.OPENSEARCH_TRACK_TOTAL_HITS if state is None else False
+            
+            keep_alive = settings.OPENSEARCH_PIT_KEEP_ALIVE
+            search_after = state["after"] if state else None
+            pit_id = state["pit"] if state else await self.opensearch_client.create_pit("products", keep_alive)
+            
+            search_response = None
+            if pit_id:
+                try:
+                    search_response = await self.opensearch_client.search_pit(
+                        pit_id, keep_alive, search_query, search_after,
+                        source_profile="product_card", deadline_ms=deadline_ms
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(f"Cursor search exceeded deadline of {deadline_ms}ms: page {page}")
+                    return ProductList(
+                        items=[], total=state["total"] if state else 0, page=page, size=size,
+                        total_pages=0, next_cursor=cursor, timed_out=True
+                    )
+                except Exception as e:
+                    # PIT 만료 등: 스냅샷 일관성 없이 search_after만으로 이어서 조회
+                    logger.warning(f"PIT search failed, falling back to plain search_after: {e}")
+            
+            if search_response is None:
+                if search_after:
+                    search_query["search_after"] = search_after
+                search_response = await self.opensearch_client.search_with_meta(
+                    "products", search_query, size=size, source_profile="product_card",
+                    deadline_ms=deadline_ms
+                )
+                search_response["pit_id"] = None
+            
+            products = []
+            for result in search_response["hits"]:
+                try:
+                    product = self._convert_to_product_schema(result)
+                    if product:
+                        products.append(product)
+                except Exception as e:
+                    logger.warning(f"Failed to convert search result to product schema: {e}")
+                    continue
+            
+            total = state["total"] if state else search_response["total"]
+            pages = (total + size - 1) // size if total > 0 else 0
+            
+            next_cursor = None
+            if search_response["timed_out"]:
+                # deadline 초과(빈 응답 또는 일부 샤드만 응답): 응답하지 않은 샤드의 문서를 건너뛰지 않도록
+                # 커서를 진행하지 않고 같은 커서로 다시 조회
+                next_cursor = cursor
+                if state is None and search_response["pit_id"]:
+                    # 첫 페이지에서 만든 PIT는 커서에 담기지 않으므로 해제
+                    await self.opensearch_client.delete_pit(search_response["pit_id"])
+            elif len(search_response["hits"]) == size and search_response["last_sort"]:
+                next_cursor = self._encode_cursor({
+                    "pit": search_response["pit_id"],
+                    "after": search_response["last_sort"],
+                    "total": total,
+                    "page": page,
+                    "fp": fingerprint,
+                })
+            elif search_response["pit_id"]:
+                # 마지막 페이지: PIT 즉시 해제
+                await self.opensearch_client.delete_pit(search_response["pit_id"])
+            
+            logger.info(f"Cursor search completed: page {page}, {len(products)} products, took: {search_response['took']}ms")
+            
+            return ProductList(
+                items=products,
+                total=total,
+                page=page,
+                size=size,
+                total_pages=pages,
+                next_cursor=next_cursor,
+                timed_out=search_response["timed_out"]
+            )
+            
+        except Exception as e:
+            logger.error(f"Error in cursor product search: {e}")
+            return ProductList(items=[], total=0, page=page, size=size, total_pages=0)
+
+    def _resolve_deadline(self, deadline_ms: Optional[float]) -> Optional[float]:
+        """요청별 deadline (없으면 설정 기본값, 0이면 제한 없음)"""
+        return deadline_ms or settings.OPENSEARCH_SEARCH_DEADLINE_MS or None
+
+    def _search_fingerprint(self, search_params: ProductSearch) -> str:
+        """커서와 검색 조건의 일치 여부를 확인하기 위한 해시"""
+        return hashlib.sha1(search_params.model_dump_json().encode("utf-8")).hexdigest()[:16]
+
+    def _encode_cursor(self, state: Dict[str, Any]) -> str:
+        """커서 상태를 불투명 토큰으로 인코딩"""
+        raw = json.dumps(state, separators=(",", ":"), default=str).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def _decode_cursor(self, cursor: str) -> Dict[str, Any]:
+        """커서 토큰 디코딩"""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            state = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            if not isinstance(state.get("after"), list) or not isinstance(state.get("page"), int):
+                raise ValueError("missing cursor fields")
+            return state
+        except Exception as e:
+            raise ValueError(f"Invalid cursor: {e}")
 
     def _convert_to_product_schema(self, opensearch_result: Dict[str, Any]) -> Optional[Product]:
         """OpenSearch 결과를 Product 스키마로 변환"""
@@ -305,29 +628,13 @@ class ProductService:
             logger.error(f"Result data: {opensearch_result}")
             return None
 
-    def _get_total_count(self, search_params: ProductSearch) -> int:
-        """검색 결과 총 개수 조회"""
-        try:
-            if not self.opensearch_client:
-                return 0
-                
-            # count 쿼리 생성 (페이징 제외)
-            count_query = self._build_search_query(search_params, 1, 1)
-            count_query.pop("from", None)
-            count_query.pop("size", None)
-            count_query.pop("sort", None)
-            
-            # OpenSearch count API 사용
-            result = self.opensearch_client.client.count(
-                index="products",
-                body=count_query
-            )
-            
-            return result.get("count", 0)
-            
-        except Exception as e:
-            logger.error(f"Error getting total count: {e}")
-            return 0
+    async def get_categories(self, force_refresh: bool = False) -> CategoryList:
+        """카테고리 목록 조회 (만료 후 10분까지는 이전 목록을 응답하면서 백그라운드에서 갱신)"""
+        if not self.redis_client:
+            return await load_categories()
+        return await self.redis_client.get_or_compute(
+            CATEGORIES_CACHE_KEY, load_categories, ttl=600, stale_ttl=600, force_refresh=force_refresh
+        )
 
     async def get_product_stats(self) -> ProductStats:
         """상품 통계 조회"""
@@ -351,24 +658,15 @@ class ProductService:
                 logger.warning("OpenSearch client not available")
                 return ProductList(items=[], total=0, page=1, size=size, total_pages=0)
 
-            # 기준 상품 정보 조회
-            base_product_query = {
-                "query": {
-                    "term": {
-                        "product_no": product_no
-                    }
-                },
-                "size": 1
-            }
-            
-            base_results = self.opensearch_client.search("products", base_product_query)
-            if not base_results:
+            # 기준 상품 조회 (캐시 우선)
+            base_products = await self.get_products_batch([product_no])
+            base_product = base_products.get(str(product_no))
+            if not base_product:
                 logger.warning(f"Base product not found: {product_no}")
                 return ProductList(items=[], total=0, page=1, size=size, total_pages=0)
-                
-            base_product = base_results[0]
             
-            # More Like This 쿼리 구성
+
+            # More Like This 쿼리 구성 (인덱스의 _id 체계와 무관하도록 기준 상품 내용을 문서로 전달)
             mlt_query = {
                 "query": {
                     "more_like_this": {
@@ -376,7 +674,12 @@ class ProductService:
                         "like": [
                             {
                                 "_index": "products",
-                                "_id": base_product.get("_id")
+                                "doc": {
+                                    "product_name": base_product.name,
+                                    "description": base_product.description,
+                                    "brand": base_product.brand,
+                                    "category": {"category_name": base_product.category}
+                                }
                             }
                         ],
                         "min_term_freq": 1,
@@ -385,8 +688,7 @@ class ProductService:
                         "minimum_should_match": "20%"
                     }
                 },
-                "size": size,
-                "_source": True
+                "size": size
             }
             
             # 기준 상품 제외 필터 추가
@@ -406,7 +708,7 @@ class ProductService:
             logger.info(f"More Like This query for product {product_no}: {mlt_query}")
             
             # 검색 실행
-            similar_results = self.opensearch_client.search("products", mlt_query)
+            similar_results = await self.opensearch_client.search("products", mlt_query, source_profile="product_card")
             
             # 결과를 Product 스키마로 변환
             products = []
@@ -455,7 +757,6 @@ class ProductService:
                     }
                 },
                 "size": size,
-                "_source": True,
                 "sort": [
                     {"_score": {"order": "desc"}},
                     {"statistics.average_rating": {"order": "desc"}}
@@ -465,7 +766,7 @@ class ProductService:
             logger.info(f"Content-based search query: {mlt_query}")
             
             # 검색 실행
-            search_results = self.opensearch_client.search("products", mlt_query)
+            search_results = await self.opensearch_client.search("products", mlt_query, source_profile="product_card")
             
             # 결과를 Product 스키마로 변환
             products = []
@@ -3,22 +3,31 @@
 """
 
 import asyncio
+import base64
+import json
+from datetime import datetime
 from typing import List, Dict, Any, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 from loguru import logger
+from app.core.config import settings
+from app.core.database import get_replica_router
+from app.core.health import opensearch_breaker
+from app.core.query_cache import cached_query, normalize_text
+from app.core.redis_client import cache_tags
 from app.core.vertex_client import get_vertex_client
 from app.schemas.product import ProductList
 from app.schemas.review import ReviewList, ReviewSearchParams, Review
 from app.schemas.member import Member
 from app.services.member_service import MemberService
+from app.services.product_service import ProductService
 from decimal import Decimal
 
 
 class ReviewHybridSearchService:
     """리뷰 기반 하이브리드 검색 서비스"""
     
-    def __init__(self, db: Session, redis_client=None, opensearch_client=None):
+    def __init__(self, db: AsyncSession, redis_client=None, opensearch_client=None):
         self.db = db
         self.redis_client = redis_client
         self.opensearch_client = opensearch_client
@@ -38,11 +47,11 @@ class ReviewHybridSearchService:
                 logger.warning("OpenSearch client not available")
                 return {"reviews": [], "total": 0, "page": page, "size": size}
 
-            # 1. 키워드 검색 결과
-            keyword_results = await self._keyword_search(query, page, size)
-            
-            # 2. 임베딩 검색 결과
-            embedding_results = await self._embedding_search(query, page, size)
+            # 1. 키워드 검색 + 2. 임베딩 검색 (동시 실행)
+            keyword_results, embedding_results = await asyncio.gather(
+                self._keyword_search(query, page, size),
+                self._embedding_search(query, page, size)
+            )
             
             # 3. 하이브리드 결과 병합
             hybrid_results = self._merge_results(
@@ -63,7 +72,7 @@ class ReviewHybridSearchService:
             
             members_dict = {}
             if member_nos:
-                members_dict = self.member_service.get_members_batch(member_nos)
+                members_dict = await self.member_service.get_members_batch(member_nos)
             
             # Review 스키마로 변환
             reviews = []
@@ -90,6 +99,41 @@ class ReviewHybridSearchService:
             logger.error(f"Hybrid search failed: {e}")
             return {"reviews": [], "total": 0, "page": page, "size": size}
     
+    async def search_reviews_hybrid_cached(
+        self,
+        query: str,
+        page: int = 1,
+        size: int = 20,
+        hybrid_weight: float = 0.5,
+        bypass: bool = False
+    ) -> Dict[str, Any]:
+        """정규화된 검색어/가중치 기준 결과 캐시를 거친 하이브리드 리뷰 검색
+
+        캐시 갱신은 응답 후 백그라운드에서도 실행되므로, loader는 요청 세션 대신 자체 읽기 세션을 연다.
+        """
+        query = normalize_text(query) or ""
+        hybrid_weight = round(hybrid_weight, 2)
+        
+        async def load():
+            async with get_replica_router().read_session() as db:
+                review_service = ReviewHybridSearchService(db, self.redis_client, self.opensearch_client)
+                return await review_service.search_reviews_hybrid(
+                    query=query,
+                    page=page,
+                    size=size,
+                    hybrid_weight=hybrid_weight
+                )
+        
+        return await cached_query(
+            self.redis_client,
+            "reviews_search_hybrid",
+            {"query": query, "page": page, "size": size, "hybrid_weight": hybrid_weight},
+            load,
+            ttl=settings.QUERY_CACHE_TTL_REVIEW_SEARCH,
+            bypass=bypass,
+            cacheable=lambda r: not opensearch_breaker.is_open,
+        )
+    
     async def _keyword_search(self, query: str, page: int, size: int) -> List[Dict[str, Any]]:
         """키워드 기반 리뷰 검색 (BM25)"""
         try:
@@ -126,12 +170,11 @@ class ReviewHybridSearchService:
                     {"_score": {"order": "desc"}},
                     {"rating": {"order": "desc"}},
                     {"helpful_count": {"order": "desc"}}
-                ],
-                "_source": True
+                ]
             }
             
             logger.info(f"Keyword search query: {query}")
-            results = self.opensearch_client.search("reviews", search_query)
+            results = await self.opensearch_client.search("reviews", search_query, source_profile="review_list")
             
             # 키워드 점수 추가
             for result in results:
@@ -172,12 +215,11 @@ class ReviewHybridSearchService:
                     }
                 },
                 "size": size * 2,
-                "min_score": 1.1,  # 최소 유사도 임계값
-                "_source": True
+                "min_score": 1.1  # 최소 유사도 임계값
             }
             
             logger.info(f"Vector search with embedding dimension: {len(query_embedding)}")
-            results = self.opensearch_client.search("reviews", vector_search_query)
+            results = await self.opensearch_client.search("reviews", vector_search_query, source_profile="review_list")
             
             # 임베딩 점수 추가
             for result in results:
@@ -318,14 +360,16 @@ class ReviewHybridSearchService:
             page_products = sorted_products[start_idx:end_idx]
             
             # 5. ProductList 형태로 변환
+            # 실제 상품 정보 조회 (캐시 MGET 후 없는 상품만 OpenSearch _mget 한 번)
+            product_service = ProductService(self.db, self.redis_client, self.opensearch_client)
+            product_map = await product_service.get_products_batch(
+                [product_no for product_no, _ in page_products]
+            )
+            
             products = []
-            for product_no, data in page_products:
-                # 실제 상품 정보 조회 (OpenSearch에서)
-                product = await self._get_product_by_id(product_no)
+            for product_no, _ in page_products:
+                product = product_map.get(str(product_no))
                 if product:
-                    # 리뷰 기반 점수 추가
-                    product["review_based_score"] = round(data["total_score"], 2)
-                    product["matching_reviews"] = data["review_count"]
                     products.append(product)
             
             total_pages = (len(sorted_products) + size - 1) // size
@@ -342,35 +386,16 @@ class ReviewHybridSearchService:
             logger.error(f"Review-based product search failed: {e}")
             return ProductList(items=[], total=0, page=page, size=size, total_pages=0)
     
-    async def _get_product_by_id(self, product_no: str) -> Optional[Dict[str, Any]]:
-        """상품 정보 조회"""
-        try:
-            if not self.opensearch_client:
-                return None
-            
-            query = {
-                "query": {
-                    "term": {
-                        "product_no": product_no
-                    }
-                },
-                "size": 1
-            }
-            
-            results = self.opensearch_client.search("products", query)
-            return results[0] if results else None
-            
-        except Exception as e:
-            logger.error(f"Product lookup failed: {e}")
-            return None
-
     async def get_product_reviews(
         self, 
         product_no: str,
         page: int = 1, 
         size: int = 20
     ) -> ReviewList:
-        """특정 상품의 리뷰 목록 조회 (생성일 내림차순)"""
+        """특정 상품의 리뷰 목록 조회 (생성일 내림차순, 페이지 번호 기반)
+
+        깊은 페이지일수록 OFFSET 비용이 커지므로 무한 스크롤은 get_product_reviews_cursor를 사용한다.
+        """
         try:
             # product_no를 정수로 변환
             try:
@@ -379,63 +404,17 @@ class ReviewHybridSearchService:
                 logger.error(f"Invalid product_no: {product_no}")
                 return ReviewList(items=[], total=0, page=page, size=size, total_pages=0)
             
-            logger.info(f"Searching reviews for product_no: {product_no_int}")
-            
-            # SQL 쿼리 구성
-            base_query = text("""
-            SELECT 
-                r.review_id,
-                r.product_no,
-                r.member_no,
-                r.rating,
-                r.review_text,
-                r.review_date,
-                r.helpful_count,
-                r.created_at,
-                r.updated_at,
-                m.member_id as member_id
-            FROM reviews r
-            LEFT JOIN members m ON r.member_no = m.member_no
-            WHERE r.product_no = :product_no
-            ORDER BY r.created_at DESC
-            LIMIT :limit OFFSET :offset
-            """)
-            
-            count_query = text("""
-            SELECT COUNT(*) as total
-            FROM reviews r
-            WHERE r.product_no = :product_no
-            """)
-            
-            # 전체 개수 조회
-            cursor = self.db.execute(count_query, {"product_no": product_no_int})
-            total_result = cursor.fetchone()
-            total = total_result.total if total_result else 0
-            
-            logger.info(f"Total reviews found for product {product_no_int}: {total}")
+            # 전체 개수는 요청마다 COUNT(*) 대신 통계 테이블/캐시에서 조회
+            total = await self._get_review_total(product_no_int)
             
             # 리뷰 데이터 조회
             offset = (page - 1) * size
-            cursor = self.db.execute(base_query, {
-                "product_no": product_no_int, 
-                "limit": size, 
-                "offset": offset
-            })
-            results = cursor.fetchall()
-            
-            logger.info(f"SQL query returned {len(results)} results")
-            
-            # Review 스키마로 변환
-            reviews = []
-            for result in results:
-                try:
-                    review = self._convert_sql_to_review_schema(result)
-                    if review:
-                        reviews.append(review)
-                except Exception as e:
-                    logger.warning(f"Failed to convert review result: {e}")
-                    continue
+            results = await self._fetch_review_rows(
+                "LIMIT :limit OFFSET :offset",
+                {"product_no": product_no_int, "limit": size, "offset": offset}
+            )
             
+            reviews = self._convert_review_rows(results)
             pages = (total + size - 1) // size if total > 0 else 0
             
             logger.info(f"Review search completed: {len(reviews)} reviews found, total: {total}")
@@ -452,6 +431,158 @@ class ReviewHybridSearchService:
             logger.error(f"Error in review search: {e}")
             return ReviewList(items=[], total=0, page=page, size=size, total_pages=0)
 
+    async def get_product_reviews_cursor(
+        self,
+        product_no: str,
+        size: int = 20,
+        cursor: Optional[str] = None
+    ) -> ReviewList:
+        """(created_at, review_id) 키셋 커서 기반 리뷰 목록 조회 (무한 스크롤용)
+
+        커서에 담긴 마지막 리뷰의 (created_at, review_id) 다음부터 인덱스 순서대로 읽으므로
+        페이지 깊이와 무관하게 첫 페이지와 비용이 같다. 잘못되었거나 다른 상품의 커서이면 ValueError를 발생시킨다.
+        """
+        state = self._decode_cursor(cursor) if cursor else None
+        if state and state.get("p") != product_no:
+            raise ValueError("Cursor does not match the product")
+        
+        page = state["page"] + 1 if state else 1
+        
+        try:
+            product_no_int = int(product_no)
+        except ValueError:
+            logger.error(f"Invalid product_no: {product_no}")
+            return ReviewList(items=[], total=0, page=page, size=size, total_pages=0)
+        
+        try:
+            params = {"product_no": product_no_int, "limit": size + 1}
+            keyset = ""
+            if state:
+                keyset = """AND (r.created_at < :after_created_at
+                 OR (r.created_at = :after_created_at AND r.review_id < :after_review_id))"""
+                params["after_created_at"] = datetime.fromisoformat(state["after"][0])
+                params["after_review_id"] = state["after"][1]
+            
+            # 다음 페이지 존재 여부 확인을 위해 size + 1건 조회
+            results = await self._fetch_review_rows("LIMIT :limit", params, keyset)
+            has_more = len(results) > size
+            results = results[:size]
+            
+            total = await self._get_review_total(product_no_int)
+            
+            next_cursor = None
+            if has_more and results:
+                last = results[-1]
+                created_at = last.created_at
+                if isinstance(created_at, str):
+                    created_at = datetime.fromisoformat(created_at)
+                next_cursor = self._encode_cursor({
+                    "p": product_no,
+                    "after": [created_at.isoformat(), last.review_id],
+                    "page": page,
+                })
+            
+            return ReviewList(
+                items=self._convert_review_rows(results),
+                total=total,
+                page=page,
+                size=size,
+                total_pages=(total + size - 1) // size if total > 0 else 0,
+                next_cursor=next_cursor
+            )
+            
+        except Exception as e:
+            logger.error(f"Error in review cursor search: {e}")
+            return ReviewList(items=[], total=0, page=page, size=size, total_pages=0)
+
+    async def _fetch_review_rows(self, limit_clause: str, params: Dict[str, Any], keyset: str = "") -> List[Any]:
+        """상품 리뷰 행 조회 ((created_at, review_id) 내림차순, 동일 시각 리뷰의 순서 고정)"""
+        query = text(f"""
+        SELECT 
+            r.review_id,
+            r.product_no,
+            r.member_no,
+            r.rating,
+            r.review_text,
+            r.review_date,
+            r.helpful_count,
+            r.created_at,
+            r.updated_at,
+            m.member_id as member_id
+        FROM reviews r
+        LEFT JOIN members m ON r.member_no = m.member_no
+        WHERE r.product_no = :product_no
+        {keyset}
+        ORDER BY r.created_at DESC, r.review_id DESC
+        {limit_clause}
+        """)
+        
+        cursor = await self.db.execute(query, params)
+        return cursor.fetchall()
+
+    def _convert_review_rows(self, results: List[Any]) -> List[Review]:
+        """SQL 결과 목록을 Review 스키마 목록으로 변환"""
+        reviews = []
+        for result in results:
+            try:
+                review = self._convert_sql_to_review_schema(result)
+                if review:
+                    reviews.append(review)
+            except Exception as e:
+                logger.warning(f"Failed to convert review result: {e}")
+                continue
+        return reviews
+
+    async def _get_review_total(self, product_no: int) -> int:
+        """상품 리뷰 수 (product_statistics.total_reviews, 없으면 캐시된 COUNT(*))"""
+        cursor = await self.db.execute(
+            text("SELECT total_reviews FROM product_statistics WHERE product_no = :product_no"),
+            {"product_no": product_no}
+        )
+        row = cursor.fetchone()
+        if row and row.total_reviews is not None:
+            return int(row.total_reviews)
+        
+        # 캐시 갱신은 백그라운드에서도 실행되므로 요청 세션 대신 자체 읽기 세션 사용
+        async def count_reviews():
+            async with get_replica_router().read_session() as db:
+                cursor = await db.execute(
+                    text("SELECT COUNT(*) as total FROM reviews WHERE product_no = :product_no"),
+                    {"product_no": product_no}
+                )
+                result = cursor.fetchone()
+                return result.total if result else 0
+        
+        if not self.redis_client:
+            return await count_reviews()
+        
+        # 통계가 아직 없는 상품만 COUNT(*)를 계산하고, 상품 태그로 리뷰 변경 시 무효화
+        total = await self.redis_client.get_or_compute(
+            f"reviews:count:{product_no}",
+            count_reviews,
+            ttl=settings.CACHE_TAGGED_TTL,
+            tags=cache_tags(product_no=product_no)
+        )
+        return int(total or 0)
+
+    def _encode_cursor(self, state: Dict[str, Any]) -> str:
+        """커서 상태를 불투명 토큰으로 인코딩"""
+        raw = json.dumps(state, separators=(",", ":"), default=str).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def _decode_cursor(self, cursor: str) -> Dict[str, Any]:
+        """커서 토큰 디코딩"""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            state = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            after = state.get("after")
+            if not isinstance(after, list) or len(after) != 2 or not isinstance(state.get("page"), int):
+                raise ValueError("missing cursor fields")
+            datetime.fromisoformat(after[0])
+            return state
+        except Exception as e:
+            raise ValueError(f"Invalid cursor: {e}")
+
     def _convert_sql_to_review_schema(self, sql_result) -> Optional[Review]:
         """SQL 결과를 Review 스키마로 변환"""
         try:
@@ -490,13 +621,8 @@ class ReviewHybridSearchService:
             # member_no 추출 (OpenSearch에는 member_no로 저장됨)
             member_no = source.get("member_no")
             
-            # member 정보 조회
-            member = None
-            if member_no and members_dict and member_no in members_dict:
-                member = members_dict[member_no]
-            elif member_no:
-                # 개별 조회 (fallback)
-                member = self.member_service.get_member_by_no(member_no)
+            # member 정보 (호출 측에서 get_members_batch로 한 번에 조회, 없는 회원은 None)
+            member = members_dict.get(member_no) if member_no and members_dict else None
 
             return Review(
                 id=str(source.get("review_id", "")),
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+_source 프로젝션 프로필 벤치마크 스크립트
+
+서비스에서 사용하는 대표 쿼리를 전체 _source와 프로젝션 프로필로 각각 실행하여
+응답 크기와 지연 시간을 비교합니다.
+"""
+
+import sys
+import json
+import time
+import statistics
+import argparse
+from pathlib import Path
+
+# 백엔드 앱 모듈을 import하기 위해 경로 추가
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from typing import Dict, Any, List
+from loguru import logger
+from app.core.opensearch_client import get_opensearch_client, SOURCE_PROFILES
+
+
+class SourceProjectionBenchmark:
+    """_source 프로젝션 벤치마크 클래스"""
+
+    def __init__(self, iterations: int = 20, size: int = 20):
+        self.opensearch_client = get_opensearch_client()
+        self.iterations = iterations
+        self.size = size
+
+    def get_scenarios(self) -> List[Dict[str, Any]]:
+        """벤치마크 시나리오 (서비스 메서드별 대표 쿼리)"""
+        return [
+            {
+                "name": "상품 검색 (search_products)",
+                "index": "products",
+                "profile": "product_card",
+                "query": {
+                    "query": {"multi_match": {"query": "니트", "fields": ["product_name^3", "brand^2", "description^1.5"]}},
+                    "size": self.size
+                }
+            },
+            {
+                "name": "리뷰 키워드 검색 (_keyword_search)",
+                "index": "reviews",
+                "profile": "review_list",
+                "query": {
+                    "query": {"match": {"review_text": "좋아요"}},
+                    "size": self.size
+                }
+            },
+            {
+                "name": "리뷰 벡터 검색 (_embedding_search)",
+                "index": "reviews",
+                "profile": "review_list",
+                "query": {
+                    "query": {
+                        "script_score": {
+                            "query": {"match_all": {}},
+                            "script": {
+                                "source": "cosineSimilarity(params.query_vector, 'review_embedding') + 1.0",
+                                "params": {"query_vector": [0.1] * 768}
+                            }
+                        }
+                    },
+                    "size": self.size
+                }
+            },
+        ]
+
+    def run_query(self, index_name: str, body: Dict[str, Any]) -> Dict[str, float]:
+        """쿼리를 반복 실행하여 응답 크기와 지연 시간 측정"""
+        latencies = []
+        payload_bytes = 0
+
+        for _ in range(self.iterations):
+            start = time.perf_counter()
+            response = self.opensearch_client.client.search(index=index_name, body=body)
+            latencies.append((time.perf_counter() - start) * 1000)
+            payload_bytes = len(json.dumps(response, ensure_ascii=False).encode("utf-8"))
+
+        return {
+            "payload_kb": payload_bytes / 1024,
+            "p50_ms": statistics.median(latencies),
+            "p95_ms": sorted(latencies)[max(0, int(len(latencies) * 0.95) - 1)],
+        }
+
+    def run(self) -> bool:
+        """전체 시나리오 실행 및 결과 출력"""
+        if not self.opensearch_client.is_connected():
+            logger.error("OpenSearch 연결 실패")
+            return False
+
+        print(f"\n{'='*88}")
+        print(f"{'시나리오':<36}{'프로필':<16}{'응답(KB)':>12}{'p50(ms)':>12}{'p95(ms)':>12}")
+        print(f"{'='*88}")
+
+        for scenario in self.get_scenarios():
+            full = self.run_query(scenario["index"], scenario["query"])
+            projected = self.run_query(
+                scenario["index"],
+                {**scenario["query"], "_source": SOURCE_PROFILES[scenario["profile"]]}
+            )
+
+            for label, result in (("full _source", full), (scenario["profile"], projected)):
+                print(f"{scenario['name']:<36}{label:<16}{result['payload_kb']:>12.1f}"
+                      f"{result['p50_ms']:>12.1f}{result['p95_ms']:>12.1f}")
+
+            reduction = 1 - projected["payload_kb"] / full["payload_kb"] if full["payload_kb"] else 0
+            print(f"{'':<36}{'→ 응답 크기 감소':<16}{reduction*100:>11.1f}%")
+            print(f"{'-'*88}")
+
+        return True
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="_source 프로젝션 프로필 벤치마크")
+    parser.add_argument("--iterations", type=int, default=20, help="시나리오별 반복 횟수 (기본값: 20)")
+    parser.add_argument("--size", type=int, default=20, help="쿼리당 결과 수 (기본값: 20)")
+
+    args = parser.parse_args()
+
+    benchmark = SourceProjectionBenchmark(iterations=args.iterations, size=args.size)
+    return 0 if benchmark.run() else 1
+
+
+if __name__ == "__main__":
+    exit(main())
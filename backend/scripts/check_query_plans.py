@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+요청 경로 쿼리 실행 계획 점검 스크립트
+
+서비스가 실행하는 주요 쿼리를 EXPLAIN하여 테이블 전체 스캔이나 정렬(filesort)로
+떨어지는 쿼리가 있으면 실패(exit 1)합니다. 마이그레이션(alembic upgrade head) 적용 후
+CI나 배포 전에 실행합니다. MySQL은 EXPLAIN, SQLite(개발)는 EXPLAIN QUERY PLAN을 사용합니다.
+"""
+
+import sys
+from pathlib import Path
+
+# 백엔드 앱 모듈을 import하기 위해 경로 추가
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from typing import List, Dict, Any
+from loguru import logger
+from sqlalchemy import create_engine, text, bindparam
+from app.core.config import settings
+
+
+# (이름, 쿼리, 파라미터, 인덱스 순서로 정렬되어야 하는지) - 각 서비스의 쿼리와 같은 형태로 유지
+HOT_QUERIES = [
+    (
+        "review_service.get_product_reviews (offset)",
+        text("""
+        SELECT r.review_id, r.product_no, r.member_no, r.rating, r.review_text, r.review_date,
+               r.helpful_count, r.created_at, r.updated_at, m.member_id as member_id
+        FROM reviews r
+        LEFT JOIN members m ON r.member_no = m.member_no
+        WHERE r.product_no = :product_no
+        ORDER BY r.created_at DESC, r.review_id DESC
+        LIMIT :limit OFFSET :offset
+        """),
+        {"product_no": 1, "limit": 20, "offset": 0},
+        True,
+    ),
+    (
+        "review_service.get_product_reviews_cursor",
+        text("""
+        SELECT r.review_id, r.product_no, r.member_no, r.rating, r.review_text, r.review_date,
+               r.helpful_count, r.created_at, r.updated_at, m.member_id as member_id
+        FROM reviews r
+        LEFT JOIN members m ON r.member_no = m.member_no
+        WHERE r.product_no = :product_no
+        AND (r.created_at < :after_created_at
+             OR (r.created_at = :after_created_at AND r.review_id < :after_review_id))
+        ORDER BY r.created_at DESC, r.review_id DESC
+        LIMIT :limit
+        """),
+        {"product_no": 1, "after_created_at": "2025-01-01 00:00:00", "after_review_id": 1, "limit": 21},
+        True,
+    ),
+    (
+        "review_service._get_review_total (statistics)",
+        text("SELECT total_reviews FROM product_statistics WHERE product_no = :product_no"),
+        {"product_no": 1},
+        False,
+    ),
+    (
+        "review_service._get_review_total (count fallback)",
+        text("SELECT COUNT(*) as total FROM reviews WHERE product_no = :product_no"),
+        {"product_no": 1},
+        False,
+    ),
+    (
+        "member_service.get_members_batch",
+        text("""
+        SELECT member_no, member_id, name, email, created_at, updated_at
+        FROM members
+        WHERE member_no IN :member_nos
+        """),
+        {"member_nos": [1, 2, 3]},
+        False,
+    ),
+    (
+        "product_service.load_categories",
+        text("""
+        SELECT category_id, category_name, category_code, parent_category_id, depth, created_at, updated_at
+        FROM categories
+        ORDER BY depth, category_name
+        """),
+        {},
+        True,
+    ),
+]
+
+
+def render_query(connection, query, params: Dict[str, Any]) -> str:
+    """파라미터 값을 채운 SQL 문자열 (EXPLAIN 대상)"""
+    # 값으로 타입을 추론한 바인드 파라미터 (text()의 바인드는 타입이 없어 리터럴로 렌더링할 수 없음)
+    if params:
+        query = query.bindparams(*[
+            bindparam(key, value, expanding=isinstance(value, list)) for key, value in params.items()
+        ])
+    return str(query.compile(connection, compile_kwargs={"literal_binds": True}))
+
+
+def explain_mysql(connection, sql: str) -> List[str]:
+    """MySQL EXPLAIN 결과에서 문제 목록 추출 (type=ALL: 전체 스캔, Using filesort: 정렬)"""
+    problems = []
+    for row in connection.exec_driver_sql("EXPLAIN " + sql).mappings():
+        if row.get("type") == "ALL":
+            problems.append(f"full table scan on {row.get('table')}")
+        if "Using filesort" in (row.get("Extra") or ""):
+            problems.append(f"filesort on {row.get('table')}")
+    return problems
+
+
+def explain_sqlite(connection, sql: str) -> List[str]:
+    """SQLite EXPLAIN QUERY PLAN 결과에서 문제 목록 추출"""
+    problems = []
+    for row in connection.exec_driver_sql("EXPLAIN QUERY PLAN " + sql):
+        detail = row[-1]
+        # 인덱스만 읽는 전체 스캔(SCAN ... USING COVERING INDEX)은 정렬된 순서로 읽으므로 허용
+        if detail.startswith("SCAN") and "COVERING INDEX" not in detail:
+            problems.append(detail)
+        if "TEMP B-TREE" in detail:
+            problems.append(detail)
+    return problems
+
+
+def check_query_plans(database_url: str) -> bool:
+    """모든 주요 쿼리 실행 계획 점검 (문제가 없으면 True)"""
+    engine = create_engine(database_url)
+    ok = True
+    try:
+        with engine.connect() as connection:
+            dialect = connection.dialect.name
+            explain = explain_mysql if dialect == "mysql" else explain_sqlite
+            for name, query, params, ordered in HOT_QUERIES:
+                problems = explain(connection, render_query(connection, query, params))
+                if not ordered:
+                    problems = [p for p in problems if "filesort" not in p and "TEMP B-TREE" not in p]
+                if problems:
+                    ok = False
+                    logger.error(f"❌ {name}: {'; '.join(problems)}")
+                else:
+                    logger.info(f"✅ {name}")
+    finally:
+        engine.dispose()
+    return ok
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="주요 쿼리 실행 계획 점검 (전체 스캔/정렬 시 실패)")
+    parser.add_argument("--database-url", default=settings.DATABASE_URL, help="점검할 DB URL (기본값: 설정의 DATABASE_URL)")
+
+    args = parser.parse_args()
+
+    if not check_query_plans(args.database_url):
+        logger.error("Hot query plan check failed: add or fix indexes (alembic upgrade head)")
+        return 1
+    logger.info("All hot query plans use indexes")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -14,7 +14,7 @@ sys.path.insert(0, str(backend_path))
 import asyncio
 import mysql.connector
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 import json
 from loguru import logger
 from opensearchpy import OpenSearch
@@ -171,8 +171,8 @@ class OpenSearchMigration:
             raise
     
     def fetch_products_with_category(self, connection: mysql.connector.MySQLConnection, 
-                                   batch_size: int = 1000, offset: int = 0) -> List[Dict[str, Any]]:
-        """상품 데이터를 카테고리 정보와 함께 조회"""
+                                   batch_size: int = 1000, last_product_no: int = 0) -> List[Dict[str, Any]]:
+        """상품 데이터를 카테고리 정보와 함께 조회 (product_no 기준 키셋 페이징)"""
         query = """
         SELECT 
             p.product_no,
@@ -197,12 +197,13 @@ class OpenSearchMigration:
         FROM products p
         LEFT JOIN categories c ON p.category_id = c.category_id
         LEFT JOIN product_statistics ps ON p.product_no = ps.product_no
+        WHERE p.product_no > %s
         ORDER BY p.product_no
-        LIMIT %s OFFSET %s
+        LIMIT %s
         """
         
         cursor = connection.cursor(dictionary=True)
-        cursor.execute(query, (batch_size, offset))
+        cursor.execute(query, (last_product_no, batch_size))
         results = cursor.fetchall()
         cursor.close()
         
@@ -218,6 +219,7 @@ class OpenSearchMigration:
                     rating_distribution = None
             
             product = {
+                "_id": row['product_no'],  # 재실행 시 덮어쓰기, 부분 업데이트 시 직접 참조
                 "product_no": row['product_no'],
                 "product_id": row['product_id'],
                 "product_name": row['product_name'],
@@ -256,8 +258,8 @@ class OpenSearchMigration:
         return products
     
     def fetch_reviews_with_product(self, connection: mysql.connector.MySQLConnection,
-                                 batch_size: int = 1000, offset: int = 0) -> List[Dict[str, Any]]:
-        """리뷰 데이터를 상품 정보와 함께 조회"""
+                                 batch_size: int = 1000, last_review_id: int = 0) -> List[Dict[str, Any]]:
+        """리뷰 데이터를 상품 정보와 함께 조회 (review_id 기준 키셋 페이징)"""
         query = """
         SELECT 
             r.review_id,
@@ -272,12 +274,13 @@ class OpenSearchMigration:
             p.product_name
         FROM reviews r
         JOIN products p ON r.product_no = p.product_no
+        WHERE r.review_id > %s
         ORDER BY r.review_id
-        LIMIT %s OFFSET %s
+        LIMIT %s
         """
         
         cursor = connection.cursor(dictionary=True)
-        cursor.execute(query, (batch_size, offset))
+        cursor.execute(query, (last_review_id, batch_size))
         results = cursor.fetchall()
         cursor.close()
         
@@ -288,6 +291,7 @@ class OpenSearchMigration:
             sentiment = self.analyze_sentiment(row['review_text'])
             
             review = {
+                "_id": row['review_id'],
                 "review_id": row['review_id'],
                 "product_no": row['product_no'],
                 "member_no": row['member_no'],
@@ -304,6 +308,58 @@ class OpenSearchMigration:
         
         return reviews
     
+    def iter_products(self, connection: mysql.connector.MySQLConnection,
+                      batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """상품 문서를 배치 단위로 읽어 하나씩 반환 (메모리에는 한 배치만 유지)"""
+        last_product_no = 0
+        while True:
+            products = self.fetch_products_with_category(connection, batch_size, last_product_no)
+            if not products:
+                break
+            yield from products
+            last_product_no = products[-1]['product_no']
+    
+    def iter_reviews(self, connection: mysql.connector.MySQLConnection,
+                     batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """리뷰 문서를 배치 단위로 읽어 하나씩 반환 (메모리에는 한 배치만 유지)"""
+        last_review_id = 0
+        while True:
+            reviews = self.fetch_reviews_with_product(connection, batch_size, last_review_id)
+            if not reviews:
+                break
+            yield from reviews
+            last_review_id = reviews[-1]['review_id']
+    
+    def stream_documents(self, index_name: str, documents: Iterator[Dict[str, Any]],
+                         total: int, label: str, batch_size: int = 1000,
+                         bulk_workers: int = 4, max_chunk_bytes: int = 10 * 1024 * 1024) -> int:
+        """문서 스트림을 병렬 bulk 인덱서로 전송하고 성공 건수 반환"""
+        processed = 0
+        failed = 0
+        
+        for result in self.opensearch_client.streaming_bulk(
+            index_name,
+            documents,
+            chunk_size=batch_size,
+            max_chunk_bytes=max_chunk_bytes,
+            thread_count=bulk_workers,
+        ):
+            if result["ok"]:
+                processed += 1
+            else:
+                failed += 1
+            
+            done = processed + failed
+            if done % batch_size == 0:
+                logger.info(f"{label} 데이터 처리: {done:,}/{total:,} ({done/max(total, 1)*100:.1f}%), 실패 {failed:,}개")
+        
+        if failed:
+            logger.error(f"{label} 인덱싱 실패: {failed:,}개")
+        
+        # 적재 중에는 refresh를 생략했으므로 마지막에 한 번만 수행
+        self.opensearch_client.client.indices.refresh(index=index_name)
+        return processed
+    
     def analyze_sentiment(self, text: str) -> str:
         """간단한 감정 분석"""
         if not text:
@@ -331,7 +387,7 @@ class OpenSearchMigration:
         cursor.close()
         return count
     
-    def migrate_products(self, batch_size: int = 1000) -> bool:
+    def migrate_products(self, batch_size: int = 1000, bulk_workers: int = 4) -> bool:
         """상품 데이터 마이그레이션"""
         logger.info("상품 데이터 마이그레이션 시작")
         
@@ -351,25 +407,15 @@ class OpenSearchMigration:
             total_products = self.get_total_count(connection, "products")
             logger.info(f"총 상품 수: {total_products:,}개")
             
-            # 배치 처리
-            offset = 0
-            processed = 0
-            
-            while offset < total_products:
-                # 데이터 조회
-                products = self.fetch_products_with_category(connection, batch_size, offset)
-                
-                if not products:
-                    break
-                
-                # OpenSearch에 bulk 인덱싱
-                if self.opensearch_client.bulk_index(index_name, products):
-                    processed += len(products)
-                    logger.info(f"상품 데이터 처리: {processed:,}/{total_products:,} ({processed/total_products*100:.1f}%)")
-                else:
-                    logger.error(f"배치 처리 실패: offset {offset}")
-                
-                offset += batch_size
+            # 스트리밍 bulk 인덱싱
+            processed = self.stream_documents(
+                index_name,
+                self.iter_products(connection, batch_size),
+                total_products,
+                "상품",
+                batch_size=batch_size,
+                bulk_workers=bulk_workers,
+            )
             
             logger.info(f"상품 마이그레이션 완료: {processed:,}개")
             return True
@@ -380,7 +426,7 @@ class OpenSearchMigration:
         finally:
             connection.close()
     
-    def migrate_reviews(self, batch_size: int = 1000) -> bool:
+    def migrate_reviews(self, batch_size: int = 1000, bulk_workers: int = 4) -> bool:
         """리뷰 데이터 마이그레이션"""
         logger.info("리뷰 데이터 마이그레이션 시작")
         
@@ -400,25 +446,15 @@ class OpenSearchMigration:
             total_reviews = self.get_total_count(connection, "reviews")
             logger.info(f"총 리뷰 수: {total_reviews:,}개")
             
-            # 배치 처리
-            offset = 0
-            processed = 0
-            
-            while offset < total_reviews:
-                # 데이터 조회
-                reviews = self.fetch_reviews_with_product(connection, batch_size, offset)
-                
-                if not reviews:
-                    break
-                
-                # OpenSearch에 bulk 인덱싱
-                if self.opensearch_client.bulk_index(index_name, reviews):
-                    processed += len(reviews)
-                    logger.info(f"리뷰 데이터 처리: {processed:,}/{total_reviews:,} ({processed/total_reviews*100:.1f}%)")
-                else:
-                    logger.error(f"배치 처리 실패: offset {offset}")
-                
-                offset += batch_size
+            # 스트리밍 bulk 인덱싱
+            processed = self.stream_documents(
+                index_name,
+                self.iter_reviews(connection, batch_size),
+                total_reviews,
+                "리뷰",
+                batch_size=batch_size,
+                bulk_workers=bulk_workers,
+            )
             
             logger.info(f"리뷰 마이그레이션 완료: {processed:,}개")
             return True
@@ -471,7 +507,7 @@ class OpenSearchMigration:
             return False
     
     def run_migration(self, migrate_products: bool = True, migrate_reviews: bool = True, 
-                     batch_size: int = 1000) -> bool:
+                     batch_size: int = 1000, bulk_workers: int = 4) -> bool:
         """전체 마이그레이션 실행"""
         logger.info("🚀 OpenSearch 마이그레이션 시작")
         
@@ -484,12 +520,12 @@ class OpenSearchMigration:
         
         # 상품 마이그레이션
         if migrate_products:
-            if not self.migrate_products(batch_size):
+            if not self.migrate_products(batch_size, bulk_workers):
                 success = False
         
         # 리뷰 마이그레이션
         if migrate_reviews:
-            if not self.migrate_reviews(batch_size):
+            if not self.migrate_reviews(batch_size, bulk_workers):
                 success = False
         
         # 검색 테스트
@@ -512,6 +548,7 @@ def main():
     parser.add_argument("--products-only", action="store_true", help="상품 데이터만 마이그레이션")
     parser.add_argument("--reviews-only", action="store_true", help="리뷰 데이터만 마이그레이션")
     parser.add_argument("--batch-size", type=int, default=1000, help="배치 크기 (기본값: 1000)")
+    parser.add_argument("--bulk-workers", type=int, default=4, help="병렬 bulk 전송 워커 수 (기본값: 4)")
     
     args = parser.parse_args()
     
@@ -523,7 +560,8 @@ def main():
     success = migration.run_migration(
         migrate_products=migrate_products,
         migrate_reviews=migrate_reviews,
-        batch_size=args.batch_size
+        batch_size=args.batch_size,
+        bulk_workers=args.bulk_workers
     )
     
     return 0 if success else 1
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+무중단 Blue/Green 재인덱싱 스크립트
+
+products_v{N} / reviews_v{N} 버전 인덱스를 새로 만들어 적재하고, 검증을 통과하면
+products / reviews 읽기 별칭을 한 번의 요청으로 새 버전에 전환합니다.
+이전 버전은 설정한 개수만큼 남겨 두어 즉시 롤백할 수 있습니다.
+"""
+
+import sys
+import re
+from pathlib import Path
+
+# 백엔드 앱 모듈을 import하기 위해 경로 추가
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+import copy
+from typing import List, Dict, Any
+from loguru import logger
+from opensearch_migration import OpenSearchMigration
+
+
+# 적재 중 설정: refresh/복제/translog fsync를 끄고 적재 후 원래 값으로 복원
+LOAD_OPTIMIZED_SETTINGS = {
+    "refresh_interval": "-1",
+    "number_of_replicas": 0,
+    "translog.durability": "async",
+}
+
+# 적재 후 검증에 사용할 샘플 쿼리 (새 인덱스에서 결과가 있어야 함)
+SAMPLE_QUERIES = {
+    "products": [
+        {"query": {"match_all": {}}},
+        {"query": {"multi_match": {"query": "니트", "fields": ["product_name", "brand", "description"]}}},
+        {"query": {"range": {"price": {"gt": 0}}}},
+    ],
+    "reviews": [
+        {"query": {"match_all": {}}},
+        {"query": {"match": {"review_text": "좋아요"}}},
+        {"query": {"range": {"rating": {"gte": 4}}}},
+    ],
+}
+
+
+class BlueGreenReindexer:
+    """버전 인덱스 + 별칭 기반 Blue/Green 재인덱싱 클래스"""
+
+    def __init__(self, keep_versions: int = 2, count_tolerance: float = 0.0):
+        self.migration = OpenSearchMigration()
+        self.opensearch_client = self.migration.opensearch_client
+        self.keep_versions = keep_versions
+        self.count_tolerance = count_tolerance  # 허용 문서 수/샘플 쿼리 결과 수 오차 비율 (0.0 = 정확히 일치)
+
+    def get_mapping(self, alias: str) -> Dict[str, Any]:
+        """별칭별 인덱스 매핑"""
+        if alias == "products":
+            return self.migration.get_products_index_mapping()
+        if alias == "reviews":
+            return self.migration.get_reviews_index_mapping()
+        raise ValueError(f"지원하지 않는 대상: {alias}")
+
+    def list_versions(self, alias: str) -> List[str]:
+        """{alias}_v{N} 인덱스 목록 (버전 오름차순)"""
+        pattern = re.compile(rf"^{re.escape(alias)}_v(\d+)$")
+        indices = self.opensearch_client.client.indices.get(index=f"{alias}_v*", ignore=[404])
+        versions = [name for name in indices if pattern.match(name)]
+        return sorted(versions, key=lambda name: int(pattern.match(name).group(1)))
+
+    def get_alias_targets(self, alias: str) -> List[str]:
+        """별칭이 현재 가리키는 인덱스 목록"""
+        if not self.opensearch_client.client.indices.exists_alias(name=alias):
+            return []
+        return list(self.opensearch_client.client.indices.get_alias(name=alias).keys())
+
+    def next_index_name(self, alias: str) -> str:
+        """다음 버전 인덱스 이름"""
+        versions = self.list_versions(alias)
+        next_version = int(versions[-1].rsplit("_v", 1)[1]) + 1 if versions else 1
+        return f"{alias}_v{next_version}"
+
+    def create_versioned_index(self, alias: str, index_name: str) -> Dict[str, Any]:
+        """적재 최적화 설정으로 버전 인덱스 생성, 적재 후 복원할 설정 반환"""
+        mapping = copy.deepcopy(self.get_mapping(alias))
+        index_settings = mapping.setdefault("settings", {})
+
+        final_settings = {
+            "refresh_interval": index_settings.get("refresh_interval", "1s"),
+            "number_of_replicas": index_settings.get("number_of_replicas", 1),
+            "translog.durability": "request",
+        }
+        index_settings.update(LOAD_OPTIMIZED_SETTINGS)
+
+        if not self.opensearch_client.create_index(index_name, mapping):
+            raise RuntimeError(f"인덱스 생성 실패: {index_name}")
+        return final_settings
+
+    def load_documents(self, alias: str, index_name: str, batch_size: int, bulk_workers: int) -> int:
+        """MySQL 데이터를 새 버전 인덱스에 스트리밍 적재하고 MySQL 기준 문서 수 반환"""
+        connection = self.migration.connect_mysql()
+        try:
+            total = self.migration.get_total_count(connection, alias)
+            documents = (
+                self.migration.iter_products(connection, batch_size) if alias == "products"
+                else self.migration.iter_reviews(connection, batch_size)
+            )
+            self.migration.stream_documents(
+                index_name, documents, total, index_name,
+                batch_size=batch_size, bulk_workers=bulk_workers,
+            )
+            return total
+        finally:
+            connection.close()
+
+    def finalize_index(self, index_name: str, final_settings: Dict[str, Any]):
+        """검색용 설정 복원 후 refresh 및 세그먼트 병합"""
+        self.opensearch_client.client.indices.put_settings(index=index_name, body={"index": final_settings})
+        self.opensearch_client.client.indices.refresh(index=index_name)
+        self.opensearch_client.client.indices.forcemerge(index=index_name, max_num_segments=5, request_timeout=600)
+        if final_settings["number_of_replicas"]:
+            self.opensearch_client.client.cluster.health(
+                index=index_name, wait_for_status="green", timeout="10m", request_timeout=660
+            )
+
+    def validate(self, alias: str, index_name: str, expected_count: int) -> bool:
+        """문서 수와 샘플 쿼리로 새 인덱스 검증"""
+        count = self.opensearch_client.client.count(index=index_name).get("count", 0)
+        allowed_missing = int(expected_count * self.count_tolerance)
+        if count < expected_count - allowed_missing:
+            logger.error(f"문서 수 검증 실패: {index_name} {count:,}개 / 기대 {expected_count:,}개")
+            return False
+        logger.info(f"문서 수 검증 통과: {index_name} {count:,}개 / 기대 {expected_count:,}개")
+
+        # 별칭 도입 전의 실제 인덱스(products/reviews)도 현재 결과와 비교
+        current = self.get_alias_targets(alias) or self.opensearch_client.client.indices.exists(index=alias)
+        for query in SAMPLE_QUERIES[alias]:
+            new_total = self._count_hits(index_name, query)
+            if new_total == 0:
+                logger.error(f"샘플 쿼리 결과 없음: {query}")
+                return False
+
+            if current:
+                old_total = self._count_hits(alias, query)
+                allowed_diff = int(old_total * self.count_tolerance)
+                if abs(new_total - old_total) > allowed_diff:
+                    logger.error(
+                        f"샘플 쿼리 검증 실패 {query['query']}: 현재 {old_total:,}건 → 신규 {new_total:,}건 "
+                        f"(허용 오차 {allowed_diff:,}건)"
+                    )
+                    return False
+                logger.info(f"샘플 쿼리 {query['query']}: 현재 {old_total:,}건 → 신규 {new_total:,}건")
+
+        return True
+
+    def _count_hits(self, index_name: str, query: Dict[str, Any]) -> int:
+        response = self.opensearch_client.client.count(index=index_name, body=query)
+        return response.get("count", 0)
+
+    def swap_alias(self, alias: str, index_name: str) -> bool:
+        """읽기 별칭을 새 인덱스로 원자적으로 전환"""
+        actions = [{"remove": {"index": old, "alias": alias}} for old in self.get_alias_targets(alias)]
+
+        # 별칭 도입 전의 실제 인덱스(products/reviews)는 같은 요청 안에서 제거해야 별칭을 만들 수 있음
+        if not actions and self.opensearch_client.client.indices.exists(index=alias):
+            logger.warning(f"별칭이 아닌 기존 인덱스 '{alias}'를 전환과 함께 삭제합니다 (이 버전은 롤백 불가)")
+            actions.append({"remove_index": {"index": alias}})
+
+        actions.append({"add": {"index": index_name, "alias": alias}})
+        response = self.opensearch_client.client.indices.update_aliases(body={"actions": actions})
+
+        if response.get("acknowledged"):
+            logger.info(f"별칭 전환 완료: {alias} → {index_name}")
+            return True
+        logger.error(f"별칭 전환 실패: {alias} → {index_name}")
+        return False
+
+    def cleanup_old_versions(self, alias: str):
+        """별칭이 가리키지 않는 이전 버전 중 keep_versions개만 남기고 삭제"""
+        current = set(self.get_alias_targets(alias))
+        old_versions = [name for name in self.list_versions(alias) if name not in current]
+        expired = old_versions[:-self.keep_versions] if self.keep_versions > 0 else old_versions
+
+        for index_name in expired:
+            self.opensearch_client.delete_index(index_name)
+            logger.info(f"이전 버전 삭제: {index_name}")
+
+    def reindex(self, alias: str, batch_size: int = 1000, bulk_workers: int = 4) -> bool:
+        """새 버전 생성 → 적재 → 검증 → 별칭 전환 → 이전 버전 정리"""
+        index_name = self.next_index_name(alias)
+        logger.info(f"🚀 Blue/Green 재인덱싱 시작: {alias} → {index_name}")
+
+        try:
+            final_settings = self.create_versioned_index(alias, index_name)
+            expected_count = self.load_documents(alias, index_name, batch_size, bulk_workers)
+            self.finalize_index(index_name, final_settings)
+
+            if not self.validate(alias, index_name, expected_count):
+                logger.error(f"❌ 검증 실패: {index_name}은 별칭 전환 없이 남겨 둡니다")
+                return False
+
+            if not self.swap_alias(alias, index_name):
+                return False
+
+            self.cleanup_old_versions(alias)
+            logger.info(f"🎉 재인덱싱 완료: {alias} → {index_name}")
+            return True
+
+        except Exception as e:
+            logger.error(f"재인덱싱 실패 ({index_name}): {e}")
+            return False
+
+    def rollback(self, alias: str) -> bool:
+        """별칭을 직전 버전으로 되돌림"""
+        current = self.get_alias_targets(alias)
+        versions = self.list_versions(alias)
+        current_positions = [versions.index(name) for name in current if name in versions]
+        if not current_positions or max(current_positions) == 0:
+            logger.error(f"롤백할 이전 버전이 없습니다: {alias}")
+            return False
+
+        previous = versions[max(current_positions) - 1]
+        return self.swap_alias(alias, previous)
+
+    def show_versions(self, alias: str) -> bool:
+        """버전 인덱스와 별칭 상태 출력"""
+        current = set(self.get_alias_targets(alias))
+        logger.info(f"{alias} 버전 목록:")
+        for name in self.list_versions(alias):
+            count = self.opensearch_client.client.count(index=name).get("count", 0)
+            marker = " ← 현재" if name in current else ""
+            logger.info(f"  - {name} ({count:,}개){marker}")
+        return True
+
+
+def main():
+    """메인 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="무중단 Blue/Green 재인덱싱")
+    parser.add_argument("--target", choices=["products", "reviews", "all"], default="all", help="재인덱싱 대상")
+    parser.add_argument("--rollback", action="store_true", help="별칭을 직전 버전으로 되돌림")
+    parser.add_argument("--list", action="store_true", help="버전 인덱스 목록 조회")
+    parser.add_argument("--keep", type=int, default=2, help="보관할 이전 버전 수 (기본값: 2)")
+    parser.add_argument("--count-tolerance", type=float, default=0.0, help="허용 문서 수/샘플 쿼리 결과 수 오차 비율 (기본값: 0)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="배치 크기 (기본값: 1000)")
+    parser.add_argument("--bulk-workers", type=int, default=4, help="병렬 bulk 전송 워커 수 (기본값: 4)")
+
+    args = parser.parse_args()
+
+    reindexer = BlueGreenReindexer(keep_versions=args.keep, count_tolerance=args.count_tolerance)
+    if not reindexer.opensearch_client.is_connected():
+        logger.error("OpenSearch 연결 실패")
+        return 1
+
+    targets = ["products", "reviews"] if args.target == "all" else [args.target]
+
+    success = True
+    for alias in targets:
+        if args.list:
+            result = reindexer.show_versions(alias)
+        elif args.rollback:
+            result = reindexer.rollback(alias)
+        else:
+            result = reindexer.reindex(alias, batch_size=args.batch_size, bulk_workers=args.bulk_workers)
+        success = success and result
+
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -213,7 +213,8 @@ class OpenSearchSetup:
         """모든 commerce 관련 인덱스 초기화"""
         logger.info("🔄 인덱스 초기화 시작")
         
-        indices_to_delete = ["products", "reviews", "commerce-*"]
+        # 별칭(products/reviews)을 통한 삭제는 거부되므로 버전 인덱스를 직접 삭제
+        indices_to_delete = ["products_v*", "reviews_v*", "products", "reviews", "commerce-*"]
         
         for index_pattern in indices_to_delete:
             self.delete_indices(index_pattern)
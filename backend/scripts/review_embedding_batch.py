@@ -24,7 +24,6 @@ import mysql.connector
 from loguru import logger
 from google.cloud import aiplatform
 from google.oauth2 import service_account
-from opensearchpy import OpenSearch, RequestsHttpConnection
 
 
 class ReviewEmbeddingBatch:
@@ -41,17 +40,6 @@ class ReviewEmbeddingBatch:
             'charset': 'utf8mb4'
         }
         
-        # OpenSearch 설정
-        self.opensearch_config = {
-            'hosts': [{'host': os.getenv('OPENSEARCH_HOST', 'localhost'), 'port': int(os.getenv('OPENSEARCH_PORT', 9200))}],
-            'http_auth': (os.getenv('OPENSEARCH_USERNAME', 'admin'), os.getenv('OPENSEARCH_PASSWORD', 'admin')),
-            'use_ssl': os.getenv('OPENSEARCH_USE_SSL', 'false').lower() == 'true',
-            'verify_certs': os.getenv('OPENSEARCH_VERIFY_CERTS', 'false').lower() == 'true',
-            'ssl_assert_hostname': False,
-            'ssl_show_warn': False,
-            'connection_class': RequestsHttpConnection
-        }
-        
         # Vertex AI 설정
         self.project_id = os.getenv("GOOGLE_CLOUD_PROJECT_ID")
         self.location = os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1")
@@ -62,6 +50,8 @@ class ReviewEmbeddingBatch:
         self.embedding_batch_size = 5  # Vertex AI API 배치 사이즈
         self.max_retries = 3
         self.retry_delay = 2.0
+        self.bulk_chunk_size = 200  # OpenSearch bulk 청크 크기 (768차원 벡터 ≈ 15KB/문서)
+        self.bulk_workers = 2  # 병렬 bulk 전송 워커 수
         
         # 진행상황 저장
         self.checkpoint_file = "review_embedding_checkpoint.json"
@@ -89,8 +79,12 @@ class ReviewEmbeddingBatch:
             self.mysql_conn = mysql.connector.connect(**self.mysql_config)
             logger.info("MySQL 연결 성공")
             
-            # OpenSearch 연결
-            self.opensearch_client = OpenSearch(**self.opensearch_config)
+            # OpenSearch 연결 (스트리밍 bulk 인덱서를 쓰기 위해 앱 클라이언트 사용,
+            # 환경 변수 로드 이후 설정을 읽도록 여기서 import)
+            from app.core.opensearch_client import get_opensearch_client
+            self.opensearch_client = get_opensearch_client()
+            if not self.opensearch_client.is_connected():
+                raise Exception("OpenSearch 연결 실패")
             logger.info("OpenSearch 연결 성공")
             
             # Vertex AI 초기화
@@ -251,61 +245,57 @@ class ReviewEmbeddingBatch:
         
         return cleaned
     
+    def resolve_review_doc_ids(self, review_ids: List[int]) -> Dict[int, str]:
+        """review_id → OpenSearch 문서 _id 매핑을 한 번의 terms 검색으로 조회"""
+        if not review_ids:
+            return {}
+        
+        response = self.opensearch_client.client.search(
+            index="reviews",
+            body={
+                "query": {"terms": {"review_id": review_ids}},
+                "_source": ["review_id"],
+                "size": len(review_ids)
+            }
+        )
+        
+        return {
+            hit['_source']['review_id']: hit['_id']
+            for hit in response['hits']['hits']
+        }
+    
     def update_opensearch_reviews(self, reviews_with_embeddings: List[Dict[str, Any]]) -> int:
-        """OpenSearch에 임베딩 정보 업데이트"""
+        """OpenSearch에 임베딩 정보 업데이트 (스트리밍 bulk update)"""
         try:
-            successful_updates = 0
-            
-            for review_data in reviews_with_embeddings:
-                try:
-                    review_id = review_data['review_id']
-                    embedding = review_data.get('embedding', [])
-                    
-                    if not embedding:
+            reviews_with_embeddings = [r for r in reviews_with_embeddings if r.get('embedding')]
+            doc_ids = self.resolve_review_doc_ids([r['review_id'] for r in reviews_with_embeddings])
+            updated_at = datetime.now().isoformat()
+            
+            def iter_updates():
+                for review_data in reviews_with_embeddings:
+                    doc_id = doc_ids.get(review_data['review_id'])
+                    if not doc_id:
+                        logger.warning(f"review_id {review_data['review_id']}에 해당하는 문서를 찾을 수 없습니다.")
                         continue
-                    
-                    # OpenSearch 문서 업데이트 (review_id로 검색)
-                    doc_body = {
-                        "doc": {
-                            "review_embedding": embedding,
-                            "embedding_model": self.model_name,
-                            "embedding_updated_at": datetime.now().isoformat()
-                        }
+                    yield {
+                        "_id": doc_id,
+                        "review_embedding": review_data['embedding'],
+                        "embedding_model": self.model_name,
+                        "embedding_updated_at": updated_at
                     }
-                    
-                    # review_id로 문서 검색 후 업데이트
-                    search_query = {
-                        "query": {
-                            "term": {
-                                "review_id": review_id
-                            }
-                        }
-                    }
-                    
-                    search_response = self.opensearch_client.search(
-                        index="reviews",
-                        body=search_query,
-                        size=1
-                    )
-                    
-                    if search_response['hits']['total']['value'] > 0:
-                        doc_id = search_response['hits']['hits'][0]['_id']
-                        response = self.opensearch_client.update(
-                            index="reviews",
-                            id=doc_id,
-                            body=doc_body,
-                            retry_on_conflict=3
-                        )
-                    else:
-                        logger.warning(f"review_id {review_id}에 해당하는 문서를 찾을 수 없습니다.")
-                        continue
-                    
-                    if response.get('result') in ['updated', 'noop']:
-                        successful_updates += 1
-                    
-                except Exception as e:
-                    logger.warning(f"리뷰 {review_data.get('review_id')} 업데이트 실패: {e}")
-                    continue
+            
+            successful_updates = 0
+            for result in self.opensearch_client.streaming_bulk(
+                "reviews",
+                iter_updates(),
+                op_type="update",
+                chunk_size=self.bulk_chunk_size,
+                thread_count=self.bulk_workers,
+            ):
+                if result["ok"]:
+                    successful_updates += 1
+                else:
+                    logger.warning(f"리뷰 문서 {result['_id']} 업데이트 실패: {result['error']}")
             
             return successful_updates
             
@@ -502,6 +492,7 @@ async def main():
     parser.add_argument("--max-reviews", type=int, help="최대 처리할 리뷰 수")
     parser.add_argument("--batch-size", type=int, default=50, help="MySQL 배치 사이즈")
     parser.add_argument("--embedding-batch-size", type=int, default=5, help="Vertex AI 배치 사이즈")
+    parser.add_argument("--bulk-workers", type=int, default=2, help="OpenSearch 병렬 bulk 전송 워커 수")
     
     args = parser.parse_args()
     
@@ -513,6 +504,8 @@ async def main():
         batch_processor.batch_size = args.batch_size
     if args.embedding_batch_size:
         batch_processor.embedding_batch_size = args.embedding_batch_size
+    if args.bulk_workers:
+        batch_processor.bulk_workers = args.bulk_workers
     
     # 실행
     await batch_processor.run(resume=args.resume, max_reviews=args.max_reviews)